@@ -0,0 +1,90 @@
+"""
+Benchmark Balls
+===============
+Frame cost of the batched ball physics from 1 to 1,000 balls,
+next to moving the same balls one at a time with BallBody.move.
+Run with `python -m benchmarks.bench_balls`
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import random
+import time
+
+from breakout import Position, Speed, screen_size
+from breakout.core import BallBody, BallConfig, Group, Simulation
+
+FRAMES = 200
+
+
+def spawn_balls(count: int, state: Simulation, store: bool):
+    """Scatter balls between the bricks and the paddle, moving in random directions"""
+    state.ball.kill()
+    for _ in range(count):
+        kwargs = {
+            "position": Position(
+                random.uniform(20, screen_size.width - 40), random.uniform(250, 420)
+            ),
+            "speed": Speed(random.uniform(-4, 4), random.choice([-4, 4])),
+        }
+        if store:
+            state.create_ball(**kwargs)
+        else:
+            BallBody(state.ball_group, **kwargs)
+
+
+def batched_frame_time(count: int) -> float:
+    """Microseconds per frame for integrate, wall bounces and paddle reflection"""
+    state = Simulation()
+    spawn_balls(count, state, store=True)
+    paddle = state.paddle
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        state.ball_store.integrate()
+        state.ball_store.bounce_walls(screen_size.width)
+        state.ball_store.reflect_paddle(
+            paddle, state.config.ball_speed, BallConfig.max_speed
+        )
+    return (time.perf_counter() - start) / FRAMES * 1e6
+
+
+def per_ball_frame_time(count: int) -> float:
+    """Microseconds per frame for the same work done one ball at a time"""
+    state = Simulation()
+    state.ball_group = Group()
+    spawn_balls(count, state, store=False)
+    paddle = state.paddle
+    balls = state.ball_group.sprites()
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for ball in balls:
+            ball.update_position()
+            ball.handle_wall_collisions()
+            ball.handle_paddle_collision(paddle)
+    return (time.perf_counter() - start) / FRAMES * 1e6
+
+
+def main():
+    """Print a table of frame cost by ball count"""
+    random.seed(0)
+    print(f"{'balls':>6} {'batched us/frame':>18} {'per-ball us/frame':>18}")
+    for count in (1, 10, 100, 1000):
+        print(
+            f"{count:>6} {batched_frame_time(count):>18.1f}"
+            f" {per_ball_frame_time(count):>18.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
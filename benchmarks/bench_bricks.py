@@ -0,0 +1,122 @@
+"""
+Benchmark Bricks
+================
+Per-ball brick collision cost and brick memory from the 6x8 game layout up to
+100x100 layouts, with the BrickField next to a group of Brick sprites.
+Run with `python -m benchmarks.bench_bricks`
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import os
+import random
+import time
+import tracemalloc
+from dataclasses import astuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+import pygame
+
+from breakout import Position
+from breakout.bricks import Brick, BrickLayer
+from breakout.core import BallBody, BrickConfig
+
+QUERIES = 2000
+GRIDS = ((6, 8), (10, 10), (25, 25), (50, 50), (100, 100))
+PITCH_X = BrickConfig.size.width + BrickConfig.gap
+PITCH_Y = BrickConfig.size.height + BrickConfig.gap
+
+
+def build_sprites(rows: int, cols: int) -> tuple[pygame.sprite.Group, int]:
+    """A full layout of Brick sprites and the bytes it takes, images included"""
+    tracemalloc.start()
+    bricks = pygame.sprite.Group()
+    for row in range(rows):
+        for col in range(cols):
+            position = Position(col * PITCH_X, row * PITCH_Y)
+            Brick(bricks, color="green", position=position)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    images = {id(brick.image): brick.image for brick in bricks}.values()  # shared
+    pixels = sum(image.get_pitch() * image.get_height() for image in images)
+    return bricks, size + pixels
+
+
+def build_field(rows: int, cols: int) -> tuple[BrickLayer, int]:
+    """A full brick field and the bytes it takes, its shared images included"""
+    tracemalloc.start()
+    field = BrickLayer(
+        rows,
+        cols,
+        left=0,
+        top=0,
+        size=astuple(BrickConfig.size),
+        gap=BrickConfig.gap,
+    )
+    for row in range(rows):
+        for col in range(cols):
+            field.place(row, col, "green", 1)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    image = field.brick_image("green", False)
+    return field, size + image.get_pitch() * image.get_height()
+
+
+def ball_rects(rows: int, cols: int) -> list:
+    """Ball rects scattered over the layout"""
+    rects = []
+    for _ in range(QUERIES):
+        position = Position(
+            random.uniform(0, cols * PITCH_X), random.uniform(0, rows * PITCH_Y)
+        )
+        rects.append(BallBody(position=position).rect)
+    return rects
+
+
+def per_query_time(find, rects: list) -> float:
+    """Microseconds to find the bricks under one ball"""
+    start = time.perf_counter()
+    for rect in rects:
+        find(rect)
+    return (time.perf_counter() - start) / len(rects) * 1e6
+
+
+def main():
+    """Print a table of per-ball collision cost and memory by layout size"""
+    random.seed(0)
+    print(
+        f"{'grid':>8} {'bricks':>7} {'field us/ball':>14} {'scan us/ball':>13}"
+        f" {'sprite KB':>10} {'field KB':>9}"
+    )
+    for rows, cols in GRIDS:
+        sprites, sprite_bytes = build_sprites(rows, cols)
+        field, field_bytes = build_field(rows, cols)
+        rects = ball_rects(rows, cols)
+        brick_list = sprites.sprites()
+
+        def scan(rect, brick_list=brick_list):
+            return [brick for brick in brick_list if rect.colliderect(brick.rect)]
+
+        print(
+            f"{rows:>3}x{cols:<4} {len(field):>7}"
+            f" {per_query_time(field.query, rects):>14.2f}"
+            f" {per_query_time(scan, rects[: QUERIES // 10]):>13.2f}"
+            f" {sprite_bytes / 1024:>10.0f} {field_bytes / 1024:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark Core
+==============
+Time the headless simulation against the 50 FPS budget of Game.run.
+Run with `python -m benchmarks.bench_core`
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import sys
+import time
+
+from breakout.core import Simulation, tracking_policy
+
+GAME_FPS = 50  # frame rate of Game.run
+REQUIRED_SPEEDUP = 100
+
+
+def steps_per_second(games: int = 5, max_frames: int = 50_000) -> float:
+    """Play whole games with the scripted player, return simulated frames per second"""
+    frames = 0
+    elapsed = 0.0
+    for seed in range(games):
+        state = Simulation(seed)
+        start = time.perf_counter()
+        while not state.game_is_over and state.frames < max_frames:
+            state.step(tracking_policy(state))
+        elapsed += time.perf_counter() - start
+        frames += state.frames
+    return frames / elapsed
+
+
+def main():
+    """Print the result and fail if the core is not fast enough"""
+    rate = steps_per_second()
+    speedup = rate / GAME_FPS
+    print(f"core: {rate:,.0f} frames/s, {speedup:,.0f}x the {GAME_FPS} FPS game loop")
+    print(f"'pygame' imported: {'pygame' in sys.modules}")
+    if speedup < REQUIRED_SPEEDUP:
+        sys.exit(f"expected at least {REQUIRED_SPEEDUP}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark Display
+=================
+Frame cost of the game screen at several window sizes. Screens draw at the
+logical resolution, so only presenting the frame grows with the window.
+The old way, scaling the background to the window every frame, is shown too.
+Run with `python -m benchmarks.bench_display`
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import os
+import time
+from dataclasses import astuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+import pygame
+
+from breakout import screen_size
+from breakout.__main__ import Game
+from breakout.screens import Screens
+
+FRAMES = 100
+WINDOWS = ((500, 600), (1000, 1200), (1500, 1800), (800, 800), (1920, 1080))
+
+
+def frame_times(game: Game) -> tuple[float, float]:
+    """Milliseconds per frame to draw the game screen and to present it"""
+    draw = present = 0.0
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        Screens.GAME.draw(game.display.surface)
+        middle = time.perf_counter()
+        game.display.present()
+        present += time.perf_counter() - middle
+        draw += middle - start
+    return draw / FRAMES * 1000, present / FRAMES * 1000
+
+
+def scale_background_time(size: tuple) -> float:
+    """Milliseconds to scale the game background to a window, as every frame used to"""
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        pygame.transform.scale(Screens.GAME.background_image, size)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    """Print a table of frame cost by window size"""
+    game = Game(seed=1)
+    game.switch_screen(Screens.GAME)
+    print(
+        f"{'window':>10} {'path':>8} {'draw ms':>8} {'present ms':>11}"
+        f" {'old bg scale ms':>16}"
+    )
+    for size in WINDOWS:
+        game.display.resize(size)
+        if game.display.viewport.size == astuple(screen_size):
+            path = "copy"
+        elif game.display.integer_scale:
+            path = "integer"
+        else:
+            path = "smooth"
+        draw, present = frame_times(game)
+        print(
+            f"{size[0]:>4}x{size[1]:<5} {path:>8} {draw:>8.3f} {present:>11.3f}"
+            f" {scale_background_time(size):>16.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
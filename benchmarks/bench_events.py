@@ -0,0 +1,108 @@
+"""
+Benchmark Events
+================
+A burst of 10,000 events, mostly mouse motion, through the game screen.
+Broadcasting every event to every element and catching AttributeError from
+those without handle_event is timed against the dispatch table, with every
+event type let into the queue and with the game's set_allowed filter.
+Run with `python -m benchmarks.bench_events`
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+import pygame
+
+from breakout.__main__ import Game
+from breakout.screens import ScreenManager, Screens
+
+EVENTS = 10_000
+RUNS = 5
+AWAY = (250, 300)  # clicks land between the bricks and the buttons
+
+
+def burst() -> list[pygame.event.Event]:
+    """Mouse motion with a key press or click every so often, as a mouse flood"""
+    events = []
+    for i in range(EVENTS):
+        if i % 100 == 0:
+            events.append(pygame.event.Event(pygame.KEYUP, key=pygame.K_LEFT))
+        elif i % 50 == 0:
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=AWAY, button=1))
+        else:
+            events.append(pygame.event.Event(pygame.MOUSEMOTION, pos=AWAY, rel=(1, 0)))
+    return events
+
+
+def broadcast(screen: ScreenManager, event: pygame.event.Event):
+    """Send the event to every element, as before the dispatch table"""
+    for element in screen.elements:
+        try:
+            element.handle_event(event)
+        except AttributeError:
+            pass
+
+
+def run(handle, events: list) -> tuple[float, int]:
+    """Best milliseconds to queue, fetch and handle the burst, and events handled"""
+    best = float("inf")
+    for _ in range(RUNS):
+        pygame.event.clear()
+        start = time.perf_counter()
+        for event in events:
+            pygame.event.post(event)
+        handled = 0
+        for event in pygame.event.get():
+            handle(event)
+            handled += 1
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, handled
+
+
+def main():
+    """Print the time to handle a burst of events, old broadcast against new"""
+    game = Game(seed=1)
+    game.switch_screen(Screens.GAME)
+    screen = Screens.GAME
+    events = burst()
+    print(f"{len(screen.elements)} elements on the game screen, {EVENTS:,} events\n")
+    print(f"{'dispatch':>10} {'queue':>8} {'handled':>8} {'ms':>8}")
+
+    allowed = [
+        event_type
+        for event_type in range(pygame.NUMEVENTS)
+        if not pygame.event.get_blocked(event_type)
+    ]
+    pygame.event.set_allowed(None)  # everything in, as before
+    for name, handle in (
+        ("broadcast", lambda event: broadcast(screen, event)),
+        ("table", screen.handle_event),
+    ):
+        elapsed, handled = run(handle, events)
+        print(f"{name:>10} {'all':>8} {handled:>8,} {elapsed:>8.2f}")
+
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(allowed)
+    elapsed, handled = run(screen.handle_event, events)
+    print(f"{'table':>10} {'filtered':>8} {handled:>8,} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark Frame
+===============
+Where a frame's time goes in the real game loop. A scripted paddle plays
+through Game.run_frame with one simulation step per frame and no frame cap,
+and the frame timer's percentiles are printed for each phase, next to the
+loop's speed with timing off and on. After a warm-up game the off and on
+games take turns going first, and the median of each is reported, so the
+first game's cold caches and surface setup count against neither.
+Run with `python -m benchmarks.bench_frame`
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import os
+import statistics
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+from breakout.__main__ import Game
+from breakout.core import tracking_policy
+from breakout.profiler import frame_timer
+from breakout.screens import Screens
+from breakout.timestep import FRAME_TIME
+
+FRAMES = 2000
+REPEATS = 5  # games played each way
+
+
+def play(timed: bool) -> float:
+    """Play FRAMES frames of a game, return milliseconds per frame"""
+    game = Game(seed=7)
+    game.max_fps = 0  # no waiting, so the loop's own cost shows
+    game.read_inputs = lambda: tracking_policy(game.state)
+    game.switch_screen(Screens.GAME)
+    game.launch()
+    frame_timer.enabled = timed
+    frame_timer.reset()
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        game.run_frame(FRAME_TIME)
+    elapsed = time.perf_counter() - start
+    frame_timer.enabled = False
+    return elapsed / FRAMES * 1000
+
+
+def main():
+    """Print each phase's percentiles and the cost of timing them"""
+    play(timed=False)  # warm-up, fills caches and builds the surfaces
+    runs = {False: [], True: []}
+    for repeat in range(REPEATS):
+        for timed in (False, True) if repeat % 2 == 0 else (True, False):
+            runs[timed].append(play(timed))
+    untimed = statistics.median(runs[False])
+    timed = statistics.median(runs[True])
+
+    print(f"{'phase':>8} {'p50':>7} {'p95':>7} {'p99':>7} {'max':>7}  ms/frame")
+    for name, stats in frame_timer.report().items():
+        print(
+            f"{name:>8} {stats.p50:7.3f} {stats.p95:7.3f}"
+            f" {stats.p99:7.3f} {stats.max:7.3f}"
+        )
+    print(f"\nloop with timing off: {untimed:.3f} ms/frame, median of {REPEATS}")
+    print(f"loop with timing on:  {timed:.3f} ms/frame, median of {REPEATS}")
+    print(f"timing overhead:      {timed - untimed:+.3f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark Pool
+==============
+Multiball churn and level changes with and without the entity pools.
+A headless game keeps 30 balls in play, kills and respawns a few every
+frame with a powerup falling, and clears a level every 100 frames. The
+time per frame, the garbage collections it caused and the most memory
+allocated at once are printed for pooling off and on.
+Run with `python -m benchmarks.bench_pool`
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import gc
+import time
+import tracemalloc
+
+from breakout import Position
+from breakout.core import Simulation, tracking_policy
+
+FRAMES = 3000
+BALLS = 30
+CHURN = 3  # balls killed and respawned each frame
+LEVEL_FRAMES = 100
+
+
+def play(capacity: int) -> tuple[float, int, int, Simulation]:
+    """Milliseconds per frame, garbage collections and peak bytes of a churning game"""
+    Simulation.pool_capacity = capacity
+    state = Simulation(seed=3)
+    state.lives = 10**6
+    state.level_wait_time = 0
+    for _ in range(BALLS - 1):
+        state.create_ball(position=Position(250, 300))
+
+    gc.collect()
+    collections = sum(stats["collections"] for stats in gc.get_stats())
+    tracemalloc.start()
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        for ball in state.ball_group.sprites()[:CHURN]:
+            ball.kill()
+            state.create_ball(position=Position(250, 300))
+        for powerup in state.powerup_group.sprites():
+            powerup.kill()
+        state.add_powerup()
+        if frame % LEVEL_FRAMES == 0:
+            state.bricks.empty()
+        state.step(tracking_policy(state))
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    collections = sum(stats["collections"] for stats in gc.get_stats()) - collections
+    return elapsed / FRAMES * 1000, collections, peak, state
+
+
+def main():
+    """Print the cost of churning balls and levels with pooling off and on"""
+    capacity = Simulation.pool_capacity
+    print(f"{BALLS} balls, {CHURN} respawned and a powerup a frame, {FRAMES:,} frames")
+    print(f"{'pooling':>8} {'ms/frame':>9} {'gc runs':>8} {'peak KiB':>9}")
+    for name, size in (("off", 0), ("on", capacity)):
+        milliseconds, collections, peak, state = play(size)
+        print(f"{name:>8} {milliseconds:>9.3f} {collections:>8} {peak / 1024:>9.1f}")
+    Simulation.pool_capacity = capacity
+
+    print()
+    for kind, stats in state.pool_stats().items():
+        print(
+            f"{kind:>14}: {stats.in_use} in use, {stats.free} free, "
+            f"{stats.created} built, {stats.reused:,} reused ({stats.reuse_rate:.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
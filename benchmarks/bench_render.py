@@ -0,0 +1,63 @@
+"""
+Benchmark Render
+================
+Pixels repainted and shown per frame on the game screen with dirty rects,
+next to redrawing the whole screen every frame.
+Run with `python -m benchmarks.bench_render`
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+from breakout.__main__ import Game
+from breakout.core import tracking_policy
+from breakout.screens import ScreenManager, Screens
+
+FRAMES = 1000
+
+
+def play(full: bool) -> tuple[float, float]:
+    """Play a game, return pixels shown and milliseconds to draw and show per frame"""
+    game = Game(seed=7)
+    game.switch_screen(Screens.GAME)
+    game.launch()
+    pixels = 0
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        game.state.step(tracking_policy(game.state))
+        if full:
+            ScreenManager.last_drawn = None  # forget the last frame, repaint everything
+        changed = Screens.GAME.draw(game.display.surface)
+        game.display.present(changed)
+        pixels += sum(rect.width * rect.height for rect in changed)
+    elapsed = time.perf_counter() - start
+    return pixels / FRAMES, elapsed / FRAMES * 1000
+
+
+def main():
+    """Print pixels and time per frame for dirty rects and full redraws"""
+    print(f"{'mode':>12} {'pixels/frame':>13} {'ms/frame':>9}")
+    for name, full in (("full redraw", True), ("dirty rects", False)):
+        pixels, ms = play(full)
+        print(f"{name:>12} {pixels:>13,.0f} {ms:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark Sound
+===============
+Startup time and memory with the background music streamed against decoding
+every track into memory as the game used to. Each run is a fresh interpreter
+that starts the game and draws its first frame, then reports the time taken
+and its peak resident memory (Unix only).
+Run with `python -m benchmarks.bench_sound`
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import os
+import subprocess
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+RUNS = 3
+
+FIRST_FRAME = """
+import time
+start = time.perf_counter()
+import pygame
+from breakout.sound import SoundManager
+if {decode}:
+    # the old way, the mixer started and every track decoded to PCM at import
+    SoundManager.init_mixer()
+    music = [
+        pygame.mixer.Sound(str(SoundManager.sound_path.joinpath(track)))
+        for track in SoundManager.music_files
+        if SoundManager.sound_path.joinpath(track).exists()
+    ]
+from breakout.__main__ import Game
+from breakout.screens import Screens
+game = Game(seed=1)
+Screens.START.draw(game.display.surface)
+game.display.present()
+elapsed = time.perf_counter() - start
+try:
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+except ImportError:
+    peak = float("nan")
+print(elapsed, peak)
+pygame.mixer.quit()
+"""
+
+
+def first_frame(decode: bool) -> tuple[float, float]:
+    """Best milliseconds to the first frame and the peak memory in MB"""
+    runs = []
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", FIRST_FRAME.format(decode=decode)],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"},
+        ).stdout
+        elapsed, peak = output.split()[-2:]
+        runs.append((float(elapsed) * 1000, float(peak)))
+    return min(runs)
+
+
+def main():
+    """Print startup time and memory for decoded and streamed music"""
+    print(f"{'music':>9} {'first frame ms':>15} {'peak MB':>8}")
+    for name, decode in (("decoded", True), ("streamed", False)):
+        elapsed, peak = first_frame(decode)
+        print(f"{name:>9} {elapsed:>15.1f} {peak:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark Sprites
+=================
+Construction time and image memory for a 6x8 layout of Brick sprites and a
+50 ball multiball, with sprites sharing their images against every sprite
+drawing its own as they used to.
+Run with `python -m benchmarks.bench_sprites`
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+import pygame
+
+from breakout import color_choices
+from breakout.assets import assets
+from breakout.ball import Ball
+from breakout.bricks import Brick
+from breakout.core import BrickConfig
+
+ROWS, COLS = 6, 8
+BALLS = 50
+RUNS = 20
+
+
+def build_layout() -> list:
+    """A 6x8 layout of bricks, a row per color with a textured brick in each"""
+    pitch_x = BrickConfig.size.width + BrickConfig.gap
+    pitch_y = BrickConfig.size.height + BrickConfig.gap
+    return [
+        Brick(
+            color=color_choices[row],
+            position=(col * pitch_x, row * pitch_y),
+            texture=col == row,
+        )
+        for row in range(ROWS)
+        for col in range(COLS)
+    ]
+
+
+def build_multiball() -> list:
+    """50 balls, as many as a long run of multiball powerups makes"""
+    return [Ball() for _ in range(BALLS)]
+
+
+def measure(build) -> tuple[float, int, int]:
+    """Microseconds per sprite to build, the distinct images, and their bytes"""
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        sprites = build()
+    elapsed = (time.perf_counter() - start) / RUNS / len(sprites) * 1e6
+    images = {id(sprite.image): sprite.image for sprite in sprites}.values()
+    pixels = sum(image.get_pitch() * image.get_height() for image in images)
+    return elapsed, len(images), pixels
+
+
+def main():
+    """Print a table of construction time and image memory, shared and not"""
+    pygame.display.set_mode((1, 1))
+    print(
+        f"{'sprites':>10} {'images':>9} {'us/sprite':>10}"
+        f" {'distinct':>9} {'image KB':>9}"
+    )
+    for name, build in (("6x8 bricks", build_layout), ("50 balls", build_multiball)):
+        for images in ("own", "shared"):
+            if images == "own":
+                # every sprite draws its own image, as before sharing
+                assets.sprite = lambda kind, size, color, draw, variant=None: draw()
+            else:
+                del assets.sprite  # back to AssetCache.sprite
+            elapsed, distinct, pixels = measure(build)
+            print(
+                f"{name:>10} {images:>9} {elapsed:>10.2f}"
+                f" {distinct:>9} {pixels / 1024:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark Startup
+=================
+Cold import and time to the first frame, each in a fresh interpreter.
+Imports are timed with `python -X importtime`, so the cost of each module
+can be seen, and pygame.init() is timed next to starting only the parts of
+pygame the game uses.
+Run with `python -m benchmarks.bench_startup`
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import os
+import subprocess
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+RUNS = 5
+IMPORTS = ("breakout", "breakout.core", "breakout.__main__")
+SLOWEST = 8
+
+FIRST_FRAME = """
+import time
+start = time.perf_counter()
+from breakout.__main__ import Game
+from breakout.screens import Screens
+game = Game(seed=1)
+Screens.START.draw(game.display.surface)
+game.display.present()
+print(time.perf_counter() - start)
+"""
+
+INIT = """
+import time
+import pygame
+start = time.perf_counter()
+if {everything}:
+    pygame.init()
+else:
+    pygame.display.init()
+    pygame.time.wait(0)
+print(time.perf_counter() - start)
+"""
+
+
+def run(args: list) -> subprocess.CompletedProcess:
+    """Run a fresh interpreter with the given arguments"""
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"},
+    )
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """
+    Microseconds to import a module and everything it imports, best of RUNS.
+    Returns imported module -> (self, cumulative) as -X importtime reports them.
+    """
+    best = {}
+    for _ in range(RUNS):
+        stderr = run(["-X", "importtime", "-c", f"import {module}"]).stderr
+        for line in stderr.splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            own, cumulative, name = line[len("import time:") :].split("|")
+            name = name.strip()
+            times = (int(own), int(cumulative))
+            if name not in best or times[1] < best[name][1]:
+                best[name] = times
+    return best
+
+
+def fresh_time(code: str) -> float:
+    """Best milliseconds for a fresh interpreter to run the code"""
+    return min(float(run(["-c", code]).stdout.split()[-1]) for _ in range(RUNS)) * 1000
+
+
+def main():
+    """Print cold import times, the slowest modules and time to the first frame"""
+    for module in IMPORTS:
+        times = import_times(module)
+        pygame_ms = times["pygame"][1] / 1000 if "pygame" in times else 0.0
+        print(
+            f"import {module:<18} {times[module][1] / 1000:8.1f} ms"
+            f"  (pygame {pygame_ms:6.1f} ms)"
+        )
+
+    times = import_times("breakout.__main__")
+    print("\nslowest breakout modules by their own import time:")
+    own = sorted(
+        (name for name in times if name.startswith("breakout")),
+        key=lambda name: times[name][0],
+        reverse=True,
+    )
+    for name in own[:SLOWEST]:
+        print(f"  {name:<24} {times[name][0] / 1000:8.1f} ms")
+
+    everything = fresh_time(INIT.format(everything=True))
+    selective = fresh_time(INIT.format(everything=False))
+    print(f"\npygame.init():               {everything:8.2f} ms")
+    print(f"display and timer only:      {selective:8.2f} ms")
+    print(f"start up to the first frame: {fresh_time(FIRST_FRAME):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark Text
+==============
+Startup and HUD text cost. Import time and the first frame are timed in fresh
+interpreters, since fonts are only opened once per process. A system font
+lookup, which every class-level font used to do at import, is timed next to
+opening the bundled font. A changing score is drawn from the glyph atlas next
+to rendering it through the text cache, where every new score is a miss that
+takes a cache entry from the button and label text.
+Run with `python -m benchmarks.bench_text`
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import os
+import subprocess
+import sys
+import time
+import warnings
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+import pygame
+
+from breakout import text
+from breakout.score import HUD_LABELS
+from breakout.text import get_font, glyph_atlas
+
+RUNS = 5
+SCORES = 2000
+
+IMPORT = """
+import time
+start = time.perf_counter()
+import breakout.powerups, breakout.score, breakout.screens
+print(time.perf_counter() - start)
+"""
+
+FIRST_FRAME = """
+import time
+start = time.perf_counter()
+from breakout.__main__ import Game
+from breakout.screens import Screens
+game = Game(seed=1)
+game.switch_screen(Screens.GAME)
+Screens.GAME.draw(game.display.surface)
+game.display.present()
+print(time.perf_counter() - start)
+"""
+
+
+def fresh_time(code: str) -> float:
+    """Best milliseconds for a fresh interpreter to run the code"""
+    times = []
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"},
+        ).stdout
+        times.append(float(output.split()[-1]))
+    return min(times) * 1000
+
+
+def font_open_times() -> tuple[float, float]:
+    """Milliseconds to look up a system font and to open the bundled one"""
+    pygame.font.init()
+    warnings.simplefilter("ignore")  # SysFont warns where fc-list is missing
+    start = time.perf_counter()
+    pygame.font.SysFont("courier", 14, bold=True)
+    middle = time.perf_counter()
+    pygame.font.Font(None, 14)  # warm the loader so only the file open is timed
+    get_font(13, bold=True)
+    return (middle - start) * 1000, (time.perf_counter() - middle) * 1000
+
+
+def score_times() -> tuple[float, float, int]:
+    """
+    Microseconds per new score through the text cache and from the atlas,
+    and the cache entries the text cache way adds
+    """
+    surface = pygame.Surface((200, 20))
+    font = get_font(14, bold=True)
+    atlas = glyph_atlas(14, pygame.Color("black"), bold=True, words=HUD_LABELS)
+    entries = len(text.cache)
+    start = time.perf_counter()
+    for score in range(SCORES):
+        rendered = text.render_text(font, f"Current Score: {score}", (0, 0, 0))
+        surface.blit(rendered, (0, 0))
+    middle = time.perf_counter()
+    for score in range(SCORES):
+        atlas.draw(surface, f"Current Score: {score}", (0, 0))
+    end = time.perf_counter()
+    return (
+        (middle - start) / SCORES * 1e6,
+        (end - middle) / SCORES * 1e6,
+        len(text.cache) - entries,
+    )
+
+
+def main():
+    """Print the startup and HUD text timings"""
+    print(f"import screens, score, powerups: {fresh_time(IMPORT):8.1f} ms")
+    print(f"start up to the first frame:     {fresh_time(FIRST_FRAME):8.1f} ms")
+    system, bundled = font_open_times()
+    print(f"system font lookup:              {system:8.3f} ms")
+    print(f"bundled font open:               {bundled:8.3f} ms")
+    render, atlas, entries = score_times()
+    print(f"new score via the text cache:    {render:8.1f} us, {entries} cache entries")
+    print(f"new score from the glyph atlas:  {atlas:8.1f} us, 0 cache entries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark Vectors
+=================
+What moving the paddle, a powerup and the balls builds each frame. Moving
+with `position = position + speed` makes a new Position per object per
+step, moving with `+=` changes it in place. The vectors built per frame
+and the time per frame are printed for both, next to the bytes a slotted
+Position takes against the plain dataclass it replaced.
+Run with `python -m benchmarks.bench_vectors`
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import sys
+import time
+from dataclasses import dataclass
+
+from breakout import FixedPosition, FixedSize, FixedSpeed, Position, Size, Speed
+from breakout.core import PowerUpBody, Simulation, round_pixel
+
+FRAMES = 20_000
+BALLS = 10
+VECTORS = (Position, Speed, Size, FixedPosition, FixedSpeed, FixedSize)
+
+
+@dataclass
+class DictPosition:
+    """Position as it was, a dataclass keeping its fields in a __dict__"""
+
+    x: int
+    y: int
+
+
+def count_vectors() -> list:
+    """Count every vector built from now on, the count is the list's length"""
+    built = []
+
+    def counting_new(cls, *args, **kwargs):
+        built.append(cls)
+        return object.__new__(cls)
+
+    for vector in VECTORS:
+        vector.__new__ = counting_new
+    return built
+
+
+def rebind(body):
+    """Move a body the old way, building a new Position"""
+    body.position = body.position + body.speed
+    body.rect.x = round_pixel(body.position.x)
+    body.rect.y = round_pixel(body.position.y)
+
+
+def setup() -> tuple:
+    """A game with the paddle, a powerup and BALLS balls to move"""
+    state = Simulation(seed=1)
+    for _ in range(BALLS - 1):
+        state.create_ball(position=Position(250, 300), speed=Speed(0.5, -0.25))
+    powerup = PowerUpBody(state.powerup_group, rng=state.rng)
+    return state.paddle, powerup, state.ball_group.sprites()
+
+
+def play(bodies: tuple, in_place: bool, frames: int = FRAMES) -> float:
+    """Move every body for a number of frames, return milliseconds per frame"""
+    paddle, powerup, balls = bodies
+    start = time.perf_counter()
+    for _ in range(frames):
+        if in_place:
+            paddle.move_left()
+            paddle.move_right()
+            powerup.update_position()
+            for ball in balls:
+                ball.update_position()
+        else:
+            paddle.position = paddle.position - paddle.speed
+            paddle.position = paddle.position + paddle.speed
+            rebind(powerup)
+            for ball in balls:
+                rebind(ball)
+        powerup.position.y = 15  # back to the top, so nothing leaves the screen
+        for ball in balls:
+            ball.position.y = 300
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main():
+    """Print vectors built per frame, old rebinding against in place moves"""
+    games = {"rebinding": setup(), "in place": setup()}
+    timings = {name: play(bodies, name == "in place") for name, bodies in games.items()}
+    built = count_vectors()  # vectors are counted from here to the end
+    print(f"paddle, a powerup and {BALLS} balls moved for {FRAMES:,} frames\n")
+    print(f"{'moving':>10} {'vectors/frame':>14} {'us/frame':>9}")
+    for name, bodies in games.items():
+        built.clear()
+        play(bodies, name == "in place", 1000)
+        vectors = len(built) / 1000
+        print(f"{name:>10} {vectors:>14.2f} {timings[name] * 1000:>9.2f}")
+
+    plain = DictPosition(250, 475)
+    slotted = Position(250, 475)
+    plain_bytes = sys.getsizeof(plain) + sys.getsizeof(plain.__dict__)
+    slotted_bytes = sys.getsizeof(slotted)
+    print(f"\nPosition: {slotted_bytes} bytes slotted, {plain_bytes} with __dict__")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,32 +19,53 @@ Thomas Nugent
 """
 
 # pylint: disable=no-member,protected-access
+import importlib
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-import pygame
 
-
-@dataclass
+@dataclass(slots=True)
 class Size:
     """Dataclass to store sizes for easy access"""
 
     width: int
     height: int
 
+    def __eq__(self, other):
+        if isinstance(other, (Size, FixedSize)):
+            return self.width == other.width and self.height == other.height
+        return NotImplemented
+
+    def copy(self) -> "Size":
+        """A Size of its own to change"""
+        return Size(self.width, self.height)
 
-@dataclass
+
+@dataclass(slots=True)
 class Speed:
     """Dataclass to store speeds for easy access"""
 
     x: int
     y: int
 
+    def __eq__(self, other):
+        if isinstance(other, (Speed, FixedSpeed)):
+            return self.x == other.x and self.y == other.y
+        return NotImplemented
+
+    def copy(self) -> "Speed":
+        """A Speed of its own to change"""
+        return Speed(self.x, self.y)
 
-@dataclass
+
+@dataclass(slots=True)
 class Position:
-    """Dataclass to store positions for easy access"""
+    """
+    Dataclass to store positions for easy access.
+    Moving with += and -= changes the position in place, so moving objects
+    don't build a new Position every step.
+    """
 
     x: int
     y: int
@@ -55,19 +76,82 @@ class Position:
     def __sub__(self, speed: Speed):
         return Position(self.x - speed.x, self.y - speed.y)
 
+    def __iadd__(self, speed: Speed):
+        self.x += speed.x
+        self.y += speed.y
+        return self
+
+    def __isub__(self, speed: Speed):
+        self.x -= speed.x
+        self.y -= speed.y
+        return self
+
+    def __eq__(self, other):
+        if isinstance(other, (Position, FixedPosition)):
+            return self.x == other.x and self.y == other.y
+        return NotImplemented
+
+    def copy(self) -> "Position":
+        """A Position of its own to change"""
+        return Position(self.x, self.y)
+
+
+# Frozen versions for config defaults, shared by everything that starts from
+# them, so no object can move or resize another's default. They equal the
+# changeable versions with the same values, and copy() gives one.
+
+
+@dataclass(frozen=True, slots=True)
+class FixedSize:
+    """A Size that can't change"""
+
+    width: int
+    height: int
+
+    __eq__ = Size.__eq__
+
+    def copy(self) -> Size:
+        """A Size to change, starting from this one"""
+        return Size(self.width, self.height)
+
+
+@dataclass(frozen=True, slots=True)
+class FixedSpeed:
+    """A Speed that can't change"""
+
+    x: int
+    y: int
+
+    __eq__ = Speed.__eq__
+
+    def copy(self) -> Speed:
+        """A Speed to change, starting from this one"""
+        return Speed(self.x, self.y)
+
+
+@dataclass(frozen=True, slots=True)
+class FixedPosition:
+    """A Position that can't change"""
+
+    x: int
+    y: int
+
+    def __add__(self, speed: Speed):
+        return Position(self.x + speed.x, self.y + speed.y)
+
+    def __sub__(self, speed: Speed):
+        return Position(self.x - speed.x, self.y - speed.y)
+
+    __eq__ = Position.__eq__
+
+    def copy(self) -> Position:
+        """A Position to change, starting from this one"""
+        return Position(self.x, self.y)
+
 
-pygame.init()
 screen_size = Size(500, 600)
 
-color_choices = [
-    pygame.Color("red"),
-    pygame.Color("orange"),
-    pygame.Color("yellow"),
-    pygame.Color("green"),
-    pygame.Color("blue"),
-    pygame.Color("purple"),
-    pygame.Color("pink"),
-]
+color_names = ["red", "orange", "yellow", "green", "blue", "purple", "pink"]
 
 try:
     # PyInstaller creates a temp folder and stores path in _MEIPASS
@@ -75,16 +159,73 @@ try:
 except AttributeError:
     base_path = Path(__file__).parent
 
+# Submodules import on first use, e.g. breakout.screens, so importing the
+# package for Position or Speed doesn't load pygame or numpy
+submodules = [
+    "animation",
+    "assets",
+    "ball",
+    "bricks",
+    "core",
+    "display",
+    "paddle",
+    "physics",
+    "pool",
+    "powerups",
+    "profiler",
+    "replay",
+    "rng",
+    "score",
+    "screens",
+    "sim",
+    "sound",
+    "text",
+    "timestep",
+]
+
+
+def __getattr__(name: str):
+    """
+    Build pygame objects and import submodules on first use, so the headless
+    core never imports pygame
+    """
+    if name in submodules:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name == "color_choices":
+        import pygame  # pylint: disable=import-outside-toplevel
+
+        globals()["color_choices"] = [pygame.Color(color) for color in color_names]
+        return globals()["color_choices"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
+    "animation",
+    "assets",
     "ball",
     "bricks",
+    "core",
+    "display",
     "paddle",
+    "physics",
+    "pool",
     "powerups",
+    "profiler",
+    "replay",
+    "rng",
     "score",
     "screens",
+    "sim",
+    "sound",
+    "text",
+    "timestep",
     "color_choices",
+    "color_names",
     "screen_size",
     "Size",
     "Position",
     "Speed",
+    "FixedSize",
+    "FixedPosition",
+    "FixedSpeed",
 ]
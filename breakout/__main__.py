@@ -1,9 +1,9 @@
 """
 Breakout
 ========
-Manages the core game loop, screen transitions, and overall game logic. 
+Manages the core game loop, screen transitions, and overall game logic.
 Handles user input, game state changes, and object initialization for gameplay.
-When this module is ran directly, it launches the breakout game. 
+When this module is ran directly, it launches the breakout game.
 
 Class
 -----
@@ -20,56 +20,90 @@ Thomas Nugent
 
 """
 
-import random
+import argparse
 import sys
 from dataclasses import astuple
+from datetime import datetime
+from pathlib import Path
 
 import pygame
 
-from breakout import Position, Speed, base_path, color_choices, screen_size, sound
-from breakout.ball import Ball, BallConfig
-from breakout.bricks import Brick
-from breakout.paddle import Paddle, PaddleConfig
-from breakout.powerups import ExtraLifePowerup, PowerDown, PowerUp
+from breakout import color_names, sound
+from breakout.assets import assets
+from breakout.ball import Ball
+from breakout.bricks import TEXTURE_PATH, BrickLayer
+from breakout.core import BrickConfig, Inputs, PaddleConfig, Simulation
+from breakout.display import Display
+from breakout.paddle import Paddle, paddle_animation
+from breakout.powerups import (
+    HEART_PATH,
+    HEART_SIZE,
+    ExtraLifePowerup,
+    PowerDown,
+    PowerUp,
+    warm_animations,
+)
+from breakout.profiler import PerformanceOverlay, frame_timer
+from breakout.replay import Recorder, Replay
 from breakout.score import LivesDisplay, NameInput, Scoreboard, ScoreDisplay
 from breakout.screens import (
     ArrowButton,
     BlinkingMessage,
     Button,
+    Layer,
     MusicToggle,
     ScreenManager,
     Screens,
 )
+from breakout.timestep import FRAME_TIME, TICK_RATE, FixedTimestep, Interpolator
 
 # pylint: disable=no-member
-random.seed()
 
 
 class Game:
     """Class to handle and run the game"""
 
-    def __init__(self):
-        self.window = pygame.display.set_mode(astuple(screen_size), pygame.RESIZABLE)
+    tick_rate = TICK_RATE  # simulation steps per second
+    max_fps = 240  # drawing frame cap, 0 draws as fast as possible
+    # events the game handles itself, screens allow the ones their elements handle
+    event_types = (
+        pygame.QUIT,
+        pygame.VIDEORESIZE,
+        pygame.WINDOWEXPOSED,  # the window was uncovered and needs drawing again
+        pygame.KEYDOWN,
+        pygame.TEXTINPUT,  # fills in the typed character of each KEYDOWN
+        sound.MUSIC_END,
+    )
+
+    def __init__(self, seed: int = None, replay_dir: Path = None):
+        """
+        Open the window and set up the screens
+
+        Args:
+            seed: Play every game from this seed, a new random seed per game if None.
+            replay_dir: Save a replay of every game to this folder, no replays if None.
+        """
+        self.seed = seed
+        self.replay_dir = replay_dir
+        # Only the parts of pygame the game uses are started, not pygame.init().
+        # The display starts video, fonts and sound start when first used.
+        pygame.time.wait(0)  # starts the timer get_ticks counts from
+        self.display = Display()
         pygame.display.set_caption("Breakout")
+        # Other events, like the flood of MOUSEMOTION, never reach the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.event_types)
+        sound.SoundManager.load_effects()  # decodes while the start screen shows
         self.clock = pygame.time.Clock()
+        self.timestep = FixedTimestep(self.tick_rate)
+        self.interpolator = Interpolator()
+        self.overlay = PerformanceOverlay()  # frame timings, shown with F3
 
-        start_bg = pygame.image.load(
-            str(base_path.joinpath("textures", "THE BREAKOUT.png"))
-        ).convert()
-        game_bg = pygame.image.load(
-            str(base_path.joinpath("textures", "BlueBackground2.png"))
-        ).convert()
-        end_bg = pygame.image.load(
-            str(base_path.joinpath("textures", "BlueBackground.png"))
-        ).convert()
-        help_bg = pygame.image.load(
-            str(base_path.joinpath("textures", "help_screen.png"))
-        ).convert()
-        # Assign the background image to the start screen.
-        Screens.START.background_image = start_bg
-        Screens.GAME.background_image = game_bg
-        Screens.END.background_image = end_bg
-        Screens.HELP.background_image = help_bg
+        # Backgrounds load when their screen is first shown
+        Screens.START.background_path = "textures/THE BREAKOUT.png"
+        Screens.GAME.background_path = "textures/BlueBackground2.png"
+        Screens.END.background_path = "textures/BlueBackground.png"
+        Screens.HELP.background_path = "textures/help_screen.png"
 
         self.left_arrow = ArrowButton("left")
         self.right_arrow = ArrowButton("right")
@@ -79,9 +113,14 @@ class Game:
 
         self.setup_screens()
         self.state = GameState()
+        self.recorder = Recorder(self.state, self.tick_rate)
+        self.replay_saved = False
 
     def setup_screens(self):
         """Add static button elements to START and END screens"""
+        for screen in (Screens.START, Screens.END, Screens.HELP):
+            screen.clear_elements()  # buttons from an earlier Game
+
         # Start Screen
         Screens.START.add_element(
             Button("START GAME", lambda: self.switch_screen(Screens.GAME), "middle")
@@ -125,18 +164,37 @@ class Game:
             self.start_new_game()
         elif screen == Screens.END:
             self.state.game_over()
+            self.save_replay()
 
     def start_new_game(self):
         """
         Start a new game
         Create the paddle, ball and brick elements
         """
-        self.state = GameState(Screens.GAME)  # fresh game state
+        self.state.dispose()  # the old game's sprites and messages
+        self.state = GameState(Screens.GAME, seed=self.seed)  # fresh game state
+        self.recorder = Recorder(self.state, self.tick_rate)
+        self.replay_saved = False
+        self.timestep.reset()
+        self.interpolator.record(self.state)
         self.up_arrow = ArrowButton("up")  # fresh up arrow
-        Screens.GAME.elements.clear()
+        Screens.GAME.clear_elements()  # and the old game's buttons
+        # Load everything the game draws up front, so playing never reads the disk
+        assets.warm(
+            (Screens.GAME.background_path, self.display.logical_size, False),
+            (TEXTURE_PATH, astuple(BrickConfig.size), True),
+            (HEART_PATH, HEART_SIZE, True),
+        )
+        # and draw every animation frame, so sprites only swap frames while playing
+        warm_animations()
+        big_paddle = (PaddleConfig.size.width * 2, PaddleConfig.size.height)
+        for color in color_names:
+            paddle_animation(big_paddle, color)
 
         # Buttons
-        Screens.GAME.add_element(Button("PAUSE GAME", self.pause_game, "middle"))
+        Screens.GAME.add_element(
+            Button("PAUSE GAME", self.pause_game, "middle"), name="pause"
+        )
         Screens.GAME.add_element(
             Button("END GAME", lambda: self.switch_screen(Screens.END), "bottom")
         )
@@ -146,15 +204,11 @@ class Game:
         Screens.GAME.add_element(self.left_arrow)
         Screens.GAME.add_element(self.right_arrow)
         Screens.GAME.add_element(self.up_arrow)
+        self.show_game_state()
 
-        # Game state objects
-        Screens.GAME.add_element(self.state.score_display)
-        Screens.GAME.add_element(self.state.ball_group)
-        Screens.GAME.add_element(self.state.paddle_group)
-        Screens.GAME.add_element(self.state.powerup_group)
-        Screens.GAME.add_element(self.state.bricks)
-        Screens.GAME.add_element(self.state.lives_display)
-        Screens.GAME.add_element(self.state.launch_message)
+    def show_game_state(self):
+        """Add the game state objects to the game screen"""
+        self.state.show_elements()
 
     def pause_game(self):
         """Pause the game"""
@@ -168,12 +222,7 @@ class Game:
         self.state.pause_game()
 
         # Change from pause to resume button
-        for idx, element in enumerate(Screens.GAME.elements):
-            if isinstance(element, Button) and "pause" in element.text.lower():
-                Screens.GAME.elements[idx].update_button(
-                    "RESUME GAME", self.resume_game
-                )
-                break
+        Screens.GAME.elements["pause"].update_button("RESUME GAME", self.resume_game)
 
     def resume_game(self):
         """Resume the game"""
@@ -182,14 +231,12 @@ class Game:
 
         self.state.resume_game()
 
-        # Find and remove the Resume button
-        for idx, element in enumerate(Screens.GAME.elements):
-            if isinstance(element, Button) and "resume" in element.text.lower():
-                Screens.GAME.elements[idx].update_button("PAUSE GAME", self.pause_game)
-                break
+        # Change the resume button back to pause
+        Screens.GAME.elements["pause"].update_button("PAUSE GAME", self.pause_game)
 
     def quit_game(self):
         """Quit the game"""
+        self.save_replay()
         pygame.quit()
         sys.exit()
 
@@ -212,6 +259,11 @@ class Game:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.quit_game()
+            if event.type == pygame.VIDEORESIZE:
+                self.display.resize(event.size)
+            if event.type == pygame.WINDOWEXPOSED:
+                self.display.stale = True
+            event = self.display.map_event(event)
             if (
                 event.type == pygame.KEYDOWN
                 and self.up_arrow in self.state.current_screen.elements
@@ -223,13 +275,8 @@ class Game:
                     self.resume_game()
                 else:
                     self.pause_game()
-            if event.type == pygame.USEREVENT + 1:
-                sound.SoundManager.current_music += 1
-                if sound.SoundManager.current_music == len(
-                    sound.SoundManager.background_music
-                ):
-                    sound.SoundManager.current_music = 0
-                sound.SoundManager.play_background_music()
+            if event.type == sound.MUSIC_END:
+                sound.SoundManager.handle_event(event)
             if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
                 if self.state.current_screen == Screens.START:
                     self.switch_screen(Screens.GAME)
@@ -237,16 +284,18 @@ class Game:
                     self.save_score()
             if event.type == pygame.KEYDOWN and event.key == pygame.K_F1:
                 self.switch_screen(Screens.HELP)
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.toggle_overlay()
 
             self.state.current_screen.handle_event(event)
 
-    def update_game(self):
-        """Handle the gameplay"""
-        if (
-            self.state.paused
-            or self.state.game_is_over
-            or self.state.current_screen != Screens.GAME
-        ):
+    def update_game(self, time: int = FRAME_TIME):
+        """
+        Handle the gameplay
+        Collect the player's input and run every fixed step due in 'time' milliseconds
+        """
+        if self.state.current_screen != Screens.GAME:
+            self.state.update()
             return
 
         # Check for GUI arrow press for launching the ball.
@@ -254,265 +303,251 @@ class Game:
             self.launch()
 
         # if the ball is waiting for launch, ensure the up arrow is on screen.
-        if not self.state.launched:
-            if (
-                self.up_arrow not in self.state.current_screen.elements
-                and not self.state.new_level_wait
-            ):
-                self.state.current_screen.add_element(self.up_arrow)
-            return
+        if (
+            not self.state.launched
+            and self.up_arrow not in self.state.current_screen.elements
+            and not self.state.new_level_wait
+        ):
+            self.state.current_screen.add_element(self.up_arrow)
 
-        # Ball has been launched, allow movement.
-        self.move_game_pieces()
+        inputs = self.read_inputs()
+        for _ in range(self.timestep.advance(time)):
+            self.interpolator.record(self.state)
+            self.recorder.step(self.state, inputs, self.timestep.dt)
+        if self.state.game_is_over:
+            self.save_replay()
+
+    def read_inputs(self) -> Inputs:
+        """Read the paddle controls from the keyboard and arrow buttons"""
+        keys = pygame.key.get_pressed()
+        return Inputs(
+            left=bool(
+                keys[pygame.K_LEFT] or keys[pygame.K_a] or self.left_arrow.pressed
+            ),
+            right=bool(
+                keys[pygame.K_RIGHT] or keys[pygame.K_d] or self.right_arrow.pressed
+            ),
+        )
 
     def launch(self):
         "Launch the ball and remove the up arrow from the screen"
+        if self.state.paused or self.state.new_level_wait:
+            return  # same rule as launching from Simulation.step
         self.state.launch_ball()
         if self.up_arrow in self.state.current_screen.elements:
             self.up_arrow.pressed = False
-            self.state.current_screen.elements.remove(self.up_arrow)
-
-    def move_game_pieces(self):
-        """Move the paddles, balls, and powerups on the screen"""
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT] or keys[pygame.K_a] or self.left_arrow.pressed:
-            for paddle in self.state.paddle_group.sprites():
-                paddle.move_left()
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d] or self.right_arrow.pressed:
-            for paddle in self.state.paddle_group.sprites():
-                paddle.move_right()
-
-        for ball in self.state.ball_group.sprites():
-            self.state = ball.move(self.state)
-
-        for powerup in self.state.powerup_group.sprites():
-            powerup.move(self.state)
+            self.state.current_screen.remove_element(self.up_arrow)
 
     def run(self):
-        """Run the main game loop"""
+        """
+        Run the main game loop
+        The game advances in fixed steps, drawing runs as often as max_fps allows
+        """
+        time = FRAME_TIME
         while True:
-            self.handle_events()
-            self.update_game()
-            self.state.update()
-
-            self.state.current_screen.draw(self.window)
-            pygame.display.update()
-            time = self.clock.tick(50)
-            if not self.state.paused and self.state.launched:
-                self.state.time += time
+            time = self.run_frame(time)
 
+    def run_frame(self, time: int) -> int:
+        """
+        Handle events, run the steps due in 'time' milliseconds and draw a frame,
+        timing each phase in frame_timer while it is on
+        Returns the milliseconds since the last frame, once the next one is due.
+        """
+        with frame_timer.phase("events"):
+            self.handle_events()
+        with frame_timer.phase("update"):
+            self.update_game(time)
+
+        with frame_timer.phase("draw"):
+            with self.interpolator.blend(self.state, self.timestep.alpha):
+                changed = self.state.current_screen.draw(self.display.surface)
+            changed += self.overlay.draw(self.display.surface)
+        with frame_timer.phase("present"):
+            self.display.present(changed)
+        with frame_timer.phase("tick"):
+            time = self.clock.tick(self.max_fps)
+        frame_timer.end_frame()
+        return time
+
+    def toggle_overlay(self):
+        """Show or hide the frame timings over the game"""
+        self.overlay.toggle()
+        if not self.overlay.visible:
+            ScreenManager.last_drawn = None  # repaint where the overlay was
+
+    def save_replay(self):
+        """Save the current game's replay once, if replays are on"""
+        if self.replay_dir is None or self.replay_saved or not self.recorder.steps:
+            return
+        self.replay_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.recorder.replay.save(
+            self.replay_dir / f"breakout-{stamp}-{self.recorder.replay.seed}.bkr"
+        )
+        self.replay_saved = True
 
-class GameState:
+    def play_replay(self, replay: Replay, step: int = 0):
+        """
+        Watch a replay at normal speed, starting at 'step'
+        The last frame stays on screen until the window is closed.
+        """
+        self.state = GameState(Screens.GAME, seed=replay.seed)
+        replay.restore(self.state, step)
+        Screens.GAME.clear_elements()
+        self.show_game_state()
+        self.timestep = FixedTimestep(replay.tick_rate)
+        self.interpolator.record(self.state)
+
+        inputs = replay.inputs(step)
+        time = 0
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+                if event.type == pygame.VIDEORESIZE:
+                    self.display.resize(event.size)
+                if event.type == pygame.WINDOWEXPOSED:
+                    self.display.stale = True
+                sound.SoundManager.handle_event(event)
+            for _ in range(self.timestep.advance(time)):
+                next_inputs = next(inputs, None)
+                if next_inputs is None:
+                    break  # end of the replay
+                self.interpolator.record(self.state)
+                self.state.step(next_inputs, self.timestep.dt)
+
+            with self.interpolator.blend(self.state, self.timestep.alpha):
+                changed = self.state.current_screen.draw(self.display.surface)
+            self.display.present(changed)
+            time = self.clock.tick(self.max_fps)
+
+
+class GameState(Simulation):
     """Manages the game's current state and flags for transitions.
-    initializes default values (level, score, lives), tracks powerups,
-    and updates the game state based on in-game events."""
-
-    def __init__(self, screen: ScreenManager = Screens.START):
+    Runs the rules from breakout.core with sprites in place of the headless
+    bodies, and keeps the screen elements in sync with the state."""
+
+    group_type = pygame.sprite.Group
+    ball_type = Ball
+    paddle_type = Paddle
+    field_type = BrickLayer
+    powerup_type = PowerUp
+    extra_life_type = ExtraLifePowerup
+    powerdown_type = PowerDown
+
+    def __init__(self, screen: ScreenManager = Screens.START, seed: int = None):
         """Reset the game state for a new game."""
-        self.level = 1
-        self.score = 0  # Default starting score
-        self.lives = 3  # Default starting lives
-        self.time = 0
-        self.new_level_wait = False
-        self.bricks = Brick.create_brick_layout(rows=6, cols=8, level=self.level)
-        self.ball_group = pygame.sprite.Group()
-        self.powerup_group = pygame.sprite.Group()
-        self.paddle_group = pygame.sprite.Group()
-        self.ball = Ball(self.ball_group)
-        self.paddle = Paddle(self.paddle_group)
+        super().__init__(seed)
         self.score_display = ScoreDisplay(self.score)
         self.lives_display = LivesDisplay(self.lives)
         self.launch_message = BlinkingMessage("Press Up to Launch!")
         self.pause_message = BlinkingMessage("Paused!", blink_interval=500)
         self.current_screen: ScreenManager = screen
-
-        # Power-up spawn timing
-        self.min_wait_time = 15 * 1000  # 15 seconds in milliseconds
-        self.max_wait_time = 30 * 1000  # 30 seconds in milliseconds
-        self.next_powerup_time = self.time + random.randint(
-            self.min_wait_time, self.max_wait_time
-        )
-
-        # State flags
-        self.launched = False
-        self.paused = False
-        self.game_is_over = False
-
-        self.powerup_choices = [
-            lambda: PowerUp(
-                self.powerup_group, power=self.add_paddle, shape="rectangle"
-            ),
-            lambda: PowerUp(
-                self.powerup_group,
-                power=self.add_ball,
-            ),
-            lambda: PowerDown(self.powerup_group, power=self.lose_life),
-            lambda: ExtraLifePowerup(self.powerup_group, power=self.add_life),
-        ]
+        self.shown = {}  # name -> element this state shows on the game screen
 
     def update(self):
         """Update the game based on the current state"""
-        self.score_display.update(self.score)
-        self.lives_display.update(self.lives)
+        with frame_timer.phase("state"):
+            self.score_display.update(self.score)
+            self.lives_display.update(self.lives)
 
-        if self.game_is_over:
-            self.current_screen = Screens.END
-        if self.current_screen != Screens.GAME or self.paused:
-            # game state only changes if we're still in the game
-            return
+            if self.game_is_over:
+                self.current_screen = Screens.END
+            if self.current_screen != Screens.GAME or self.paused:
+                # game state only changes if we're still in the game
+                return
 
-        # broke all bricks, go again
-        if len(self.bricks.sprites()) == 0:
-            self.new_level_wait = True
-            self.level += 1
-            self.max_wait_time -= 1000
-            self.min_wait_time -= 1000
-            self.min_wait_time = max(self.min_wait_time, 0)
-            self.max_wait_time = max(self.max_wait_time, 1000)
-            for ball in self.ball_group.sprites():
-                ball.reset_position()
-                ball.speed = Speed(0, 0)
-            for paddle in self.paddle_group.sprites():
-                paddle.reset_position()
-            self.launched = False
-            self.launch_message = BlinkingMessage(
-                [f"Level {self.level}", "Ready?", "Go!"],
-                blink_interval=600,
-            )
-            self.bricks = Brick.create_brick_layout(rows=6, cols=8, level=self.level)
-            Screens.GAME.add_element(self.bricks)
-
-        if self.new_level_wait and not self.launch_message.text_list:
-            for ball in self.ball_group.sprites():
-                ball.increase_speed(
-                    pow(1.375, self.level) + 3
-                )  # Increase speed for each ball
-            if self.level % 2 == 0:
-                for paddle in self.paddle_group.sprites():
-                    paddle.increase_speed()
-            self.launch_ball()
-            self.launch_message = BlinkingMessage(
-                "Press Up to Launch!", blink_interval=700
-            )
-            self.new_level_wait = False
-
-        if not self.launched:
-            if self.launch_message not in self.current_screen.elements:
-                self.current_screen.add_element(self.launch_message)
-            # game state can only change if we're launched
-            return
+            super().update()
 
-        if (
-            self.time >= self.next_powerup_time
-            and len(self.powerup_group.sprites()) == 0
-        ):
-            self.add_powerup()
-
-        for paddle in self.paddle_group.sprites():
-            if paddle.timeout:
-                # temp paddle, update it
-                paddle.check_timeout(self.time)
+            if not self.launched:
+                self.show("launch_message", self.launch_message, Layer.MESSAGE)
 
-    def add_powerup(self):
+    def show(self, name: str, element, layer: int = Layer.UI):
         """
-        Choose a random powerup and add it to the screen
-        Only allow one paddle powerup at a time to avoid confusion
+        Show an element on the game screen under a name. The state owns the
+        elements it shows, the one it showed under the name before is removed.
         """
-        if len(self.paddle_group.sprites()) > 1:
-            random_powerup = random.choice(self.powerup_choices[1:])
-        else:
-            random_powerup = random.choice(self.powerup_choices)
-        random_powerup()
-
-        self.next_powerup_time = self.time + random.randint(
-            self.min_wait_time, self.max_wait_time
+        shown = Screens.GAME.elements.get(name)
+        if shown is element:
+            return
+        if shown is not None:
+            Screens.GAME.remove_element(shown)
+        Screens.GAME.add_element(element, layer, name)
+        self.shown[name] = element
+
+    def hide(self, name: str):
+        """Remove the element the state shows under a name from the game screen"""
+        element = self.shown.pop(name, None)
+        if element is not None and element in Screens.GAME.elements:
+            Screens.GAME.remove_element(element)
+
+    def dispose(self):
+        """Remove every element the state shows, e.g. when a new game replaces it"""
+        for name in list(self.shown):
+            self.hide(name)
+
+    def show_elements(self):
+        """Show the score, lives, sprites and launch message on the game screen"""
+        self.show("score", self.score_display)
+        self.show("balls", self.ball_group, Layer.WORLD)
+        self.show("paddles", self.paddle_group, Layer.WORLD)
+        self.show("powerups", self.powerup_group, Layer.WORLD)
+        self.show("bricks", self.bricks, Layer.WORLD)
+        self.show("lives", self.lives_display)
+        self.show("launch_message", self.launch_message, Layer.MESSAGE)
+
+    def new_level(self):
+        """Show the refilled bricks and count down to the new level"""
+        self.launch_message = BlinkingMessage(
+            [f"Level {self.level}", "Ready?", "Go!"],
+            blink_interval=600,
         )
+        self.show("bricks", self.bricks, Layer.WORLD)
+
+    def level_started(self):
+        """Reset the launch message once the new level is underway"""
+        self.launch_message = BlinkingMessage("Press Up to Launch!", blink_interval=700)
+
+    def play_sound(self, name: str):
+        """Play game sounds"""
+        sound.SoundManager.play(name)
 
     def launch_ball(self):
         """Trigger ball launch."""
         if self.launched:
             return
 
-        self.launched = True
-        if self.launch_message in self.current_screen.elements:
-            self.current_screen.elements.remove(self.launch_message)
+        super().launch_ball()
+        self.hide("launch_message")
 
     def pause_game(self):
         """Pause the game."""
-        self.paused = True
-        if self.pause_message not in self.current_screen.elements:
-            self.current_screen.add_element(self.pause_message)
+        super().pause_game()
+        self.show("pause_message", self.pause_message, Layer.MESSAGE)
 
     def resume_game(self):
         """Resume the game."""
-        self.paused = False
-        if self.pause_message in self.current_screen.elements:
-            self.current_screen.elements.remove(self.pause_message)
+        super().resume_game()
+        self.hide("pause_message")
 
     def game_over(self):
         """Mark game as over."""
-        self.game_is_over = True
-        sound.SoundManager.play_game_over()
+        super().game_over()
         sound.SoundManager.stop_other_sounds()
 
-    def add_ball(self):
-        """Add a ball to the game"""
-        try:
-            power_up = self.powerup_group.sprites()[0]
-        except IndexError:
-            # pull from where the paddle is if you can't find the powerup
-            power_up = self.paddle_group.sprites()[0]
-        power_up_position: pygame.Rect = power_up.rect
-
-        # Create the new ball with the current speed
-        Ball(
-            self.ball_group,
-            position=Position(power_up_position.center[0], power_up_position.center[1]),
-            color=random.choice(color_choices),
-            speed=Speed(0, BallConfig.default_speed),
-        )
-
-    def add_paddle(self):
-        """
-        Add a new paddle to the screen as a powerup
-
-        This paddle is twice as big and appears centered on the original
-        """
-        Paddle(
-            self.paddle_group,
-            x_position=self.paddle.position.x
-            - (PaddleConfig.size.width // 2),  # in the center of the current paddle
-            width=PaddleConfig.size.width * 2,  # twice as big
-            color=random.choice(color_choices),
-            timeout=self.time
-            + random.randint(
-                self.min_wait_time, self.max_wait_time
-            ),  # when it should disappear
-        )
-
     def add_life(self):
         """Adds a life to player's existing quantity"""
-        self.lives += 1
+        super().add_life()
         self.lives_display.update(self.lives)
 
-    def lose_life(self):
-        """Lose a life"""
-        self.lives -= 1
-
-        if self.lives < 1:
-            self.game_over()
-            return
-
-        sound.SoundManager.play_life_lost()
-        for ball in self.ball_group.sprites():
-            ball.reset_position()
-        for paddle in self.paddle_group.sprites():
-            paddle.reset_position()
-        for powerup in self.powerup_group.sprites():
-            powerup.kill()
-
-        self.launched = False
-
 
 if __name__ == "__main__":
-    Game().run()
+    parser = argparse.ArgumentParser(
+        prog="python -m breakout", description="Play Breakout."
+    )
+    parser.add_argument(
+        "seed", type=int, nargs="?", help="play every game from this seed"
+    )
+    parser.add_argument("--record", type=Path, help="save a replay of each game here")
+    args = parser.parse_args()
+    Game(seed=args.seed, replay_dir=args.record).run()
@@ -0,0 +1,65 @@
+"""
+Animation
+=========
+Sprites that flicker or explode show a cycle of frames. Every frame is drawn
+once, when the cycle is first needed, and shared by every sprite that animates
+the same way, so during play animating a sprite only swaps which frame is
+its image.
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import pygame
+
+
+class Animation:
+    """
+    A cycle of frames shown one after another, each for the same interval.
+    The frames are shared, so sprites must not draw on them.
+    """
+
+    def __init__(self, frames, interval: float, loop: bool = True):
+        """
+        Create an animation from frames that are already drawn
+
+        Args:
+            frames: The images in the order they are shown.
+            interval: Milliseconds each frame is shown for.
+            loop: Start again after the last frame, or stay on it.
+        """
+        self.frames = tuple(frames)
+        self.interval = interval
+        self.loop = loop
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __getitem__(self, index: int) -> pygame.Surface:
+        return self.frames[index]
+
+    def index(self, elapsed: float) -> int:
+        """The number of the frame showing after some milliseconds"""
+        index = int(elapsed // self.interval)
+        if self.loop:
+            return index % len(self.frames)
+        return min(max(index, 0), len(self.frames) - 1)
+
+    def frame(self, elapsed: float) -> pygame.Surface:
+        """The frame showing after some milliseconds"""
+        return self.frames[self.index(elapsed)]
+
+    def nbytes(self) -> int:
+        """Bytes of pixel data in the frames, counting shared frames once"""
+        frames = {id(frame): frame for frame in self.frames}.values()
+        return sum(frame.get_pitch() * frame.get_height() for frame in frames)
@@ -0,0 +1,171 @@
+"""
+Assets
+======
+Images loaded from disk the first time they are asked for and kept for the
+rest of the game. Each file is read once and converted to the display's pixel
+format once, and scaled copies are kept next to the original, so drawing and
+spawning sprites never load or rescale anything after the first use.
+Sprite images drawn in code are shared the same way: sprites that look alike
+use one surface, built the first time it is needed, and so do the frames of
+sprites that animate alike.
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+from pathlib import Path
+
+import pygame
+
+from breakout import base_path
+from breakout.animation import Animation
+
+
+class AssetCache:
+    """
+    Images by path, size and format, loaded on first use.
+    Asking again for the same image returns the same surface, so sprites
+    sharing an asset must not draw on it.
+    """
+
+    def __init__(self, root: Path = base_path):
+        """
+        Create an empty cache
+
+        Args:
+            root: The folder asset paths are relative to.
+        """
+        self.root = Path(root)
+        self.images = {}  # (path, size, alpha) -> surface, None if it failed to load
+        self.sprites = {}  # (kind, size, color, variant) -> surface drawn in code
+        self.animations = {}  # (kind, size, variant) -> Animation of shared frames
+        self.loads = 0  # files read from disk
+        self.builds = 0  # sprite images drawn
+
+    def image(
+        self, path: str, size: tuple = None, alpha: bool = False
+    ) -> pygame.Surface | None:
+        """
+        An image, loading and converting it the first time it is asked for
+
+        Args:
+            path: The image file, relative to the cache's root folder.
+            size: Scale the image to this size, None for its own size.
+            alpha: Keep per-pixel transparency, convert_alpha instead of convert.
+
+        Returns:
+            The image, or None if it could not be loaded.
+        """
+        key = (path, None if size is None else tuple(size), alpha)
+        if key in self.images:
+            return self.images[key]
+        if size is not None:
+            original = self.image(path, alpha=alpha)
+            image = None if original is None else pygame.transform.scale(original, size)
+        else:
+            image = self.load(path, alpha)
+        self.images[key] = image
+        return image
+
+    def load(self, path: str, alpha: bool) -> pygame.Surface | None:
+        """Read an image file and convert it to the display's pixel format"""
+        self.loads += 1
+        try:
+            image = pygame.image.load(str(self.root.joinpath(path)))
+        except (FileNotFoundError, pygame.error) as e:
+            print("Error loading image:", e)
+            return None
+        if pygame.display.get_surface() is None:
+            return image  # nothing to convert to without a window
+        return image.convert_alpha() if alpha else image.convert()
+
+    def sprite(
+        self,
+        kind: str,
+        size: tuple,
+        color,
+        build,
+        variant=None,
+    ) -> pygame.Surface:
+        """
+        A sprite image shared by every sprite that looks the same
+
+        Args:
+            kind: What the image is of, e.g. "ball".
+            size: The image's size.
+            color: The sprite's color, None if it has none.
+            build: Called with no arguments to draw the image the first time.
+            variant: Anything else that changes the look, e.g. a texture.
+
+        Returns:
+            The shared image. Sprites must not draw on it, one that needs to look
+            different takes a copy() or another image.
+        """
+        if color is not None:
+            color = tuple(pygame.Color(color))
+        key = (kind, tuple(size), color, variant)
+        if key not in self.sprites:
+            self.sprites[key] = build()
+            self.builds += 1
+        return self.sprites[key]
+
+    def animation(
+        self,
+        kind: str,
+        size: tuple,
+        build,
+        interval: float,
+        variant=None,
+        loop: bool = True,
+    ) -> Animation:
+        """
+        An animation shared by every sprite that animates the same way
+
+        Args:
+            kind: What the animation is of, e.g. "powerup".
+            size: The size of its frames.
+            build: Called with no arguments to draw the frames the first time.
+            interval: Milliseconds each frame is shown for.
+            variant: Anything else that changes the look, e.g. a shape.
+            loop: Start again after the last frame, or stay on it.
+
+        Returns:
+            The shared animation, sprites swap between its frames.
+        """
+        key = (kind, tuple(size), variant)
+        if key not in self.animations:
+            self.animations[key] = Animation(build(), interval, loop)
+        return self.animations[key]
+
+    def warm(self, *assets: tuple):
+        """Load (path, size, alpha) assets ahead of time, e.g. before a game starts"""
+        for path, size, alpha in assets:
+            self.image(path, size, alpha)
+
+    def nbytes(self) -> dict[tuple, int]:
+        """Bytes of pixel data held for each loaded or drawn image"""
+        return {
+            key: image.get_pitch() * image.get_height()
+            for key, image in (*self.images.items(), *self.sprites.items())
+            if image is not None
+        }
+
+    def clear(self):
+        """Forget every image, e.g. after the display format changes"""
+        self.images.clear()
+        self.sprites.clear()
+        self.animations.clear()
+        self.loads = self.builds = 0
+
+
+assets = AssetCache()  # shared by the whole game
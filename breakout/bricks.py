@@ -1,8 +1,9 @@
 """
 Brick
 =====
-Represents individual bricks in the game, managing their appearance, structure, 
+Represents individual bricks in the game, managing their appearance, structure,
 and removal upon collision with the ball. Assigns point values for scoring.
+The game's bricks are drawn from a BrickLayer, a brick field with shared images.
 
 Class
 -----
@@ -19,32 +20,29 @@ Thomas Nugent
 
 """
 
-import random
-from dataclasses import astuple, dataclass
+from dataclasses import astuple
 
+import numpy as np
 import pygame
 from pygame.sprite import Sprite
 
-from breakout import Position, Size, base_path, screen_size
+from breakout import FixedPosition, Position
+from breakout.assets import assets
+from breakout.core import BrickBody, BrickConfig
+from breakout.physics import BrickField
 
-
-# pylint: disable=no-member
-@dataclass
-class BrickConfig:
-    """Configuration for Brick constants."""
-
-    size = Size(51, 25)
-    border_radius = 5
+TEXTURE_PATH = "textures/unbreakable_texture.jpg"
 
 
-class Brick(Sprite):
+# pylint: disable=no-member
+class Brick(BrickBody, Sprite):
     """Brick class - Characteristics for a single brick in the game."""
 
     def __init__(
         self,
         *groups,
         color: pygame.Color,
-        position: Position | tuple = Position(0, 0),
+        position: Position | tuple = FixedPosition(0, 0),
         texture: bool = False
     ):
         """
@@ -57,216 +55,136 @@ class Brick(Sprite):
             texture: If True, marks the brick as unbreakable and applies a texture.
         """
         super().__init__(
-            *groups,
+            *groups, color=pygame.Color(color), position=position, texture=texture
         )
-        if isinstance(position, tuple):
-            self.position = Position(position[0], position[1])
-        else:
-            self.position = position
-        self.color = color
-        self.size = BrickConfig.size
-        self.breakable = True  # Bricks are breakable by default
-
-        # Create the surface/rect for the brick
-        self.image = pygame.Surface(astuple(self.size), pygame.SRCALPHA)
-        # Initialize the rectangle for positioning
-        self.rect = self.image.get_rect(topleft=(self.position.x, self.position.y))
-        # Fill the rectangle onto the image
-        pygame.draw.rect(
-            self.image,  # Surface to draw on
-            color,  # Color of the rectangle
-            (0, 0, self.size.width, self.size.height),  # Rectangle dimensions
-            border_radius=BrickConfig.border_radius,  # Rounded corners
-        )
-
-        # Set point value
-        if self.color == pygame.Color("red"):
-            self.points = 3
-        elif self.color == pygame.Color("yellow"):
-            self.points = 2
-        else:
-            self.points = 1
 
-        if texture:
-            self.breakable = False
-            if hasattr(Brick, "unbreakable_texture") and Brick.unbreakable_texture:
-                self.image.blit(Brick.unbreakable_texture, (0, 0))
-            else:
-                self.image.fill((0, 0, 0))
+        # Bricks of the same size, color and texture share one image
+        self.image = brick_image(astuple(self.size), self.color, texture)
 
     def hit(self) -> int:
         """Actions when bricks are hit by the ball"""
-        if not self.breakable:
-            # Unbreakable bricks do not get destroyed.
-            self.breakable = True
-            # Clear the texture by redrawing the brick in its base color.
-            self.image.fill((0, 0, 0, 0))  # Clear with transparency.
-            pygame.draw.rect(
-                self.image,
-                self.color,
-                (0, 0, self.size.width, self.size.height),
-                border_radius=BrickConfig.border_radius,
-            )
-            return 0
-        self.image.fill((0, 0, 0, 0))
-        self.kill()  # remove the brick from the game
-        return self.points
-
-    @classmethod
-    def load_texture(cls):
-        """Load the unbreakable texture (Multi-hit bricks will be wearing this texture)"""
-        try:
-            texture_path = base_path.joinpath("textures", "unbreakable_texture.jpg")
-            Brick.unbreakable_texture = pygame.image.load(
-                str(texture_path)
-            ).convert_alpha()
-            Brick.unbreakable_texture = pygame.transform.scale(
-                Brick.unbreakable_texture, astuple(BrickConfig.size)
-            )
-            print("Texture loaded successfully from", texture_path)
-        except (FileNotFoundError, pygame.error) as e:
-            print("Error loading texture:", e)
-            Brick.unbreakable_texture = None
-
-    @classmethod
-    def create_brick_layout(cls, rows: int, cols: int, level: int):
-        """
-        Order and center the brick grid layout with dynamic colors.
-        A fixed percentage per level (10% per level, capped at 100%)
-        are randomly marked as multi-hit.
-
-        Args:
-            rows: Number of rows in the brick layout.
-            cols: Number of columns in the brick layout.
-            level: The current game level, used to determine the percentage of unbreakable bricks.
-        """
-        brick_group = pygame.sprite.Group()
-        offset = 10  # Margin between bricks
-
-        total = rows * cols  # For 6 rows x 8 cols, total is 48.
-        chance = min(level * 0.1, 1.0)
-        extra_count = round(total * chance)
-
-        # Create a list of indices and randomly shuffle it.
-        indices = list(range(total))
-        random.shuffle(indices)
-        # Select exactly extra_count indices that will be 'unbreakable'.
-        selected = set(indices[:extra_count])
+        points = super().hit()
+        if self.alive():
+            # Cracked unbreakable bricks are shown in their base color.
+            self.image = brick_image(astuple(self.size), self.color)
+        else:
+            # Broken bricks are cleared with transparency.
+            self.image = cleared_image(astuple(self.size))
+        return points
 
-        # Calculate the total brick area width
-        brick_area_width = cols * (BrickConfig.size.width + offset) - offset
+    @staticmethod
+    def texture() -> pygame.Surface | None:
+        """The unbreakable texture at brick size (Multi-hit bricks will be wearing this texture)"""
+        return assets.image(TEXTURE_PATH, astuple(BrickConfig.size), alpha=True)
 
-        # Center bricks horizontally, account for top margin
-        start_position = Position(
-            (screen_size.width - brick_area_width) // 2,
-            BrickConfig.size.height * (offset // 5),
-        )
 
-        # Load the brick texture if needed.
-        if not hasattr(cls, "unbreakable_texture"):
-            cls.load_texture()
-
-        index = 0  # Running index for each brick.
-        design = generate_random_design(rows, cols)
+class BrickLayer(BrickField):
+    """
+    A BrickField that draws itself, so it can be a screen element like a sprite group.
+    Bricks share one image per color and texture instead of holding their own.
+    """
 
-        for row, col in design:
-            position = Position(
-                start_position.x + col * (BrickConfig.size.width + offset),
-                start_position.y + row * (BrickConfig.size.height + offset),
+    def __init__(self, *args, **kwargs):
+        self.hits = []  # rects of bricks hit since the last damage() call
+        self.repaint_all = True  # bricks placed or removed since the last damage() call
+        super().__init__(*args, **kwargs)
+
+    def place(self, row: int, col: int, color, points: int, unbreakable: bool = False):
+        """Put a brick in a cell, the whole layout is repainted"""
+        super().place(row, col, color, points, unbreakable)
+        self.repaint_all = True
+
+    def empty(self):
+        """Remove every brick, the whole layout is repainted"""
+        super().empty()
+        self.repaint_all = True
+
+    def hit(self, row: int, col: int) -> int:
+        """Hit a brick, remembering where so only it is repainted"""
+        if self.alive[row, col]:
+            self.hits.append(pygame.Rect(tuple(self.cell_rect(row, col))))
+        return super().hit(row, col)
+
+    def brick_image(self, color, unbreakable: bool) -> pygame.Surface:
+        """The shared image for bricks of a color, the same one Brick sprites use"""
+        return brick_image((self.width, self.height), color, unbreakable)
+
+    def bounds(self) -> list[pygame.Rect]:
+        """Screen area the layout covers"""
+        return [
+            pygame.Rect(
+                self.left,
+                self.top,
+                self.cols * self.pitch_x - self.gap,
+                self.rows * self.pitch_y - self.gap,
             )
-            color = assign_color(rows, row)
-            # Mark this brick as extra durable if its index is in the selected set.
-            texture = index in selected
-            brick_group.add(
-                cls(
-                    brick_group,
-                    color=color,
-                    position=position,
-                    texture=texture,
-                )
+        ]
+
+    def appearance(self) -> int:
+        """Changes whenever a brick is placed, hit or removed"""
+        return self.changes
+
+    def damage(self) -> list[pygame.Rect] | None:
+        """The bricks hit since the last call, None if anything else changed too"""
+        hits = None if self.repaint_all else self.hits
+        self.hits = []
+        self.repaint_all = False
+        return hits
+
+    def draw(self, surface: pygame.Surface):
+        """Draw the live bricks that fall inside the surface's clip area"""
+        clip = surface.get_clip()
+        first_row = max((clip.top - self.top) // self.pitch_y, 0)
+        last_row = min((clip.bottom - 1 - self.top) // self.pitch_y, self.rows - 1)
+        first_col = max((clip.left - self.left) // self.pitch_x, 0)
+        last_col = min((clip.right - 1 - self.left) // self.pitch_x, self.cols - 1)
+        if first_row > last_row or first_col > last_col:
+            return
+        visible = self.alive[first_row : last_row + 1, first_col : last_col + 1]
+        blits = []
+        for row, col in np.argwhere(visible).tolist():
+            row += first_row
+            col += first_col
+            image = self.brick_image(
+                self.palette[self.color[row, col]], bool(self.unbreakable[row, col])
             )
-            index += 1
-
-        return brick_group
-
-
-def assign_color(rows: int, row: int):
-    """
-    Determine the brick's color based on its row position.
-
-    Args:
-        rows: Total number of rows.
-        row: The row index for the current brick.
-    """
-    first_quarter = max(1, rows // 4)
-    if row < first_quarter:
-        # Red occupies the first quarter
-        color = pygame.Color("red")
-    elif row < first_quarter + max(1, rows // 3):
-        # Yellow occupies the next third
-        color = pygame.Color("yellow")
-    else:
-        # Rest are green
-        color = pygame.Color("green")
-    return color
+            blits.append(
+                (image, (self.left + col * self.pitch_x, self.top + row * self.pitch_y))
+            )
+        surface.blits(blits, doreturn=False)
 
 
-def generate_random_design(rows: int, cols: int):
-    """
-    Generate a list of row-col indices forming a random shape within a given grid.
-    The shape can be a triangle or diagonal pattern.
-    """
-    random.seed()
-    shape_type = random.choice(
-        ["rtriangle", "ltriangle", "utriangle", "dtriangle", "ldiagonal", "rdiagonal"]
+def brick_image(size: tuple, color, unbreakable: bool = False) -> pygame.Surface:
+    """The shared image of a brick, wearing the texture if it is unbreakable"""
+    return assets.sprite(
+        "brick",
+        size,
+        color,
+        lambda: draw_brick(size, color, unbreakable),
+        variant="textured" if unbreakable else None,
     )
-    selected_indices = set()
 
-    if shape_type == "rtriangle":
-        for r in range(rows):
-            for c in range(r + 1):  # Creates a right triangle shape
-                selected_indices.add((r, c))
-    elif shape_type == "ltriangle":
-        for r in range(rows):
-            for c in range(
-                cols - r - 1, cols
-            ):  # Adjusts the column to create a left triangle
-                selected_indices.add((r, c))
-    if shape_type == "utriangle":
-        mid_col = 4  # middle column to center the triangle
-        for r in range(rows):
-            # Calculate the width of the triangle at each row
-            width = r * 2  # Increase the width as the row number increases
-            start_col = mid_col - (width // 2)  # Start of the base of the triangle
-            end_col = mid_col + (width // 2)  # End of the base of the triangle
 
-            # Add points within the current row's triangle width
-            for c in range(start_col, end_col):
-                if 0 <= c < cols:
-                    selected_indices.add((r, c))
-    elif shape_type == "dtriangle":
-        mid_col = 4  # middle column to center the triangle
-        for r in range(rows):
-            # Calculate the width of the triangle at each row
-            width = (rows - r) * 2 - 1  # Decrease the width as the row number increases
-            start_col = mid_col - (width // 2)  # Start of the base of the triangle
-            end_col = mid_col + (width // 2)  # End of the base of the triangle
+def draw_brick(size: tuple, color, unbreakable: bool) -> pygame.Surface:
+    """Draw a brick's rounded rectangle in its color, then its texture if any"""
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(
+        image,  # Surface to draw on
+        pygame.Color(color),  # Color of the rectangle
+        (0, 0, *size),  # Rectangle dimensions
+        border_radius=BrickConfig.border_radius,  # Rounded corners
+    )
+    if unbreakable:
+        unbreakable_texture = assets.image(TEXTURE_PATH, size, alpha=True)
+        if unbreakable_texture:
+            image.blit(unbreakable_texture, (0, 0))
+        else:
+            image.fill((0, 0, 0))
+    return image
 
-            # Add points within the current row's triangle width
-            for c in range(start_col, end_col):
-                if 0 <= c < cols:
-                    selected_indices.add((r, c))
-    elif shape_type == "ldiagonal":
-        thickness = random.randint(3, 5)
-        for r in range(rows):
-            for c in range(cols):
-                if abs((r - c) % rows) < thickness:  # Randomized diagonal thickness
-                    selected_indices.add((r, c))
-    elif shape_type == "rdiagonal":
-        thickness = random.randint(3, 5)
-        for r in range(rows):
-            for c in range(cols):
-                if abs((r + c) % rows - (rows - 1)) < thickness:
-                    selected_indices.add((r, c))
 
-    return list(selected_indices)
+def cleared_image(size: tuple) -> pygame.Surface:
+    """The shared transparent image of a broken brick"""
+    return assets.sprite(
+        "brick", size, None, lambda: pygame.Surface(size, pygame.SRCALPHA), "cleared"
+    )
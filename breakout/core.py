@@ -0,0 +1,1635 @@
+"""
+Core
+====
+Pure-logic game simulation shared by the pygame game and headless tooling.
+Holds the rules for the ball, paddle, bricks, powerups and overall game state
+without importing pygame, so thousands of games can be stepped without
+creating surfaces or touching the display and mixer.
+
+The pygame classes in the other modules subclass the bodies defined here and
+only add drawing and sound on top.
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import random
+from dataclasses import asdict, dataclass
+from typing import ClassVar, Literal
+
+import numpy as np
+
+from breakout import (
+    FixedPosition,
+    FixedSize,
+    FixedSpeed,
+    Position,
+    Size,
+    Speed,
+    color_names,
+    screen_size,
+)
+from breakout.physics import (
+    BallStore,
+    Box,
+    BoxView,
+    BrickField,
+    VectorView,
+    round_pixel,
+    sweep_circle_box,
+)
+from breakout.pool import Pool, PoolStats
+from breakout.rng import RandomStreams
+from breakout.timestep import FRAME_TIME
+
+# RGB values for the colors that change brick scoring
+named_colors = {
+    "red": (255, 0, 0),
+    "yellow": (255, 255, 0),
+    "green": (0, 255, 0),
+}
+
+
+class Entity:
+    """
+    Group membership for simulation objects.
+    Follows the pygame.sprite protocol so entities and sprites can share groups.
+    """
+
+    rng = RandomStreams()  # shared by entities made outside a game
+    pool: Pool = None  # the pool the entity goes back to when killed
+
+    def __init__(self, *groups, rng: RandomStreams = None, config: "GameConfig" = None):
+        self.__g = {}
+        self.released = False  # killed and handed back to its pool
+        if rng is not None:
+            self.rng = rng  # the random streams of the entity's game
+        # the settings of the entity's game, its own if it is outside a game
+        self.config = GameConfig() if config is None else config
+        if groups:
+            self.add(*groups)
+
+    def add(self, *groups):
+        """Add the entity to groups"""
+        for group in groups:
+            if not group.has_internal(self):
+                group.add_internal(self)
+                self.add_internal(group)
+
+    def remove(self, *groups):
+        """Remove the entity from groups"""
+        for group in groups:
+            if group.has_internal(self):
+                group.remove_internal(self)
+                self.remove_internal(group)
+
+    def add_internal(self, group):
+        """Record membership of a group"""
+        self.__g[group] = None
+
+    def remove_internal(self, group):
+        """Forget membership of a group"""
+        del self.__g[group]
+
+    def update(self, *args, **kwargs):
+        """Does nothing, kept for pygame.sprite compatibility"""
+
+    def kill(self):
+        """Remove the entity from all of its groups, and return it to its pool"""
+        for group in self.__g:
+            group.remove_internal(self)
+        self.__g.clear()
+        if self.pool is not None:
+            self.pool.release(self)
+
+    def advance(self, direction: int = 1):
+        """
+        Move the entity along its speed for one step, backwards for -1.
+        Speeds are pixels per step at TICK_RATE, so the distance is scaled to
+        the length of the game's steps.
+        """
+        scale = self.config.step_scale * direction
+        self.position.x += self.speed.x * scale
+        self.position.y += self.speed.y * scale
+
+    def reset(self, *groups, **kwargs):
+        """
+        Bring a released entity back as a new one with these constructor
+        arguments. The constructor runs again so a reused entity cannot keep
+        anything from its last life.
+        """
+        self.__init__(*groups, **kwargs)  # pylint: disable=unnecessary-dunder-call
+
+    def groups(self) -> list:
+        """List the groups the entity belongs to"""
+        return list(self.__g)
+
+    def alive(self) -> bool:
+        """Check if the entity still belongs to any group"""
+        return bool(self.__g)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} Entity(in {len(self.__g)} groups)>"
+
+    def play_sound(self, name: str):
+        """Hook for renderers to play a sound effect, the simulation is silent"""
+
+
+class Group:
+    """Ordered container of entities mirroring pygame.sprite.Group"""
+
+    def __init__(self, *entities):
+        self.spritedict = {}
+        self.add(*entities)
+
+    def sprites(self) -> list:
+        """List the entities in the group"""
+        return list(self.spritedict)
+
+    def add_internal(self, sprite, layer=None):  # pylint: disable=unused-argument
+        """Record an entity"""
+        self.spritedict[sprite] = None
+
+    def remove_internal(self, sprite):
+        """Forget an entity"""
+        del self.spritedict[sprite]
+
+    def has_internal(self, sprite) -> bool:
+        """Check for an entity"""
+        return sprite in self.spritedict
+
+    def add(self, *sprites):
+        """Add entities to the group"""
+        for sprite in sprites:
+            if not self.has_internal(sprite):
+                self.add_internal(sprite)
+                sprite.add_internal(self)
+
+    def remove(self, *sprites):
+        """Remove entities from the group"""
+        for sprite in sprites:
+            if self.has_internal(sprite):
+                self.remove_internal(sprite)
+                sprite.remove_internal(self)
+
+    def has(self, *sprites) -> bool:
+        """Check that all the entities are in the group"""
+        return all(self.has_internal(sprite) for sprite in sprites)
+
+    def empty(self):
+        """Remove every entity"""
+        for sprite in self.sprites():
+            self.remove(sprite)
+
+    def draw(self, surface):
+        """Headless groups have nothing to draw"""
+
+    def __iter__(self):
+        return iter(self.sprites())
+
+    def __contains__(self, sprite):
+        return self.has_internal(sprite)
+
+    def __len__(self):
+        return len(self.spritedict)
+
+    def __bool__(self):
+        return bool(self.spritedict)
+
+
+@dataclass
+class BallConfig:
+    """Configuration for Ball constants."""
+
+    radius = 10
+    default_speed = 4.0
+    max_speed = 5.0
+    initial_position = FixedPosition(250, 475)
+    color = "white"
+    sweep_speed = 10  # pixels per step, faster balls use swept collisions
+    sweep_iterations = 8  # most bounces worked out for a ball in one step
+
+
+@dataclass
+class PaddleConfig:
+    """Configuration for Paddle constants."""
+
+    size = FixedSize(100, 25)
+    initial_position = FixedPosition(200, 485)
+    speed = FixedSpeed(5, 0)
+    blink_interval = 600  # milliseconds, where each paddle's flicker out starts
+    flicker_color = "black"
+
+
+@dataclass
+class BrickConfig:
+    """Configuration for Brick constants."""
+
+    size = FixedSize(51, 25)
+    border_radius = 5
+    gap = 10  # Margin between bricks
+
+
+@dataclass
+class PowerupConfig:
+    """Configuration for Powerup constants."""
+
+    size = 10
+    default_speed = FixedSpeed(0, 2.5)
+    initial_y = 15
+    blink_interval = 100
+
+
+@dataclass
+class GameConfig:
+    """
+    Settings that change as a game is played, one per game so games never
+    share them. Each starts from its class-level config default.
+    """
+
+    ball_speed: float = BallConfig.default_speed  # speed of new and steered balls
+    paddle_speed: float = PaddleConfig.speed.x
+    # distance moved in a step over the distance at TICK_RATE, set each step
+    step_scale: ClassVar[float] = 1.0
+
+
+@dataclass(frozen=True)
+class Inputs:
+    """Player input for a single simulation step"""
+
+    left: bool = False
+    right: bool = False
+    launch: bool = False
+    pause: bool = False  # toggles pause on and off
+
+
+class BallBody(Entity):
+    """Ball rules - movement, bouncing and collisions with paddles, bricks and walls."""
+
+    store: BallStore = None  # holds the ball's state while it is in a game
+    slot: int = None
+
+    def __init__(
+        self,
+        *groups,
+        position: Position = BallConfig.initial_position,
+        radius=BallConfig.radius,
+        color=BallConfig.color,
+        speed: Speed = None,
+        rng: RandomStreams = None,
+        config: GameConfig = None,
+    ):
+        """
+        Initialize the ball.
+
+        Args:
+            groups: One or more groups to add the ball to.
+            position: Starting Position of the ball.
+            radius: Radius of the ball.
+            color: The ball's color.
+            speed: A Speed object for the ball's velocity.
+            If None, a default random direction is used.
+            rng: The game's random streams.
+            config: The game's settings.
+        """
+        super().__init__(*groups, rng=rng, config=config)
+        # copy so moving the ball never moves the position it started from
+        self.position = Position(position.x, position.y)
+        self.radius = radius
+        self.color = color
+        self.speed = (
+            speed
+            if speed
+            else Speed(
+                0,
+                -self.config.ball_speed,
+            )
+        )
+        self.rect = Box.from_center(
+            (self.position.x, self.position.y), (self.radius * 2, self.radius * 2)
+        )
+
+    @property
+    def position(self):
+        """Top left of the ball, read from the ball store while attached"""
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        if self.store is None:
+            self._position = value
+        elif value is not self._position:  # += already changed it in place
+            self._position.x, self._position.y = value.x, value.y
+
+    @property
+    def speed(self):
+        """Velocity of the ball, read from the ball store while attached"""
+        return self._speed
+
+    @speed.setter
+    def speed(self, value):
+        if self.store is None:
+            self._speed = value
+        elif value is not self._speed:  # += already changed it in place
+            self._speed.x, self._speed.y = value.x, value.y
+
+    @property
+    def rect(self):
+        """Collision box of the ball, read from the ball store while attached"""
+        return self._rect
+
+    @rect.setter
+    def rect(self, value):
+        if self.store is None:
+            self._rect = value
+        else:
+            self._rect.x, self._rect.y = value.x, value.y
+            self._rect.width, self._rect.height = value.width, value.height
+
+    def attach(self, store: BallStore, slot: int):
+        """Point the ball's state at its slot in a ball store"""
+        self.store = store
+        self.slot = slot
+        self._position = VectorView(store.x, store.y, slot)
+        self._speed = VectorView(store.speed_x, store.speed_y, slot)
+        self._rect = BoxView(store, slot)
+
+    def detach(self):
+        """Copy the ball's state out of its ball store"""
+        self.store = None
+        self.slot = None
+        self._position = Position(self._position.x, self._position.y)
+        self._speed = Speed(self._speed.x, self._speed.y)
+        self._rect = Box(*self._rect)
+
+    def kill(self):
+        """Remove the ball from its groups and its ball store"""
+        super().kill()
+        if self.store is not None:
+            self.store.remove(self)
+
+    def increase_speed(self, speed=None):
+        """Increase the ball's current speed by a factor without exceeding max_speed."""
+        if not speed:
+            factor = 1.5
+            self.config.ball_speed = min(
+                self.config.ball_speed * factor, BallConfig.max_speed
+            )
+
+            if self.speed.y == 0:
+                self.speed.y = min(
+                    -self.config.ball_speed * factor, BallConfig.max_speed
+                )
+            else:
+                self.speed.y = min(self.speed.y * factor, BallConfig.max_speed)
+        else:
+            self.speed.y = speed
+            self.config.ball_speed = speed
+        self.speed.x = 0
+
+    def move(self, screen_state):
+        """
+        Handles movement and collision with walls, paddle, and bricks.
+
+        Args:
+            screen_state: The current game state (including score, lives, etc.).
+
+        Returns the updated screen_state after handling collisions and possible life loss.
+        """
+        # only interact with the last paddle, in case of powerup paddle
+        paddle = screen_state.paddle_group.sprites()[-1]
+
+        if self.is_fast():
+            screen_state.score += self.sweep(screen_state)
+        else:
+            # Update position
+            self.update_position()
+
+            # Handle collisions
+            self.handle_wall_collisions()
+            self.handle_paddle_collision(paddle)
+
+            points = self.handle_brick_collisions(screen_state.bricks)
+            screen_state.score += points
+
+        # Handle bottom screen collision (losing a life or ending the game)
+        if self.position.y >= (paddle.rect.bottom + self.radius):
+            group = self.groups()[0]
+            if len(group.sprites()) > 1:
+                # There's more balls, losing this one doesn't lose a life
+                self.kill()
+            else:
+                screen_state.lose_life()
+                # this is the only ball on the screen
+
+        return screen_state
+
+    def is_fast(self) -> bool:
+        """Whether the ball moves far enough in a step to need swept collisions"""
+        limit = BallConfig.sweep_speed / self.config.step_scale
+        return abs(self.speed.x) > limit or abs(self.speed.y) > limit
+
+    def sweep(self, screen_state) -> int:
+        """
+        Move the ball through one step along its path, bouncing off the walls,
+        paddle and bricks in the order it reaches them, so a fast ball cannot
+        pass through anything between two positions.
+        The rest of the step is dropped after BallConfig.sweep_iterations bounces.
+
+        Args:
+            screen_state: The current game state, for the paddles and bricks.
+
+        Returns the points scored.
+        """
+        paddle = screen_state.paddle_group.sprites()[-1]
+        points = 0
+        remaining = 1.0  # fraction of the step left to move
+        for _ in range(BallConfig.sweep_iterations):
+            x = self.position.x + self.radius
+            y = self.position.y + self.radius
+            dx = self.speed.x * remaining * self.config.step_scale
+            dy = self.speed.y * remaining * self.config.step_scale
+            t, normals, target = self.first_contact(
+                x, y, dx, dy, paddle, screen_state.bricks
+            )
+            self.position.x += dx * t
+            self.position.y += dy * t
+            if target is None:
+                break
+            remaining *= 1 - t
+
+            if target == "wall":
+                self.play_sound("wall")
+            elif target is paddle:
+                self.play_sound("paddle")
+            else:
+                for brick in target:
+                    points += brick.hit()
+                    self.play_sound("brick")
+            for nx, ny in normals:
+                self.reflect(nx, ny)
+            if target is paddle and normals[0][1] < 0:
+                # landed on top, steer by where the ball hit the paddle
+                offset = self.position.x + self.radius - paddle.rect.centerx
+                self.speed.x = max(
+                    -BallConfig.max_speed,
+                    min(
+                        self.config.ball_speed * (offset / (paddle.rect.width / 2)),
+                        BallConfig.max_speed,
+                    ),
+                )
+        self.rect.x = round_pixel(self.position.x)
+        self.rect.y = round_pixel(self.position.y)
+        return points
+
+    def first_contact(self, x, y, dx, dy, paddle, bricks) -> tuple:
+        """
+        Find what a ball centered on (x, y) reaches first moving by (dx, dy).
+        Returns the fraction of the move before contact, the surface normals
+        touched and "wall", the paddle or a list of bricks, or (1, [], None)
+        when the path is clear.
+        """
+        radius = self.radius
+        first = (1.0, [], None)
+
+        # walls and ceiling, a ball already past one bounces straight away
+        for move, distance, normal in (
+            (dx, radius - x, (1.0, 0.0)),
+            (dx, screen_size.width - radius - x, (-1.0, 0.0)),
+            (dy, radius - y, (0.0, 1.0)),
+        ):
+            if move * (normal[0] + normal[1]) < 0:
+                t = max(distance / move, 0.0)
+                if t < first[0]:
+                    first = (t, [normal], "wall")
+
+        if dy > 0:
+            contact = sweep_circle_box(x, y, dx, dy, radius, paddle.rect)
+            if contact and contact[0] < first[0]:
+                first = (contact[0], [contact[1:]], paddle)
+
+        # bricks in the area the ball passes over, all hit at once on a tie
+        area = Box(
+            min(x, x + dx) - radius - 1,
+            min(y, y + dy) - radius - 1,
+            abs(dx) + 2 * radius + 2,
+            abs(dy) + 2 * radius + 2,
+        )
+        if isinstance(bricks, BrickField):
+            candidates = bricks.query(area)
+        else:
+            candidates = [brick for brick in bricks if area.colliderect(brick.rect)]
+        for brick in candidates:
+            contact = sweep_circle_box(x, y, dx, dy, radius, brick.rect)
+            if contact is None or contact[0] > first[0] + 1e-9:
+                continue
+            if contact[0] < first[0] - 1e-9 or not isinstance(first[2], list):
+                first = (contact[0], [], [])
+            first[1].append(contact[1:])
+            first[2].append(brick)
+        return first
+
+    def reflect(self, nx: float, ny: float):
+        """Bounce the ball off a surface with unit normal (nx, ny)"""
+        dot = self.speed.x * nx + self.speed.y * ny
+        if dot < 0:
+            self.speed.x -= 2 * dot * nx
+            self.speed.y -= 2 * dot * ny
+
+    def update_position(self):
+        """Update the ball's position based on its speed."""
+        self.advance()
+        self.rect.x = round_pixel(self.position.x)
+        self.rect.y = round_pixel(self.position.y)
+
+    def handle_wall_collisions(self):
+        """Handle collisions with the walls and ceiling."""
+        if (
+            self.position.x <= 0
+            or self.position.x >= screen_size.width - self.rect.width
+        ):
+            self.bounce_x()
+            self.play_sound("wall")
+        if self.position.y <= 0:
+            self.bounce_y()  # Reverse vertical movement
+            self.play_sound("wall")
+
+    def handle_paddle_collision(self, paddle: "PaddleBody"):
+        """Handle collisions with the paddle"""
+        if self.speed.y > 0 and self.rect.clipline(
+            paddle.rect.topleft, paddle.rect.topright
+        ):
+            self.bounce_y()
+            self.play_sound("paddle")
+            self.position.y = paddle.rect.top - self.rect.height
+
+            # Adjust horizontal speed based on where the ball hits the paddle
+            paddle_center = paddle.rect.centerx
+            ball_center = self.rect.centerx
+            offset = ball_center - paddle_center
+            max_offset = paddle.rect.width / 2
+            self.speed.x = max(
+                -BallConfig.max_speed,
+                min(
+                    self.config.ball_speed * (offset / max_offset),
+                    BallConfig.max_speed,
+                ),
+            )
+        elif self.speed.y > 0 and (
+            self.rect.clipline(paddle.rect.topleft, paddle.rect.bottomleft)
+            or self.rect.clipline(paddle.rect.topright, paddle.rect.bottomright)
+        ):
+            self.bounce_x()
+            self.play_sound("paddle")
+
+    def handle_brick_collisions(self, bricks) -> int:
+        """Handle collisions with bricks and return points scored."""
+        points = 0
+        rect = self.rect.copy()  # plain copy, the store view is slower to read
+        if isinstance(bricks, BrickField):
+            hit_bricks = bricks.query(rect)
+        else:
+            hit_bricks = [brick for brick in bricks if rect.colliderect(brick.rect)]
+        reversed_x = False
+        reversed_y = False
+
+        for brick in hit_bricks:
+            vertical_overlap = min(
+                abs(self.rect.bottom - brick.rect.top),
+                abs(self.rect.top - brick.rect.bottom),
+            )
+            horizontal_overlap = min(
+                abs(self.rect.right - brick.rect.left),
+                abs(self.rect.left - brick.rect.right),
+            )
+
+            if vertical_overlap < horizontal_overlap and not reversed_y:
+                self.bounce_y()
+                reversed_y = True
+            elif horizontal_overlap < vertical_overlap and not reversed_x:
+                self.bounce_x()
+                reversed_x = True
+
+            points += brick.hit()
+
+            # Play sound effect for each brick hit
+            self.play_sound("brick")
+        return points
+
+    def bounce_x(self):
+        """Reverse the horizontal direction of the ball."""
+        if self.speed.x == 0:
+            self.speed.x = self.rng.physics.choice([-self.speed.x, self.speed.x])
+        else:
+            self.speed.x *= -1
+        self.update_position()
+
+    def bounce_y(self):
+        """Reverse the vertical direction of the ball."""
+        self.speed.y *= -1
+        self.update_position()
+
+    def reset_position(self):
+        """Resets ball to starting position and waits for launch."""
+        self.speed = Speed(0, -self.speed.y)
+        self.position = Position(
+            BallConfig.initial_position.x, BallConfig.initial_position.y
+        )
+        self.rect.center = (self.position.x, self.position.y)
+
+
+class PaddleBody(Entity):
+    """Paddle rules - movement inside the screen and temporary powerup paddles"""
+
+    def __init__(
+        self,
+        *groups,
+        color="white",
+        x_position: int = None,
+        width: int = None,
+        timeout: int = None,
+        config: GameConfig = None,
+    ):
+        """
+        Initialize the paddle.
+
+        Args:
+            groups: One or more groups to add the paddle to.
+            color: The paddle's color. Defaults to white.
+            x_position: Optional x-coordinate for the paddle.
+                If None, uses PaddleConfig's initial position.
+            width: Optional width for the paddle. If None, uses PaddleConfig's default width.
+            timeout: If set, the paddle disappears after 'timeout' milliseconds (used for powerups).
+            config: The game's settings.
+        """
+        super().__init__(*groups, config=config)
+        self.size = Size(
+            width if width else PaddleConfig.size.width, PaddleConfig.size.height
+        )
+        self.position = Position(
+            x_position if x_position else PaddleConfig.initial_position.x,
+            PaddleConfig.initial_position.y,
+        )
+        self.color = color
+        self.speed = Speed(self.config.paddle_speed, 0)
+        self.timeout = timeout
+        self.rect = Box(
+            self.position.x, self.position.y, self.size.width, self.size.height
+        )
+
+    def increase_speed(self):
+        """Increase the paddle's speed by one step"""
+        self.speed.x += 1
+        self.config.paddle_speed = self.speed.x  # for paddles added later
+
+    def reset_position(self):
+        """Reset the paddle to its initial position."""
+        self.position.x = PaddleConfig.initial_position.x
+        self.rect.topleft = (
+            PaddleConfig.initial_position.x,
+            PaddleConfig.initial_position.y,
+        )
+
+    def move_left(self):
+        """Move the paddle to the left"""
+        self.advance(-1)
+        self.position.x = max(
+            0, min(screen_size.width - self.rect.width, self.position.x)
+        )
+        self.rect.x = round_pixel(self.position.x)
+
+    def move_right(self):
+        """Move the paddle to the right"""
+        self.advance()
+        self.position.x = max(
+            0, min(screen_size.width - self.rect.width, self.position.x)
+        )
+        self.rect.x = round_pixel(self.position.x)
+
+    def change_color(self):
+        """Hook for renderers to flicker temporary paddles out"""
+
+    def check_timeout(self, time: int):
+        """Check if it's time for a temp paddle to die or change color"""
+        if time >= self.timeout:
+            self.kill()
+        elif time >= self.timeout - (3 * 1000):
+            # in the last 3 seconds of its life, flicker out
+            self.change_color()
+
+
+class BrickBody(Entity):
+    """
+    Brick rules for a single brick - points, multi-hit bricks and removal on collision.
+    The game keeps its bricks in a BrickField, which follows the same rules.
+    """
+
+    def __init__(
+        self,
+        *groups,
+        color,
+        position: Position | tuple = FixedPosition(0, 0),
+        texture: bool = False,
+    ):
+        """
+        Initialize a Brick.
+
+        Args:
+            groups: Groups to add the brick to.
+            color: The color of the brick.
+            position: The position where the brick is placed.
+            texture: If True, marks the brick as unbreakable and applies a texture.
+        """
+        super().__init__(*groups)
+        if isinstance(position, tuple):
+            self.position = Position(position[0], position[1])
+        else:
+            self.position = position.copy()
+        self.color = color
+        self.size = BrickConfig.size
+        self.breakable = not texture  # Bricks are breakable by default
+        self.rect = Box(
+            self.position.x, self.position.y, self.size.width, self.size.height
+        )
+        self.points = brick_points(color)
+
+    def hit(self) -> int:
+        """Actions when bricks are hit by the ball"""
+        if not self.breakable:
+            # Unbreakable bricks do not get destroyed, they crack instead.
+            self.breakable = True
+            return 0
+        self.kill()  # remove the brick from the game
+        return self.points
+
+
+def create_brick_layout(
+    rows: int,
+    cols: int,
+    level: int,
+    rng: RandomStreams = None,
+    field_type: type = BrickField,
+    field: BrickField = None,
+) -> BrickField:
+    """
+    Order and center the brick grid layout with dynamic colors.
+    A fixed percentage per level (10% per level, capped at 100%)
+    are randomly marked as multi-hit.
+
+    Args:
+        rows: Number of rows in the brick layout.
+        cols: Number of columns in the brick layout.
+        level: The current game level, sets the percentage of unbreakable bricks.
+        rng: The game's random streams, the layout stream picks the design.
+        field_type: The BrickField class to fill, renderers use a drawable one.
+        field: A field to clear and refill instead of building a new one.
+    """
+    rng = Entity.rng if rng is None else rng
+    offset = BrickConfig.gap  # Margin between bricks
+
+    total = rows * cols  # For 6 rows x 8 cols, total is 48.
+    chance = min(level * 0.1, 1.0)
+    extra_count = round(total * chance)
+
+    # Create a list of indices and randomly shuffle it.
+    indices = list(range(total))
+    rng.layout.shuffle(indices)
+    # Select exactly extra_count indices that will be 'unbreakable'.
+    selected = set(indices[:extra_count])
+
+    # Calculate the total brick area width
+    brick_area_width = cols * (BrickConfig.size.width + offset) - offset
+
+    # Center bricks horizontally, account for top margin
+    left = (screen_size.width - brick_area_width) // 2
+    top = BrickConfig.size.height * (offset // 5)
+    if field is None:
+        field = field_type(
+            rows,
+            cols,
+            left=left,
+            top=top,
+            size=(BrickConfig.size.width, BrickConfig.size.height),
+            gap=offset,
+        )
+    else:
+        field.left, field.top = left, top
+        field.allocate(rows, cols)
+
+    design = generate_random_design(rows, cols, rng.layout)
+    for index, (row, col) in enumerate(design):
+        color = assign_color(rows, row)
+        # Mark this brick as extra durable if its index is in the selected set.
+        field.place(row, col, color, brick_points(color), unbreakable=index in selected)
+
+    return field
+
+
+def brick_points(color) -> int:
+    """Points scored for breaking a brick of the given color"""
+    rgb = named_colors.get(color) if isinstance(color, str) else tuple(color)[:3]
+    if rgb == named_colors["red"]:
+        return 3
+    if rgb == named_colors["yellow"]:
+        return 2
+    return 1
+
+
+def assign_color(rows: int, row: int) -> str:
+    """
+    Determine the brick's color based on its row position.
+
+    Args:
+        rows: Total number of rows.
+        row: The row index for the current brick.
+    """
+    first_quarter = max(1, rows // 4)
+    if row < first_quarter:
+        # Red occupies the first quarter
+        color = "red"
+    elif row < first_quarter + max(1, rows // 3):
+        # Yellow occupies the next third
+        color = "yellow"
+    else:
+        # Rest are green
+        color = "green"
+    return color
+
+
+def generate_random_design(rows: int, cols: int, rng: random.Random):
+    """
+    Generate a list of row-col indices forming a random shape within a given grid.
+    The shape can be a triangle or diagonal pattern.
+    """
+    shape_type = rng.choice(
+        ["rtriangle", "ltriangle", "utriangle", "dtriangle", "ldiagonal", "rdiagonal"]
+    )
+    selected_indices = set()
+
+    if shape_type == "rtriangle":
+        for r in range(rows):
+            for c in range(r + 1):  # Creates a right triangle shape
+                selected_indices.add((r, c))
+    elif shape_type == "ltriangle":
+        for r in range(rows):
+            for c in range(
+                cols - r - 1, cols
+            ):  # Adjusts the column to create a left triangle
+                selected_indices.add((r, c))
+    if shape_type == "utriangle":
+        mid_col = 4  # middle column to center the triangle
+        for r in range(rows):
+            # Calculate the width of the triangle at each row
+            width = r * 2  # Increase the width as the row number increases
+            start_col = mid_col - (width // 2)  # Start of the base of the triangle
+            end_col = mid_col + (width // 2)  # End of the base of the triangle
+
+            # Add points within the current row's triangle width
+            for c in range(start_col, end_col):
+                if 0 <= c < cols:
+                    selected_indices.add((r, c))
+    elif shape_type == "dtriangle":
+        mid_col = 4  # middle column to center the triangle
+        for r in range(rows):
+            # Calculate the width of the triangle at each row
+            width = (rows - r) * 2 - 1  # Decrease the width as the row number increases
+            start_col = mid_col - (width // 2)  # Start of the base of the triangle
+            end_col = mid_col + (width // 2)  # End of the base of the triangle
+
+            # Add points within the current row's triangle width
+            for c in range(start_col, end_col):
+                if 0 <= c < cols:
+                    selected_indices.add((r, c))
+    elif shape_type == "ldiagonal":
+        thickness = rng.randint(3, 5)
+        for r in range(rows):
+            for c in range(cols):
+                if abs((r - c) % rows) < thickness:  # Randomized diagonal thickness
+                    selected_indices.add((r, c))
+    elif shape_type == "rdiagonal":
+        thickness = rng.randint(3, 5)
+        for r in range(rows):
+            for c in range(cols):
+                if abs((r + c) % rows - (rows - 1)) < thickness:
+                    selected_indices.add((r, c))
+
+    return list(selected_indices)
+
+
+class PowerUpBody(Entity):
+    """A generic powerup that falls and triggers a power when the paddle catches it"""
+
+    def __init__(
+        self,
+        *groups,
+        power=lambda: None,
+        shape: Literal["circle", "rectangle"] = "circle",
+        rng: RandomStreams = None,
+        config: GameConfig = None,
+    ):
+        """
+        Initialize a generic powerup.
+
+        Args:
+            groups: One or more groups to add the powerup to.
+            power: A callable to execute when the powerup is collected.
+            shape: The shape of the powerup ('circle' or 'rectangle').
+            rng: The game's random streams.
+            config: The game's settings.
+        """
+        super().__init__(*groups, rng=rng, config=config)
+        self.position = Position(
+            self.rng.powerups.randint(
+                PowerupConfig.size * 5, screen_size.width - PowerupConfig.size * 5
+            ),
+            PowerupConfig.initial_y,
+        )
+        self.speed = PowerupConfig.default_speed.copy()
+        self.collect = power
+        self.shape = shape
+        width = PowerupConfig.size * (2 if shape == "circle" else 4)
+        self.rect = Box.from_center(
+            (self.position.x, self.position.y), (width, PowerupConfig.size * 2)
+        )
+
+    def move(self, screen_state):
+        """
+        Update the powerup's state: update position, handle paddle collision,
+        and self-destruction if it falls off-screen.
+        """
+        # Update position
+        self.update_position()
+
+        # Only collide with the last paddle in the group
+        paddle = screen_state.paddle_group.sprites()[-1]
+        self.handle_paddle_collision(paddle)
+
+        if self.position.y >= paddle.position.y:
+            self.kill()
+
+    def update_position(self):
+        """Update the powerup's position based on its speed."""
+        self.advance()
+        self.rect.y = round_pixel(self.position.y)
+
+    def handle_paddle_collision(self, paddle: PaddleBody):
+        """Handle collisions with the paddle
+        If collision is detected while falling,
+        trigger the powerup's effect and remove it."""
+        if self.speed.y > 0 and self.rect.colliderect(paddle.rect):
+            self.play_sound("powerup")
+            self.collect()
+            self.kill()
+
+
+class ExtraLifeBody(Entity):
+    """A powerup that gives the player an extra life."""
+
+    def __init__(
+        self,
+        *groups,
+        power=lambda: None,
+        rng: RandomStreams = None,
+        config: GameConfig = None,
+    ):
+        super().__init__(*groups, rng=rng, config=config)
+        self.rect = Box.from_center(
+            (self.rng.powerups.randint(30, screen_size.width - 30), 15), (20, 20)
+        )
+        self.speed = Speed(0, 4.5)  # Falling speed
+        self.collect = power
+
+    def move(self, screen_state):
+        """Move the powerup downwards and handle collision with the paddle."""
+        self.rect.y = round_pixel(self.rect.y + self.speed.y)
+
+        # If the powerup falls off screen, kill it
+        paddle = screen_state.paddle_group.sprites()[-1]
+        if self.rect.top > paddle.position.y:
+            self.kill()
+
+        # Only collide with the last paddle in the group
+        self.handle_paddle_collision(paddle)
+
+    def handle_paddle_collision(self, paddle):
+        """Call the powerup's effect if it collides with the paddle."""
+        if self.rect.colliderect(paddle.rect):
+            self.play_sound("powerup")
+            self.collect()
+            self.kill()
+
+
+class PowerDownBody(Entity):
+    """An obstacle that causes the player to lose a life"""
+
+    def __init__(
+        self,
+        *groups,
+        power=lambda: None,
+        rng: RandomStreams = None,
+        config: GameConfig = None,
+    ):
+        super().__init__(*groups, rng=rng, config=config)
+        self.position = Position(
+            self.rng.powerups.randint(
+                PowerupConfig.size * 5, screen_size.width - PowerupConfig.size * 5
+            ),
+            PowerupConfig.initial_y,
+        )
+        self.speed = PowerupConfig.default_speed.copy()
+        self.collect = power
+        self.exploded = False
+        self.explode_time = None
+
+        # The collide rectangle is smaller than the bomb image
+        self.rect = Box.from_center(
+            (self.position.x, self.position.y),
+            (PowerupConfig.size * 4, PowerupConfig.size * 4),
+        )
+
+    def move(self, screen_state):
+        """Handles movement, explosion timing and collision with the paddle."""
+        now = screen_state.clock
+        if self.exploded:
+            if self.explode_time is None:
+                self.explode_time = now
+            if (self.explode_time + (PowerupConfig.blink_interval * 4)) < now:
+                self.collect()
+                self.kill()
+
+        # Update position
+        self.update_position()
+
+        # Only collide with the last paddle in the group
+        paddle = screen_state.paddle_group.sprites()[-1]
+        self.handle_paddle_collision(paddle)
+
+        if self.position.y >= paddle.position.y:
+            self.kill()
+
+    def update_position(self):
+        """Update the powerup's position based on its speed."""
+        self.advance()
+        self.rect.y = round_pixel(self.position.y)
+
+    def handle_paddle_collision(self, paddle: PaddleBody):
+        """Check for collision with the paddle. If collided, trigger explosion."""
+        if self.speed.y > 0 and self.rect.colliderect(paddle.rect):
+            self.explode()
+
+    def explode(self):
+        """Stop the powerdown the player hit, its power fires shortly after"""
+        self.exploded = True
+        self.speed = Speed(0, 0)
+
+
+class Simulation:
+    """
+    Headless game state and rules.
+    Advance it with step(), renderers subclass it and swap the entity types
+    for their sprite versions.
+    """
+
+    # Entity types, renderers replace these with their sprite subclasses
+    group_type = Group
+    ball_type = BallBody
+    paddle_type = PaddleBody
+    field_type = BrickField
+    powerup_type = PowerUpBody
+    extra_life_type = ExtraLifeBody
+    powerdown_type = PowerDownBody
+
+    level_wait_time = 3000  # milliseconds between clearing a level and relaunch
+    pool_capacity = 16  # killed balls and powerups of each type kept for reuse
+    per_ball_limit = 1  # most balls moved one at a time, more use the batch
+
+    def __init__(self, seed: int = None):
+        """
+        Reset the game state for a new game.
+
+        Args:
+            seed: Seed for the game's random streams, the same seed and inputs
+            replay the same game. A random seed is picked if None.
+        """
+        self.rng = RandomStreams(seed)
+        self.config = GameConfig()
+        self.level = 1
+        self.score = 0  # Default starting score
+        self.lives = 3  # Default starting lives
+        self.time = 0  # time spent with the ball in play
+        self.clock = 0  # time spent unpaused
+        self.frames = 0
+        self.new_level_wait = False
+        self.level_wait = 0
+        self.bricks = self.create_bricks()
+        self.ball_group = self.group_type()
+        self.ball_store = BallStore()
+        self.powerup_group = self.group_type()
+        self.paddle_group = self.group_type()
+        self.pools = {
+            kind: Pool(kind, self.pool_capacity)
+            for kind in (
+                self.ball_type,
+                self.powerup_type,
+                self.powerdown_type,
+                self.extra_life_type,
+            )
+        }
+        self.ball = self.create_ball()
+        self.paddle = self.paddle_type(self.paddle_group, config=self.config)
+
+        # Power-up spawn timing
+        self.min_wait_time = 15 * 1000  # 15 seconds in milliseconds
+        self.max_wait_time = 30 * 1000  # 30 seconds in milliseconds
+        self.next_powerup_time = self.time + self.rng.powerups.randint(
+            self.min_wait_time, self.max_wait_time
+        )
+
+        # State flags
+        self.launched = False
+        self.paused = False
+        self.game_is_over = False
+
+        self.powerup_choices = [
+            lambda: self.spawn(
+                self.powerup_type,
+                self.powerup_group,
+                power=self.add_paddle,
+                shape="rectangle",
+            ),
+            lambda: self.spawn(
+                self.powerup_type, self.powerup_group, power=self.add_ball
+            ),
+            lambda: self.spawn(
+                self.powerdown_type, self.powerup_group, power=self.lose_life
+            ),
+            lambda: self.spawn(
+                self.extra_life_type, self.powerup_group, power=self.add_life
+            ),
+        ]
+
+    def create_bricks(self) -> BrickField:
+        """Lay out the current level's bricks, refilling the last level's field"""
+        bricks = create_brick_layout(
+            rows=6,
+            cols=8,
+            level=self.level,
+            rng=self.rng,
+            field_type=self.field_type,
+            field=getattr(self, "bricks", None),
+        )
+        # area covered by bricks, only balls inside it need brick checks
+        self.brick_region = bricks.live_region()
+        return bricks
+
+    def create_ball(self, **kwargs):
+        """Add a ball to the game and move its state into the ball store"""
+        ball = self.spawn(self.ball_type, self.ball_group, **kwargs)
+        self.ball_store.add(ball)
+        return ball
+
+    def spawn(self, kind: type, *groups, **kwargs):
+        """A ball or powerup of a kind from its pool, reused if one was killed"""
+        return self.pools[kind].acquire(
+            *groups, rng=self.rng, config=self.config, **kwargs
+        )
+
+    def pool_stats(self) -> dict[str, PoolStats]:
+        """Occupancy and reuse of each pool, by entity type name"""
+        return {kind.__name__: pool.stats() for kind, pool in self.pools.items()}
+
+    def step(self, inputs: Inputs = Inputs(), dt: float = FRAME_TIME):
+        """
+        Advance the game by one fixed step.
+
+        Args:
+            inputs: The player's input for this step.
+            dt: Milliseconds of game time the step covers, pieces move
+            dt / FRAME_TIME times their speed.
+        """
+        self.config.step_scale = dt / FRAME_TIME
+        if inputs.pause:
+            if self.paused:
+                self.resume_game()
+            elif self.launched:
+                self.pause_game()
+        if inputs.launch and not self.paused and not self.new_level_wait:
+            self.launch_ball()
+
+        if self.launched and not self.paused and not self.game_is_over:
+            self.move_game_pieces(inputs)
+
+        self.update()
+
+        if not self.paused:
+            self.frames += 1
+            self.clock += dt
+            if self.launched:
+                self.time += dt
+            if self.new_level_wait:
+                self.level_wait -= dt
+
+    def move_game_pieces(self, inputs: Inputs):
+        """Move the paddles, balls, and powerups"""
+        if inputs.left:
+            for paddle in self.paddle_group.sprites():
+                paddle.move_left()
+        if inputs.right:
+            for paddle in self.paddle_group.sprites():
+                paddle.move_right()
+
+        self.move_balls()
+
+        for powerup in self.powerup_group.sprites():
+            powerup.move(self)
+
+    def move_balls(self):
+        """
+        Move every ball at once with the ball store's batched physics.
+        Same rules as BallBody.move, only balls near the bricks or past the
+        paddle need any per-ball work. The batch costs about as much as
+        moving two balls one at a time, so up to per_ball_limit balls are
+        moved one at a time instead.
+        """
+        if len(self.ball_group) <= self.per_ball_limit:
+            for ball in self.ball_group.sprites():
+                ball.move(self)
+            return
+
+        store = self.ball_store
+        # fast balls could pass through bricks or the paddle between steps
+        store.step_scale = self.config.step_scale
+        fast = store.fast(BallConfig.sweep_speed / store.step_scale)
+        slow = None
+        if fast.any():
+            slow = store.alive & ~fast
+            for slot in np.flatnonzero(fast):
+                self.score += store.bodies[slot].sweep(self)
+
+        store.integrate(slow)
+        if store.bounce_walls(screen_size.width, slow):
+            self.play_sound("wall")
+
+        # only interact with the last paddle, in case of powerup paddle
+        paddle = self.paddle_group.sprites()[-1]
+        if store.reflect_paddle(
+            paddle, self.config.ball_speed, BallConfig.max_speed, slow
+        ):
+            self.play_sound("paddle")
+
+        for ball in store.overlapping(self.brick_region, slow):
+            self.score += ball.handle_brick_collisions(self.bricks)
+
+        for ball in store.fallen(paddle.rect.bottom):
+            if len(self.ball_group) > 1:
+                # There's more balls, losing this one doesn't lose a life
+                ball.kill()
+            else:
+                self.lose_life()
+
+    def update(self):
+        """Update the game based on the current state"""
+        if self.game_is_over or self.paused:
+            return
+
+        # broke all bricks, go again
+        if len(self.bricks) == 0:
+            self.new_level_wait = True
+            self.level_wait = self.level_wait_time
+            self.level += 1
+            self.max_wait_time -= 1000
+            self.min_wait_time -= 1000
+            self.min_wait_time = max(self.min_wait_time, 0)
+            self.max_wait_time = max(self.max_wait_time, 1000)
+            for ball in self.ball_group.sprites():
+                ball.reset_position()
+                ball.speed = Speed(0, 0)
+            for paddle in self.paddle_group.sprites():
+                paddle.reset_position()
+            self.launched = False
+            self.bricks = self.create_bricks()
+            self.new_level()
+
+        if self.new_level_wait and self.level_wait <= 0:
+            for ball in self.ball_group.sprites():
+                ball.increase_speed(
+                    pow(1.375, self.level) + 3
+                )  # Increase speed for each ball
+            if self.level % 2 == 0:
+                for paddle in self.paddle_group.sprites():
+                    paddle.increase_speed()
+            self.launch_ball()
+            self.new_level_wait = False
+            self.level_started()
+
+        if not self.launched:
+            # game state can only change if we're launched
+            return
+
+        if (
+            self.time >= self.next_powerup_time
+            and len(self.powerup_group.sprites()) == 0
+        ):
+            self.add_powerup()
+
+        for paddle in self.paddle_group.sprites():
+            if paddle.timeout:
+                # temp paddle, update it
+                paddle.check_timeout(self.time)
+
+    def new_level(self):
+        """Hook for renderers, called after a cleared level builds new bricks"""
+
+    def level_started(self):
+        """Hook for renderers, called when the ball launches on a new level"""
+
+    def play_sound(self, name: str):
+        """Hook for renderers to play a sound effect, the simulation is silent"""
+
+    def add_powerup(self):
+        """
+        Choose a random powerup and add it to the screen
+        Only allow one paddle powerup at a time to avoid confusion
+        """
+        if len(self.paddle_group.sprites()) > 1:
+            random_powerup = self.rng.powerups.choice(self.powerup_choices[1:])
+        else:
+            random_powerup = self.rng.powerups.choice(self.powerup_choices)
+        random_powerup()
+
+        self.next_powerup_time = self.time + self.rng.powerups.randint(
+            self.min_wait_time, self.max_wait_time
+        )
+
+    def launch_ball(self):
+        """Trigger ball launch."""
+        self.launched = True
+
+    def pause_game(self):
+        """Pause the game."""
+        self.paused = True
+
+    def resume_game(self):
+        """Resume the game."""
+        self.paused = False
+
+    def game_over(self):
+        """Mark game as over."""
+        self.game_is_over = True
+        self.play_sound("game_over")
+
+    def add_ball(self):
+        """Add a ball to the game"""
+        try:
+            power_up = self.powerup_group.sprites()[0]
+        except IndexError:
+            # pull from where the paddle is if you can't find the powerup
+            power_up = self.paddle_group.sprites()[0]
+        power_up_position = power_up.rect
+
+        # Create the new ball with the current speed
+        self.create_ball(
+            position=Position(power_up_position.center[0], power_up_position.center[1]),
+            color=self.rng.cosmetics.choice(color_names),
+            speed=Speed(0, self.config.ball_speed),
+        )
+
+    def add_paddle(self):
+        """
+        Add a new paddle to the screen as a powerup
+
+        This paddle is twice as big and appears centered on the original
+        """
+        self.paddle_type(
+            self.paddle_group,
+            x_position=self.paddle.position.x
+            - (PaddleConfig.size.width // 2),  # in the center of the current paddle
+            width=PaddleConfig.size.width * 2,  # twice as big
+            color=self.rng.cosmetics.choice(color_names),
+            config=self.config,
+            timeout=self.time
+            + self.rng.powerups.randint(
+                self.min_wait_time, self.max_wait_time
+            ),  # when it should disappear
+        )
+
+    def add_life(self):
+        """Adds a life to player's existing quantity"""
+        self.lives += 1
+
+    def lose_life(self):
+        """Lose a life"""
+        self.lives -= 1
+
+        if self.lives < 1:
+            self.game_over()
+            return
+
+        self.play_sound("life_lost")
+        for ball in self.ball_group.sprites():
+            ball.reset_position()
+        for paddle in self.paddle_group.sprites():
+            paddle.reset_position()
+        for powerup in self.powerup_group.sprites():
+            powerup.kill()
+
+        self.launched = False
+
+    # Game fields saved as they are by snapshot()
+    snapshot_fields = (
+        "level",
+        "score",
+        "lives",
+        "time",
+        "clock",
+        "frames",
+        "new_level_wait",
+        "level_wait",
+        "min_wait_time",
+        "max_wait_time",
+        "next_powerup_time",
+        "launched",
+        "paused",
+        "game_is_over",
+    )
+
+    def snapshot(self) -> dict:
+        """
+        Save the full game state as plain data, e.g. for replay keyframes.
+        Includes the random streams and the game's config.
+        """
+        store = self.ball_store
+        return {
+            "fields": {name: getattr(self, name) for name in self.snapshot_fields},
+            "config": asdict(self.config),
+            "rng": {
+                name: getattr(self.rng, name).getstate() for name in RandomStreams.names
+            },
+            "brick_region": list(self.brick_region),
+            "bricks": self.save_bricks(),
+            "store": {"capacity": len(store.alive), "free": list(store.free)},
+            "balls": [
+                {
+                    "slot": ball.slot,
+                    "position": [ball.position.x, ball.position.y],
+                    "speed": [ball.speed.x, ball.speed.y],
+                    "rect": list(ball.rect),
+                    "radius": ball.radius,
+                    "color": plain_color(ball.color),
+                }
+                for ball in self.ball_group
+            ],
+            "paddles": [
+                {
+                    "position": [paddle.position.x, paddle.position.y],
+                    "rect": list(paddle.rect),
+                    "color": plain_color(paddle.color),
+                    "timeout": paddle.timeout,
+                }
+                for paddle in self.paddle_group
+            ],
+            "powerups": [
+                {
+                    "power": powerup.collect.__name__,
+                    "shape": getattr(powerup, "shape", None),
+                    "position": (
+                        [powerup.position.x, powerup.position.y]
+                        if hasattr(powerup, "position")
+                        else None
+                    ),
+                    "speed": [powerup.speed.x, powerup.speed.y],
+                    "rect": list(powerup.rect),
+                    "exploded": getattr(powerup, "exploded", False),
+                    "explode_time": getattr(powerup, "explode_time", None),
+                }
+                for powerup in self.powerup_group
+            ],
+        }
+
+    def save_bricks(self) -> dict:
+        """The brick field as plain data"""
+        bricks = self.bricks.save()
+        bricks["palette"] = [plain_color(color) for color in bricks["palette"]]
+        return bricks
+
+    def restore(self, snapshot: dict):
+        """
+        Put the game back in a state saved by snapshot().
+        The existing groups and brick field are refilled, so renderers keep
+        drawing them.
+        """
+        for name, value in snapshot["fields"].items():
+            setattr(self, name, value)
+        for name, value in snapshot["config"].items():
+            setattr(self.config, name, value)  # entities share the game's config
+
+        bricks = dict(snapshot["bricks"])
+        bricks["palette"] = [stored_color(color) for color in bricks["palette"]]
+        self.bricks.load(bricks)
+        self.brick_region = Box(*snapshot["brick_region"])
+
+        for ball in self.ball_group.sprites():
+            ball.kill()
+        self.ball_store = BallStore(snapshot["store"]["capacity"])
+        for saved in snapshot["balls"]:
+            ball = self.spawn(
+                self.ball_type,
+                self.ball_group,
+                position=Position(*saved["position"]),
+                radius=saved["radius"],
+                color=stored_color(saved["color"]),
+                speed=Speed(*saved["speed"]),
+            )
+            ball.rect = Box(*saved["rect"])
+            self.ball_store.add(ball, saved["slot"])
+        self.ball_store.free = list(snapshot["store"]["free"])
+
+        for paddle in self.paddle_group.sprites():
+            paddle.kill()
+        for saved in snapshot["paddles"]:
+            paddle = self.paddle_type(
+                self.paddle_group,
+                color=stored_color(saved["color"]),
+                width=saved["rect"][2],
+                timeout=saved["timeout"],
+                config=self.config,
+            )
+            paddle.position = Position(*saved["position"])
+            paddle.rect.topleft = saved["rect"][:2]
+
+        for powerup in self.powerup_group.sprites():
+            powerup.kill()
+        for saved in snapshot["powerups"]:
+            power = getattr(self, saved["power"])
+            if saved["power"] == "lose_life":
+                powerup = self.spawn(
+                    self.powerdown_type, self.powerup_group, power=power
+                )
+            elif saved["power"] == "add_life":
+                powerup = self.spawn(
+                    self.extra_life_type, self.powerup_group, power=power
+                )
+            else:
+                powerup = self.spawn(
+                    self.powerup_type,
+                    self.powerup_group,
+                    power=power,
+                    shape=saved["shape"],
+                )
+            if saved["position"] is not None:
+                powerup.position = Position(*saved["position"])
+            if saved["exploded"]:
+                powerup.explode()
+                powerup.explode_time = saved["explode_time"]
+            powerup.speed = Speed(*saved["speed"])
+            powerup.rect.topleft = saved["rect"][:2]
+
+        self.ball = next(iter(self.ball_group), None)
+        self.paddle = next(iter(self.paddle_group), None)
+
+        # last, creating the pieces above drew from the streams
+        for name, state in snapshot["rng"].items():
+            version, internal, gauss = state
+            getattr(self.rng, name).setstate((version, tuple(internal), gauss))
+
+
+def plain_color(color):
+    """A color name as is, anything else as an RGB(A) list, for saving"""
+    return color if isinstance(color, str) else list(color)
+
+
+def stored_color(color):
+    """Turn a color saved by plain_color back into a name or tuple"""
+    return color if isinstance(color, str) else tuple(color)
+
+
+def tracking_policy(state: Simulation) -> Inputs:
+    """
+    Scripted player that launches the ball and keeps the paddle under it.
+    The aim point is offset so the ball leaves the paddle at an angle.
+    """
+    paddle = state.paddle_group.sprites()[-1]
+    balls = state.ball_group.sprites()
+    if not balls:
+        return Inputs()
+    # chase whichever ball is closest to the paddle
+    ball = max(balls, key=lambda body: body.position.y)
+    # switch sides every 10 seconds of play
+    aim = paddle.rect.width // 4 * (1 if state.clock // 10_000 % 2 else -1)
+    target = ball.rect.centerx - aim
+    step = paddle.speed.x * state.config.step_scale  # how far the paddle moves
+    return Inputs(
+        left=target < paddle.rect.centerx - step,
+        right=target > paddle.rect.centerx + step,
+        launch=not state.launched,
+    )
@@ -0,0 +1,147 @@
+"""
+Display
+=======
+The game window and the logical-resolution surface every screen draws on.
+Screens always draw at screen_size, then each frame is scaled to the window
+in one pass, keeping its shape with black bars at the sides or top and bottom.
+Whole-number scales use a plain pixel scale, other sizes a smooth one, and a
+window at the logical size just gets a copy. Frames can be shown a few
+changed rects at a time instead of the whole window.
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+from dataclasses import astuple
+
+import pygame
+
+from breakout import screen_size
+
+# pylint: disable=no-member
+MOUSE_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+
+
+class Display:
+    """
+    The window and its offscreen logical surface.
+    Draw on 'surface', then call present() once per frame.
+    """
+
+    current: "Display" = None  # the open display, used to map mouse positions
+
+    def __init__(
+        self, size: tuple = astuple(screen_size), flags: int = pygame.RESIZABLE
+    ):
+        """
+        Open the window at the logical size
+
+        Args:
+            size: The logical resolution the game draws at.
+            flags: pygame.display.set_mode flags for the window.
+        """
+        self.logical_size = tuple(size)
+        self.flags = flags
+        pygame.display.init()  # does nothing if the video is already up
+        self.window = pygame.display.set_mode(self.logical_size, flags)
+        self.surface = pygame.Surface(self.logical_size).convert()
+        self.resize(self.logical_size)
+        Display.current = self
+
+    def resize(self, size: tuple):
+        """Fit the logical surface into a window of a new size"""
+        self.window = pygame.display.get_surface()
+        if self.window.get_size() != tuple(size):
+            self.window = pygame.display.set_mode(size, self.flags)
+        width, height = self.window.get_size()
+        logical_width, logical_height = self.logical_size
+        self.scale = min(width / logical_width, height / logical_height)
+        self.integer_scale = self.scale >= 1 and self.scale.is_integer()
+        self.viewport = pygame.Rect(
+            0, 0, round(logical_width * self.scale), round(logical_height * self.scale)
+        )
+        self.viewport.center = (width // 2, height // 2)
+        # the frame is scaled straight into its spot in the window
+        self.target = self.window.subsurface(self.viewport)
+        self.window.fill(pygame.Color("black"))
+        self.stale = True  # the whole window needs showing
+
+    def present(self, rects: list = None):
+        """
+        Scale the finished frame to the window and show it
+        Only the given rects of the logical surface are shown if the window is
+        up to date otherwise, e.g. the rects ScreenManager.draw changed.
+        """
+        whole = self.stale  # the borders around the frame need showing too
+        if rects is None or self.stale:
+            rects = [self.surface.get_rect()]
+            self.stale = False
+        if not rects:
+            return
+        updated = []
+        if self.viewport.size == self.logical_size:
+            for rect in rects:
+                self.target.blit(self.surface, rect, rect)
+                updated.append(rect.move(self.viewport.topleft))
+        elif self.integer_scale:
+            scale = int(self.scale)
+            for rect in rects:
+                dest = pygame.Rect(
+                    rect.x * scale,
+                    rect.y * scale,
+                    rect.width * scale,
+                    rect.height * scale,
+                )
+                pygame.transform.scale(
+                    self.surface.subsurface(rect),
+                    dest.size,
+                    self.target.subsurface(dest),
+                )
+                updated.append(dest.move(self.viewport.topleft))
+        else:
+            # smooth scaling blends neighbouring pixels, so scale the whole frame
+            pygame.transform.smoothscale(self.surface, self.viewport.size, self.target)
+            for rect in rects:
+                dest = pygame.Rect(
+                    int(rect.x * self.scale),
+                    int(rect.y * self.scale),
+                    int(rect.width * self.scale) + 2,
+                    int(rect.height * self.scale) + 2,
+                )
+                dest.move_ip(self.viewport.topleft)
+                updated.append(dest.clip(self.window.get_rect()))
+        pygame.display.update(self.window.get_rect() if whole else updated)
+
+    def to_logical(self, pos: tuple) -> tuple[int, int]:
+        """Map a window position to the logical surface"""
+        return (
+            int((pos[0] - self.viewport.x) / self.scale),
+            int((pos[1] - self.viewport.y) / self.scale),
+        )
+
+    def map_event(self, event: pygame.event.Event) -> pygame.event.Event:
+        """Move a mouse event's position onto the logical surface"""
+        unscaled = self.viewport == (0, 0, *self.logical_size)
+        if event.type not in MOUSE_EVENTS or unscaled:
+            return event
+        return pygame.event.Event(
+            event.type, {**event.dict, "pos": self.to_logical(event.pos)}
+        )
+
+
+def mouse_pos() -> tuple[int, int]:
+    """The mouse position on the logical surface"""
+    pos = pygame.mouse.get_pos()
+    if Display.current is None:
+        return pos
+    return Display.current.to_logical(pos)
@@ -1,7 +1,7 @@
 """
 Paddle
 ========
-Implements the player's paddle, allowing movement based on user input. 
+Implements the player's paddle, allowing movement based on user input.
 Handles collisions with the ball and resets position when needed.
 
 Class
@@ -19,26 +19,17 @@ Thomas Nugent
 
 """
 
-from dataclasses import astuple, dataclass
+from dataclasses import astuple
 
 import pygame
 from pygame.sprite import Sprite
 
-from breakout import Position, Size, Speed, screen_size
+from breakout.animation import Animation
+from breakout.assets import assets
+from breakout.core import GameConfig, PaddleBody, PaddleConfig
 
 
-@dataclass
-class PaddleConfig:
-    """Configuration for Paddle constants."""
-
-    size = Size(100, 25)
-    initial_position = Position(200, 485)
-    speed = Speed(5, 0)
-    blink_interval = 600  # in milliseconds
-    flicker_color = pygame.Color("black")
-
-
-class Paddle(Sprite):
+class Paddle(PaddleBody, Sprite):
     """Carries all of the characteristics of the paddle"""
 
     def __init__(
@@ -47,7 +38,8 @@ class Paddle(Sprite):
         color: pygame.Color = pygame.Color("white"),
         x_position: int = None,
         width: int = None,
-        timeout: int = None
+        timeout: int = None,
+        config: GameConfig = None,
     ):
         """
         Initialize the paddle.
@@ -59,79 +51,65 @@ class Paddle(Sprite):
                 If None, uses PaddleConfig's initial position.
             width: Optional width for the paddle. If None, uses PaddleConfig's default width.
             timeout: If set, the paddle disappears after 'timeout' milliseconds (used for powerups).
+            config: The game's settings.
         """
         super().__init__(
             *groups,
+            color=pygame.Color(color),
+            x_position=x_position,
+            width=width,
+            timeout=timeout,
+            config=config,
         )
-        self.size = Size(
-            width if width else PaddleConfig.size.width, PaddleConfig.size.height
-        )
-        self.position = Position(
-            x_position if x_position else PaddleConfig.initial_position.x,
-            PaddleConfig.initial_position.y,
-        )
-        self.color = color
-        self.speed = PaddleConfig.speed
-        self.timeout = timeout
         self.last_toggle = pygame.time.get_ticks()
+        self.blinking = False
+        self.blink_interval = PaddleConfig.blink_interval  # shrinks as it flickers
 
-        # Create the paddle surface
-        self.image = pygame.Surface(astuple(self.size))
-        self.image.fill(self.color)
-
-        # Initialize the rectangle for positioning
-        self.rect = self.image.get_rect(topleft=astuple(self.position))
-
-    def increase_speed(self):
-        """Increase the ball's current speed by a factor without exceeding max_speed."""
-        self.speed.x += 1
-        PaddleConfig.speed = self.speed
+        # Paddles of the same size and color share their color and flicker frames
+        self.flicker = paddle_animation(astuple(self.size), self.color)
+        self.image = self.flicker[0]
 
     def reset_position(self):
         """Reset the paddle to its initial position."""
-        self.image = pygame.Surface(astuple(self.size))
-        self.position.x = PaddleConfig.initial_position.x
-        self.image.fill(self.color)
-        self.rect = self.image.get_rect(
-            topleft=(PaddleConfig.initial_position.x, PaddleConfig.initial_position.y)
-        )
-
-    def move_left(self):
-        """Move the paddle to the left"""
-        self.position -= self.speed
-        self.position.x = max(
-            0, min(screen_size.width - self.rect.width, self.position.x)
-        )
-        self.rect.x = self.position.x
-
-    def move_right(self):
-        """Move the paddle to the right"""
-        self.position += self.speed
-        self.position.x = max(
-            0, min(screen_size.width - self.rect.width, self.position.x)
-        )
-        self.rect.x = self.position.x
+        super().reset_position()
+        self.image = self.flicker[0]
 
     def change_color(self):
         """Paddle powerups are temporary and should flicker out"""
         now = pygame.time.get_ticks()
-        if now - self.last_toggle > PaddleConfig.blink_interval:
-            # if it's time to toggle
-            current_color = self.image.get_at((0, 0))  # check what color we are
-            # switch to the other color
-            if current_color == self.color:
-                self.image.fill(PaddleConfig.flicker_color)
+        if not self.blinking:
+            # each flicker out starts slow
+            self.blinking = True
+            self.blink_interval = PaddleConfig.blink_interval
+        if now - self.last_toggle > self.blink_interval:
+            # if it's time to toggle, switch to the other color
+            if self.image is self.flicker[0]:
+                self.image = self.flicker[1]
             else:
-                self.image.fill(self.color)
+                self.image = self.flicker[0]
 
             # we just toggled
             self.last_toggle = now
-            PaddleConfig.blink_interval /= 1.25  # speed up the flickering
-
-    def check_timeout(self, time: int):
-        """Check if it's time for a temp paddle to die or change color"""
-        if time >= self.timeout:
-            self.kill()
-        elif time >= self.timeout - (3 * 1000):
-            # in the last 3 seconds of its life, flicker out
-            self.change_color()
+            self.blink_interval /= 1.25  # speed up the flickering
+
+
+def paddle_animation(size: tuple, color) -> Animation:
+    """A paddle in its color, then in the flicker color"""
+    colors = (pygame.Color(color), pygame.Color(PaddleConfig.flicker_color))
+    return assets.animation(
+        "paddle",
+        size,
+        lambda: [
+            assets.sprite("paddle", size, frame, lambda: draw_paddle(size, frame))
+            for frame in colors
+        ],
+        PaddleConfig.blink_interval,
+        variant=tuple(colors[0]),
+    )
+
+
+def draw_paddle(size: tuple, color: pygame.Color) -> pygame.Surface:
+    """Create a paddle surface filled with its color"""
+    image = pygame.Surface(size)
+    image.fill(color)
+    return image
@@ -0,0 +1,848 @@
+"""
+Physics
+=======
+Geometry shared by the simulation, and structure-of-arrays storage for every
+ball in a game. Balls attached to a BallStore keep their position, speed and
+rect in NumPy arrays, so movement, wall bounces and paddle reflection run as
+one batch of array operations per frame no matter how many balls are in play.
+The batch has a fixed cost of a few NumPy calls, about what moving two balls
+one at a time costs, so a game with a single ball moves it on its own.
+Bricks live in a BrickField, arrays indexed by (row, col), so a ball only
+checks the cells under it and a brick costs a few bytes.
+sweep_circle_box finds when a moving ball first touches a box, so fast balls
+can bounce off things they would otherwise jump over between steps.
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import math
+
+import numpy as np
+
+from breakout import Position
+
+
+def round_pixel(value) -> int:
+    """Round the way pygame.Rect does when an attribute is assigned"""
+    if isinstance(value, float):
+        return int(value + 0.5) if value >= 0 else int(value - 0.5)
+    return value
+
+
+class Box:
+    """
+    Axis-aligned rectangle with the parts of the pygame.Rect API the rules use.
+    Boxes behave like a 4 item sequence so pygame can still blit to them.
+    """
+
+    __slots__ = ("x", "y", "width", "height")
+
+    def __init__(self, x, y, width, height):
+        self.x = int(x)
+        self.y = int(y)
+        self.width = int(width)
+        self.height = int(height)
+
+    @classmethod
+    def from_center(cls, center: tuple, size: tuple):
+        """Create a box of the given size centered on a point"""
+        box = cls(0, 0, size[0], size[1])
+        box.center = center
+        return box
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, index):
+        return (self.x, self.y, self.width, self.height)[index]
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.width, self.height))
+
+    def __eq__(self, other):
+        try:
+            return tuple(self) == tuple(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return f"<Box({self.x}, {self.y}, {self.width}, {self.height})>"
+
+    @property
+    def left(self):
+        """Left edge"""
+        return self.x
+
+    @left.setter
+    def left(self, value):
+        self.x = round_pixel(value)
+
+    @property
+    def top(self):
+        """Top edge"""
+        return self.y
+
+    @top.setter
+    def top(self, value):
+        self.y = round_pixel(value)
+
+    @property
+    def right(self):
+        """Right edge"""
+        return self.x + self.width
+
+    @right.setter
+    def right(self, value):
+        self.x = round_pixel(value) - self.width
+
+    @property
+    def bottom(self):
+        """Bottom edge"""
+        return self.y + self.height
+
+    @bottom.setter
+    def bottom(self, value):
+        self.y = round_pixel(value) - self.height
+
+    @property
+    def centerx(self):
+        """Horizontal center"""
+        return self.x + self.width // 2
+
+    @centerx.setter
+    def centerx(self, value):
+        self.x = round_pixel(value) - self.width // 2
+
+    @property
+    def centery(self):
+        """Vertical center"""
+        return self.y + self.height // 2
+
+    @centery.setter
+    def centery(self, value):
+        self.y = round_pixel(value) - self.height // 2
+
+    @property
+    def center(self):
+        """Center point"""
+        return (self.centerx, self.centery)
+
+    @center.setter
+    def center(self, value):
+        self.centerx, self.centery = value
+
+    @property
+    def topleft(self):
+        """Top left corner"""
+        return (self.x, self.y)
+
+    @topleft.setter
+    def topleft(self, value):
+        self.left, self.top = value
+
+    @property
+    def topright(self):
+        """Top right corner"""
+        return (self.right, self.y)
+
+    @property
+    def bottomleft(self):
+        """Bottom left corner"""
+        return (self.x, self.bottom)
+
+    @property
+    def bottomright(self):
+        """Bottom right corner"""
+        return (self.right, self.bottom)
+
+    @property
+    def size(self):
+        """Width and height"""
+        return (self.width, self.height)
+
+    def copy(self):
+        """Return a new box with the same position and size"""
+        return Box(self.x, self.y, self.width, self.height)
+
+    def colliderect(self, other) -> bool:
+        """Test if two boxes overlap, edges touching do not count"""
+        return (
+            self.width > 0
+            and self.height > 0
+            and other.width > 0
+            and other.height > 0
+            and self.x < other.x + other.width
+            and self.y < other.y + other.height
+            and self.x + self.width > other.x
+            and self.y + self.height > other.y
+        )
+
+    def collidepoint(self, point) -> bool:
+        """Test if a point is inside the box"""
+        return (
+            self.x <= point[0] < self.x + self.width
+            and self.y <= point[1] < self.y + self.height
+        )
+
+    def clipline(self, start, end) -> tuple:
+        """
+        Clip a line segment to the box (Liang-Barsky)
+        Returns the clipped end points, or an empty tuple if the line misses
+        """
+        if self.width <= 0 or self.height <= 0:
+            return ()
+        x1, y1 = start
+        x2, y2 = end
+        dx = x2 - x1
+        dy = y2 - y1
+        low, high = 0.0, 1.0
+        for p, q in (
+            (-dx, x1 - self.x),
+            (dx, self.x + self.width - 1 - x1),
+            (-dy, y1 - self.y),
+            (dy, self.y + self.height - 1 - y1),
+        ):
+            if p == 0:
+                if q < 0:
+                    return ()
+                continue
+            t = q / p
+            if p < 0:
+                low = max(low, t)
+            else:
+                high = min(high, t)
+            if low > high:
+                return ()
+        return (
+            (round(x1 + low * dx), round(y1 + low * dy)),
+            (round(x1 + high * dx), round(y1 + high * dy)),
+        )
+
+
+def sweep_circle_box(x, y, dx, dy, radius, box) -> tuple | None:
+    """
+    Earliest time a moving circle touches a box.
+    The circle's center starts at (x, y) and moves by (dx, dy) over the step.
+    Returns (t, nx, ny), the fraction of the move before contact and the unit
+    normal of the surface touched, or None if the circle misses the box,
+    moves away from it or already overlaps it.
+    """
+    left = box.x - radius
+    top = box.y - radius
+    right = box.x + box.width + radius
+    bottom = box.y + box.height + radius
+
+    # ray against the box grown by the radius, one slab per axis
+    t_near = -math.inf
+    t_far = math.inf
+    normal = (0.0, 0.0)
+    for start, move, low, high, axis in (
+        (x, dx, left, right, (1.0, 0.0)),
+        (y, dy, top, bottom, (0.0, 1.0)),
+    ):
+        if move == 0:
+            if start <= low or start >= high:
+                return None
+            continue
+        t_low = (low - start) / move
+        t_high = (high - start) / move
+        if t_low > t_high:
+            t_low, t_high = t_high, t_low
+        if t_low > t_near:
+            # entering through the low face means moving in the positive direction
+            sign = -1.0 if move > 0 else 1.0
+            t_near, normal = t_low, (axis[0] * sign, axis[1] * sign)
+        t_far = min(t_far, t_high)
+    if t_near > t_far or t_far <= 0 or t_near > 1:
+        return None
+    # starting inside the grown box only overlaps the circle off the corners,
+    # in a corner's empty part the circle can still be reached
+    inside = t_near < 0
+    t_near = max(t_near, 0.0)
+
+    # the grown box has square corners, the real shape is rounded there
+    corner = []
+    for hit, low, high in (
+        (x + dx * t_near, box.x, box.x + box.width),
+        (y + dy * t_near, box.y, box.y + box.height),
+    ):
+        if low <= hit <= high:
+            return None if inside else (t_near, normal[0], normal[1])  # a face
+        corner.append(low if hit < low else high)
+
+    # ray against the circle around the corner
+    mx = x - corner[0]
+    my = y - corner[1]
+    a = dx * dx + dy * dy
+    b = 2 * (mx * dx + my * dy)
+    c = mx * mx + my * my - radius * radius
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return None
+    t = (-b - math.sqrt(discriminant)) / (2 * a)
+    if t < 0 or t > 1:
+        return None
+    return t, (mx + dx * t) / radius, (my + dy * t) / radius
+
+
+class VectorView:
+    """Position or Speed style access to one ball in a BallStore"""
+
+    __slots__ = ("xs", "ys", "index")
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray, index: int):
+        self.xs = xs
+        self.ys = ys
+        self.index = index
+
+    @property
+    def x(self):
+        """Horizontal component"""
+        return float(self.xs[self.index])
+
+    @x.setter
+    def x(self, value):
+        self.xs[self.index] = value
+
+    @property
+    def y(self):
+        """Vertical component"""
+        return float(self.ys[self.index])
+
+    @y.setter
+    def y(self, value):
+        self.ys[self.index] = value
+
+    def __add__(self, speed):
+        return Position(self.x + speed.x, self.y + speed.y)
+
+    def __sub__(self, speed):
+        return Position(self.x - speed.x, self.y - speed.y)
+
+    def __iadd__(self, speed):
+        self.xs[self.index] += speed.x
+        self.ys[self.index] += speed.y
+        return self
+
+    def __isub__(self, speed):
+        self.xs[self.index] -= speed.x
+        self.ys[self.index] -= speed.y
+        return self
+
+    def __eq__(self, other):
+        try:
+            return self.x == other.x and self.y == other.y
+        except AttributeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(x={self.x}, y={self.y})"
+
+
+class BoxView(Box):
+    """Box access to one ball's rect in a BallStore"""
+
+    __slots__ = ("store", "index")
+
+    # pylint: disable-next=super-init-not-called
+    def __init__(self, store: "BallStore", index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def x(self):
+        """Left edge"""
+        return int(self.store.left[self.index])
+
+    @x.setter
+    def x(self, value):
+        self.store.left[self.index] = value
+
+    @property
+    def y(self):
+        """Top edge"""
+        return int(self.store.top[self.index])
+
+    @y.setter
+    def y(self, value):
+        self.store.top[self.index] = value
+
+    @property
+    def width(self):
+        """Width"""
+        return int(self.store.width[self.index])
+
+    @width.setter
+    def width(self, value):
+        self.store.width[self.index] = value
+
+    @property
+    def height(self):
+        """Height"""
+        return int(self.store.height[self.index])
+
+    @height.setter
+    def height(self, value):
+        self.store.height[self.index] = value
+
+
+class BallStore:
+    """
+    Positions, speeds, radii and rects for all of a game's balls,
+    one NumPy array per field.
+    Slots are stable while a ball is attached so views stay valid,
+    freed slots are reused by the next ball.
+    """
+
+    fields = (
+        "x",
+        "y",
+        "speed_x",
+        "speed_y",
+        "radius",
+        "left",
+        "top",
+        "width",
+        "height",
+    )
+
+    def __init__(self, capacity: int = 8):
+        for name in self.fields:
+            setattr(self, name, np.zeros(capacity))
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.bodies = [None] * capacity
+        self.step_scale = 1.0  # distance moved a step over the distance at TICK_RATE
+        self.free = list(range(capacity - 1, -1, -1))
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+
+    def grow(self):
+        """Double the capacity of the store"""
+        capacity = len(self.alive)
+        for name in self.fields:
+            grown = np.concatenate([getattr(self, name), np.zeros(capacity)])
+            setattr(self, name, grown)
+        self.alive = np.concatenate([self.alive, np.zeros(capacity, dtype=bool)])
+        self.bodies += [None] * capacity
+        self.free = list(range(capacity * 2 - 1, capacity - 1, -1)) + self.free
+        for body in self.bodies[:capacity]:
+            if body is not None:
+                body.attach(self, body.slot)  # views point at the old arrays
+
+    def add(self, body, slot: int = None) -> int:
+        """
+        Move a ball's state into the store and return its slot
+        A free slot is picked unless one is given, e.g. when restoring a saved game
+        """
+        if slot is None:
+            if not self.free:
+                self.grow()
+            slot = self.free.pop()
+        else:
+            while slot >= len(self.alive):
+                self.grow()
+            self.free.remove(slot)
+        self.x[slot], self.y[slot] = body.position.x, body.position.y
+        self.speed_x[slot], self.speed_y[slot] = body.speed.x, body.speed.y
+        self.radius[slot] = body.radius
+        self.left[slot], self.top[slot], self.width[slot], self.height[slot] = body.rect
+        self.alive[slot] = True
+        self.bodies[slot] = body
+        body.attach(self, slot)
+        return slot
+
+    def remove(self, body):
+        """Copy a ball's state back onto it and free its slot"""
+        slot = body.slot
+        body.detach()
+        self.alive[slot] = False
+        self.speed_x[slot] = self.speed_y[slot] = 0  # integrate() moves free slots too
+        self.bodies[slot] = None
+        self.free.append(slot)
+
+    def integrate(self, mask: np.ndarray = None):
+        """
+        Move balls by their speed scaled to the step, every ball in play when
+        no mask is given
+        """
+        if mask is None:
+            # free slots have no speed, so the whole array can move at once
+            self.x += self.speed_x * self.step_scale
+            self.y += self.speed_y * self.step_scale
+            self.left = np.trunc(self.x + np.copysign(0.5, self.x))
+            self.top = np.trunc(self.y + np.copysign(0.5, self.y))
+        elif mask.any():
+            np.add(self.x, self.speed_x * self.step_scale, out=self.x, where=mask)
+            np.add(self.y, self.speed_y * self.step_scale, out=self.y, where=mask)
+            np.trunc(self.x + np.copysign(0.5, self.x), out=self.left, where=mask)
+            np.trunc(self.y + np.copysign(0.5, self.y), out=self.top, where=mask)
+
+    def fast(self, limit: float) -> np.ndarray:
+        """Mask of balls moving more than 'limit' pixels a step along either axis"""
+        return self.alive & (
+            (np.abs(self.speed_x) > limit) | (np.abs(self.speed_y) > limit)
+        )
+
+    def bounce_walls(self, width: int, mask: np.ndarray = None) -> int:
+        """
+        Bounce balls off the side walls and ceiling, return the number of bounces
+        Only balls in the mask are checked, all balls in play if no mask is given.
+        """
+        active = self.alive if mask is None else mask
+        side = active & ((self.x <= 0) | (self.x >= width - self.width))
+        if side.any():
+            np.negative(self.speed_x, out=self.speed_x, where=side)
+            self.integrate(side)
+
+        ceiling = active & (self.y <= 0)
+        if ceiling.any():
+            np.negative(self.speed_y, out=self.speed_y, where=ceiling)
+            self.integrate(ceiling)
+        return int(np.count_nonzero(side) + np.count_nonzero(ceiling))
+
+    def reflect_paddle(
+        self,
+        paddle,
+        default_speed: float,
+        max_speed: float,
+        mask: np.ndarray = None,
+    ) -> int:
+        """
+        Bounce falling balls off the paddle, return the number of bounces
+        Balls hitting the top edge are steered by where they land on the paddle,
+        balls clipping a side edge are turned back horizontally.
+        Only balls in the mask are checked, all balls in play if no mask is given.
+        """
+        left, top, width, height = tuple(paddle.rect)
+        right = left + width
+        bottom = top + height
+        # falling balls level with the paddle, usually none
+        near = (
+            (self.alive if mask is None else mask)
+            & (self.speed_y > 0)
+            & (self.top <= bottom)
+            & (self.top + self.height - 1 >= top)
+        )
+        if not near.any():
+            return 0
+
+        ball_right = self.left + self.width - 1
+        top_edge = (
+            near & (self.left <= right) & (ball_right >= left) & (self.top <= top)
+        )
+        side_edge = (
+            near
+            & ~top_edge
+            & (
+                ((self.left <= left) & (ball_right >= left))
+                | ((self.left <= right) & (ball_right >= right))
+            )
+        )
+        if top_edge.any():
+            np.negative(self.speed_y, out=self.speed_y, where=top_edge)
+            self.integrate(top_edge)
+            np.copyto(self.y, top - self.height, where=top_edge)
+            # steer by where the ball landed on the paddle
+            offset = self.left + self.width // 2 - (left + width // 2)
+            steer = np.clip(
+                default_speed * (offset / (width / 2)), -max_speed, max_speed
+            )
+            np.copyto(self.speed_x, steer, where=top_edge)
+        if side_edge.any():
+            np.negative(self.speed_x, out=self.speed_x, where=side_edge)
+            self.integrate(side_edge)
+        return int(np.count_nonzero(top_edge) + np.count_nonzero(side_edge))
+
+    def overlapping(self, region, mask: np.ndarray = None) -> list:
+        """
+        Balls whose rects overlap a box, e.g. the area the bricks cover
+        Only balls in the mask are checked, all balls in play if no mask is given.
+        """
+        hits = (
+            (self.alive if mask is None else mask)
+            & (self.left < region.right)
+            & (self.top < region.bottom)
+            & (self.left + self.width > region.left)
+            & (self.top + self.height > region.top)
+        )
+        return [self.bodies[slot] for slot in np.flatnonzero(hits)]
+
+    def fallen(self, limit: float) -> list:
+        """Balls that dropped past the bottom limit"""
+        lost = self.alive & (self.y >= limit + self.radius)
+        return [self.bodies[slot] for slot in np.flatnonzero(lost)]
+
+
+class BrickCell:
+    """
+    A live brick of a BrickField, made on demand with the Brick rules API.
+    Holds only its field and cell, the brick's state stays in the field arrays.
+    """
+
+    __slots__ = ("field", "row", "col")
+
+    def __init__(self, field: "BrickField", row: int, col: int):
+        self.field = field
+        self.row = row
+        self.col = col
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, BrickCell)
+            and other.field is self.field
+            and (other.row, other.col) == (self.row, self.col)
+        )
+
+    def __hash__(self):
+        return hash((id(self.field), self.row, self.col))
+
+    def __repr__(self):
+        return f"<BrickCell({self.row}, {self.col})>"
+
+    @property
+    def rect(self) -> Box:
+        """The brick's rect"""
+        return self.field.cell_rect(self.row, self.col)
+
+    @property
+    def color(self):
+        """The brick's color"""
+        return self.field.palette[self.field.color[self.row, self.col]]
+
+    @property
+    def breakable(self) -> bool:
+        """False until an unbreakable brick is cracked"""
+        return not self.field.unbreakable[self.row, self.col]
+
+    @property
+    def points(self) -> int:
+        """Points scored for breaking the brick"""
+        return int(self.field.points[self.row, self.col])
+
+    def alive(self) -> bool:
+        """Whether the brick is still in play"""
+        return bool(self.field.alive[self.row, self.col])
+
+    def hit(self) -> int:
+        """Hit the brick, see BrickField.hit"""
+        return self.field.hit(self.row, self.col)
+
+
+class BrickField:
+    """
+    Every brick of a layout in arrays indexed by (row, col).
+    Cells sit on a uniform grid, the brick size plus the gap apart, so finding
+    the bricks under a ball, hitting one, counting the bricks left and finding
+    a brick's neighbours all take constant time, and each brick costs a few
+    bytes instead of an object and an image.
+    Bricks are handed out as BrickCell views when the rules need them.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        left: int,
+        top: int,
+        size: tuple,
+        gap: int,
+    ):
+        """
+        Create an empty field.
+
+        Args:
+            rows: Number of rows in the layout.
+            cols: Number of columns in the layout.
+            left: Left edge of the first column.
+            top: Top edge of the first row.
+            size: Width and height of a brick.
+            gap: Margin between bricks.
+        """
+        self.left = left
+        self.top = top
+        self.width, self.height = size
+        self.gap = gap
+        self.pitch_x = self.width + gap
+        self.pitch_y = self.height + gap
+        self.changes = 0  # counts every change to the bricks, for renderers
+        self.alive = None  # the arrays are made by allocate()
+        self.allocate(rows, cols)
+
+    def allocate(self, rows: int, cols: int):
+        """
+        Clear the field and size its arrays for rows x cols bricks.
+        Arrays already that size are cleared in place, so refilling the
+        field for each level allocates nothing.
+        """
+        if self.alive is not None and self.alive.shape == (rows, cols):
+            for cells in (self.alive, self.unbreakable, self.points, self.color):
+                cells.fill(0)
+        else:
+            self.alive = np.zeros((rows, cols), dtype=bool)
+            self.unbreakable = np.zeros((rows, cols), dtype=bool)
+            self.points = np.zeros((rows, cols), dtype=np.uint8)
+            self.color = np.zeros((rows, cols), dtype=np.uint8)  # index into palette
+        self.rows = rows
+        self.cols = cols
+        self.palette = []
+        self.remaining = 0
+        self.changes += 1
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the brick state arrays"""
+        return (
+            self.alive.nbytes
+            + self.unbreakable.nbytes
+            + self.points.nbytes
+            + self.color.nbytes
+        )
+
+    def __len__(self):
+        return self.remaining
+
+    def __iter__(self):
+        return iter(self.sprites())
+
+    def __contains__(self, brick):
+        return isinstance(brick, BrickCell) and brick.field is self and brick.alive()
+
+    def sprites(self) -> list:
+        """The live bricks in row order, like pygame.sprite.Group.sprites"""
+        cells = np.argwhere(self.alive).tolist()
+        return [BrickCell(self, row, col) for row, col in cells]
+
+    def empty(self):
+        """Remove every brick"""
+        self.alive[:] = False
+        self.remaining = 0
+        self.changes += 1
+
+    def color_index(self, color) -> int:
+        """Palette index of a color, adding it to the palette if it is new"""
+        if color not in self.palette:
+            self.palette.append(color)
+        return self.palette.index(color)
+
+    def place(self, row: int, col: int, color, points: int, unbreakable: bool = False):
+        """Put a brick in a cell"""
+        if not self.alive[row, col]:
+            self.remaining += 1
+        self.changes += 1
+        self.alive[row, col] = True
+        self.unbreakable[row, col] = unbreakable
+        self.points[row, col] = points
+        self.color[row, col] = self.color_index(color)
+
+    def hit(self, row: int, col: int) -> int:
+        """
+        Hit the brick in a cell and return the points scored.
+        Unbreakable bricks crack instead and score nothing.
+        """
+        if not self.alive[row, col]:
+            return 0
+        self.changes += 1
+        if self.unbreakable[row, col]:
+            self.unbreakable[row, col] = False
+            return 0
+        self.alive[row, col] = False
+        self.remaining -= 1
+        return int(self.points[row, col])
+
+    def cell_rect(self, row: int, col: int) -> Box:
+        """Rect of the brick in a cell"""
+        return Box(
+            self.left + col * self.pitch_x,
+            self.top + row * self.pitch_y,
+            self.width,
+            self.height,
+        )
+
+    def live_region(self) -> Box:
+        """Smallest box holding every live brick"""
+        rows = np.flatnonzero(self.alive.any(axis=1))
+        cols = np.flatnonzero(self.alive.any(axis=0))
+        if not len(rows):
+            return Box(0, 0, 0, 0)
+        top_left = self.cell_rect(int(rows[0]), int(cols[0]))
+        bottom_right = self.cell_rect(int(rows[-1]), int(cols[-1]))
+        return Box(
+            top_left.left,
+            top_left.top,
+            bottom_right.right - top_left.left,
+            bottom_right.bottom - top_left.top,
+        )
+
+    def neighbours(self, row: int, col: int, diagonal: bool = False) -> list:
+        """Live bricks next to a cell, with the corner cells if diagonal"""
+        found = []
+        for d_row in (-1, 0, 1):
+            for d_col in (-1, 0, 1):
+                if (d_row, d_col) == (0, 0) or (d_row and d_col and not diagonal):
+                    continue
+                r, c = row + d_row, col + d_col
+                if 0 <= r < self.rows and 0 <= c < self.cols and self.alive[r, c]:
+                    found.append(BrickCell(self, r, c))
+        return found
+
+    def query(self, rect) -> list:
+        """Live bricks whose rects overlap a rect, in row order"""
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+        right = rect.left + rect.width
+        bottom = rect.top + rect.height
+        first_col = max((rect.left - self.left) // self.pitch_x, 0)
+        last_col = min((right - 1 - self.left) // self.pitch_x, self.cols - 1)
+        first_row = max((rect.top - self.top) // self.pitch_y, 0)
+        last_row = min((bottom - 1 - self.top) // self.pitch_y, self.rows - 1)
+        found = []
+        for row in range(first_row, last_row + 1):
+            # the rect may only reach into the gap below the row
+            if rect.top >= self.top + row * self.pitch_y + self.height:
+                continue
+            for col in range(first_col, last_col + 1):
+                if (
+                    rect.left < self.left + col * self.pitch_x + self.width
+                    and self.alive[row, col]
+                ):
+                    found.append(BrickCell(self, row, col))
+        return found
+
+    def save(self) -> dict:
+        """The field as plain data, colors as palette indices"""
+        return {
+            "rows": self.rows,
+            "cols": self.cols,
+            "origin": [self.left, self.top],
+            "palette": list(self.palette),
+            "cells": [
+                [
+                    row,
+                    col,
+                    int(self.color[row, col]),
+                    int(self.points[row, col]),
+                    bool(self.unbreakable[row, col]),
+                ]
+                for row, col in np.argwhere(self.alive).tolist()
+            ],
+        }
+
+    def load(self, data: dict):
+        """Replace the bricks with ones saved by save()"""
+        self.left, self.top = data["origin"]
+        self.allocate(data["rows"], data["cols"])
+        self.palette = list(data["palette"])
+        for row, col, color, points, unbreakable in data["cells"]:
+            self.place(row, col, self.palette[color], points, unbreakable)
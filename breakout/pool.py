@@ -0,0 +1,97 @@
+"""
+Pool
+====
+Pools of released game entities. Balls and powerups come and go all game,
+most of all in multiball, so the game keeps the ones it kills and brings
+them back for the next spawn instead of building new objects, and the
+garbage collector has less to do while playing.
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """How a pool is used, for benchmarks, tests and the performance overlay"""
+
+    in_use: int  # handed out and still alive
+    free: int  # released, waiting to be handed out again
+    created: int  # built new because the pool was empty
+    reused: int  # handed out again instead of built
+
+    @property
+    def reuse_rate(self) -> float:
+        """Share of the entities handed out that were reused"""
+        handed_out = self.created + self.reused
+        return self.reused / handed_out if handed_out else 0.0
+
+
+class Pool:
+    """
+    Entities of one type that were killed, ready to be handed out again.
+    Entities handed out by acquire() go back to their pool when killed, and
+    a reused entity is reset by its own constructor, so it is the same as a
+    new one down to the random numbers it draws.
+    """
+
+    def __init__(self, entity_type: type, capacity: int = 16):
+        """
+        Create an empty pool.
+
+        Args:
+            entity_type: The Entity subclass the pool builds.
+            capacity: Most released entities kept, any more are left to the
+            garbage collector. 0 turns pooling off.
+        """
+        self.entity_type = entity_type
+        self.capacity = capacity
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.releases = 0
+
+    def acquire(self, *groups, **kwargs):
+        """
+        A released entity reset with these arguments, or a new one if none are
+        free. Arguments are the entity type's constructor arguments.
+        """
+        if self.free:
+            entity = self.free.pop()
+            entity.reset(*groups, **kwargs)
+            self.reused += 1
+        else:
+            entity = self.entity_type(*groups, **kwargs)
+            self.created += 1
+        entity.pool = self
+        return entity
+
+    def release(self, entity):
+        """Keep a killed entity for the next acquire(), called by Entity.kill()"""
+        if entity.released:
+            return  # killed twice, e.g. by its own power
+        entity.released = True
+        self.releases += 1
+        if len(self.free) < self.capacity:
+            self.free.append(entity)
+
+    def stats(self) -> PoolStats:
+        """How many entities are in use and free, and how many were reused"""
+        return PoolStats(
+            in_use=self.created + self.reused - self.releases,
+            free=len(self.free),
+            created=self.created,
+            reused=self.reused,
+        )
@@ -28,42 +28,48 @@ Thomas Nugent
 
 import math
 import random
-from dataclasses import astuple, dataclass
 from typing import Literal
 
 import pygame
-from pygame.font import SysFont
 from pygame.sprite import Sprite
 
-from breakout import Position, Speed, base_path, color_choices, screen_size, sound
-from breakout.paddle import Paddle
+from breakout import color_choices, screen_size, sound
+from breakout.animation import Animation
+from breakout.assets import assets
+from breakout.core import (
+    ExtraLifeBody,
+    GameConfig,
+    PowerDownBody,
+    PowerUpBody,
+    PowerupConfig,
+)
+from breakout.rng import RandomStreams
+from breakout.text import SharedFont, render_text
 
 # pylint: disable=no-member
+HEART_PATH = "textures/red_heart.png"
+HEART_SIZE = (20, 20)
+FUSE_COLORS = ("red", "orange", "yellow")
+EXPLOSION_SHAPES = 3  # explosions are drawn in a few shapes, picked at random
+EXPLOSION_STAGES = (0.5, 0.75, 1, 1.15)  # growth, a stage per blink interval
 
 
-@dataclass
-class PowerupConfig:
-    """Configuration for Powerup constants."""
-
-    size = 10
-    default_speed = Speed(0, 2.5)
-    initial_y = 15
-    blink_interval = 100
-    font = SysFont("courier", max(screen_size.width // 30, 14))
-
-
-class PowerUp(Sprite):
+class PowerUp(PowerUpBody, Sprite):
     """A generic powerup that moves downward,
     flickers by changing its color, and triggers
     a specified power effect when collected.
     """
 
+    _font = SharedFont(max(screen_size.width // 30, 14))
+
     def __init__(
         self,
         *groups,
         power=lambda: None,
         shape: Literal["circle", "rectangle"] = "circle",
-        color: int = random.choice(list(range(len(color_choices))))
+        color: int = None,
+        rng: RandomStreams = None,
+        config: GameConfig = None,
     ):
         """
         Initialize a generic powerup.
@@ -73,43 +79,19 @@ class PowerUp(Sprite):
             power: A callable to execute when the powerup is collected.
             shape: The shape of the powerup ('circle' or 'rectangle').
             color: An index into the color_choices list determining the initial color.
+                If None, a random color is picked.
+            rng: The game's random streams.
+            config: The game's settings.
         """
-        super().__init__(*groups)
-        self.position = Position(
-            random.randint(
-                PowerupConfig.size * 5, screen_size.width - PowerupConfig.size * 5
-            ),
-            PowerupConfig.initial_y,
+        super().__init__(*groups, power=power, shape=shape, rng=rng, config=config)
+        self.color = (
+            self.rng.cosmetics.randrange(len(color_choices)) if color is None else color
         )
-        self.speed = PowerupConfig.default_speed
-        self.color = color
-        self.collect = power
-        self.shape = shape
         self.last_toggle = pygame.time.get_ticks()
-
-        if self.shape == "circle":
-            # Create the surface for the ball and draw a circle
-            self.image = pygame.Surface(
-                (PowerupConfig.size * 2, PowerupConfig.size * 2), pygame.SRCALPHA
-            )
-            pygame.draw.circle(
-                self.image,
-                color_choices[self.color],
-                (PowerupConfig.size, PowerupConfig.size),
-                PowerupConfig.size,
-            )
-        elif self.shape == "rectangle":
-            # Create the surface for the ball and draw a circle
-            self.image = pygame.Surface(
-                (PowerupConfig.size * 4, PowerupConfig.size * 2)
-            )
-            self.image.fill(color)
-        self.text_surface = PowerupConfig.font.render("+", True, pygame.Color("black"))
-        self.rect = self.image.get_rect(center=astuple(self.position))
-        text_rect = self.text_surface.get_rect(
-            center=(PowerupConfig.size, PowerupConfig.size)
-        )  # Center text
-        self.image.blit(self.text_surface, text_rect)  # Draw text onto self.image
+        self.text_surface = render_text(PowerUp._font, "+", pygame.Color("black"))
+        # One frame per color, shared by every powerup of this shape
+        self.animation = powerup_animation(self.shape)
+        self.image = self.animation[self.color]
 
     def move(self, screen_state):
         """
@@ -121,240 +103,240 @@ class PowerUp(Sprite):
             self.last_toggle = now
             self.change_color()
 
-        # Update position
-        self.update_position()
-
-        # Only collide with the last paddle in the group
-        paddle = list(screen_state.paddle_group.sprites())[-1]
-        self.handle_paddle_collision(paddle)
-
-        if self.position.y >= paddle.position.y:
-            self.kill()
-
-    def update_position(self):
-        """Update the powerup's position based on its speed."""
-        self.position += self.speed
-        self.rect.y = self.position.y
+        super().move(screen_state)
 
-        text_rect = self.text_surface.get_rect(
-            center=astuple(self.position)
-        )  # center text
-        self.image.blit(self.text_surface, text_rect)  # Draw text onto self.image
-
-    def handle_paddle_collision(self, paddle: Paddle):
-        """Handle collisions with the paddle
-        If collision is detected while falling,
-        trigger the powerup's effect and remove it."""
-        if self.speed.y > 0 and self.rect.colliderect(paddle.rect):
-            sound.SoundManager.play_powerup()
-            self.collect()
-            self.kill()
+    def play_sound(self, name: str):
+        """Play the powerup's sounds"""
+        sound.SoundManager.play(name)
 
     def change_color(self):
         """Cycle through available colors to create a flickering effect."""
-        self.color += 1
-        if self.color == len(color_choices):
-            self.color = 0
-        if self.shape == "circle":
-            # Redraw the circle in the new color
-            pygame.draw.circle(
-                self.image,
-                color_choices[self.color],
-                (PowerupConfig.size, PowerupConfig.size),
-                PowerupConfig.size,
-            )
-        elif self.shape == "rectangle":
-            # Redraw the rectangle in the new color
-            self.image.fill(color_choices[self.color])
-        self.text_surface = PowerupConfig.font.render("+", True, pygame.Color("black"))
-        self.rect = self.image.get_rect(center=astuple(self.position))
-        text_rect = self.text_surface.get_rect(
-            center=(PowerupConfig.size, PowerupConfig.size)
-        )  # Center text
-        self.image.blit(self.text_surface, text_rect)  # Draw text onto self.image
-
-
-class ExtraLifePowerup(Sprite):
+        self.color = (self.color + 1) % len(self.animation)
+        self.image = self.animation[self.color]
+
+
+class ExtraLifePowerup(ExtraLifeBody, Sprite):
     """A powerup that gives the player an extra life.
     This powerup is uses a red_heart.png image.
     """
 
-    def __init__(self, *groups, power=lambda: None):
-        super().__init__(*groups)
-        # Load the red heart image.
-        try:
-            heart_path = base_path.joinpath("textures", "red_heart.png")
-            self.image = pygame.image.load(str(heart_path)).convert_alpha()
-            # Scale to be a 20x20 heart
-            self.image = pygame.transform.scale(self.image, (20, 20))
-        except (FileNotFoundError, pygame.error) as e:
-            print("Error loading heart image:", e)
+    def __init__(
+        self,
+        *groups,
+        power=lambda: None,
+        rng: RandomStreams = None,
+        config: GameConfig = None,
+    ):
+        super().__init__(*groups, power=power, rng=rng, config=config)
+        # The red heart image, loaded and scaled to 20x20 once for every heart
+        self.image = assets.image(HEART_PATH, HEART_SIZE, alpha=True)
+        if self.image is None:
             # Will drop a transparent image
-            self.image = pygame.Surface((20, 20), pygame.SRCALPHA)
-        self.rect = self.image.get_rect(
-            center=(random.randint(30, screen_size.width - 30), 15)
-        )
-        self.speed = Speed(0, 4.5)  # Falling speed
-        self.collect = power
+            self.image = pygame.Surface(HEART_SIZE, pygame.SRCALPHA)
 
-    def move(self, screen_state):
-        """Move the powerup downwards and handle collision with the paddle."""
-        self.rect.y += self.speed.y
-
-        # If the powerup falls off screen, kill it
-        paddle = list(screen_state.paddle_group.sprites())[-1]
-        if self.rect.top > paddle.position.y:
-            self.kill()
-
-        # Only collide with the last paddle in the group
-        paddle = list(screen_state.paddle_group.sprites())[-1]
-        self.handle_paddle_collision(paddle)
+    def play_sound(self, name: str):
+        """Play the powerup's sounds"""
+        sound.SoundManager.play(name)
 
-    def handle_paddle_collision(self, paddle):
-        """Call the powerup's effect if it collides with the paddle."""
-        if self.rect.colliderect(paddle.rect):
-            sound.SoundManager.play_powerup()
-            self.collect()
-            self.kill()
 
-
-class PowerDown(Sprite):
+class PowerDown(PowerDownBody, Sprite):
     """An obstacle that causes the player to lose a life"""
 
-    def __init__(self, *groups, power=lambda: None):
-        super().__init__(*groups)
-        self.position = Position(
-            random.randint(
-                PowerupConfig.size * 5, screen_size.width - PowerupConfig.size * 5
-            ),
-            PowerupConfig.initial_y,
-        )
-        self.speed = PowerupConfig.default_speed
-        self.collect = power
+    def __init__(
+        self,
+        *groups,
+        power=lambda: None,
+        rng: RandomStreams = None,
+        config: GameConfig = None,
+    ):
+        super().__init__(*groups, power=power, rng=rng, config=config)
         self.last_toggle = pygame.time.get_ticks()
-        self.exploded = False
-        self.explode_time = 0
-
-        # Draw bomb body (shaded)
-        self.image = pygame.Surface(
-            (PowerupConfig.size * 6, PowerupConfig.size * 6), pygame.SRCALPHA
-        )
-
-        pygame.draw.circle(
-            self.image,
-            pygame.Color("dark gray"),
-            (PowerupConfig.size * 3, PowerupConfig.size * 3),
-            PowerupConfig.size,
-        )  # Outline
-        pygame.draw.circle(
-            self.image,
-            pygame.Color("black"),
-            (PowerupConfig.size * 3, PowerupConfig.size * 3),
-            PowerupConfig.size // 1.25,
-        )  # Main body
-        pygame.draw.circle(
-            self.image,
-            pygame.Color("white"),
-            (PowerupConfig.size * 3 - 2.25, PowerupConfig.size * 3 - 2.25),
-            PowerupConfig.size // 2.25,
-        )  # Highlight
-
-        # Draw fuse
-        fuse_start = (PowerupConfig.size * 3, PowerupConfig.size * 2)
-        self.fuse_end = (PowerupConfig.size * 3.5, PowerupConfig.size)
-        pygame.draw.line(
-            self.image, pygame.Color("dark gray"), fuse_start, self.fuse_end, 3
-        )
-
-        # Flickering spark at the end of the fuse
-        fuse_color = random.choice(
-            [pygame.Color("red"), pygame.Color("orange"), pygame.Color("yellow")]
-        )  # Simulates flickering
-        pygame.draw.circle(
-            self.image, fuse_color, self.fuse_end, PowerupConfig.size // 2.5
-        )
 
-        # I want the collide rectangle to be smaller
-        self.rect = pygame.Surface(
-            (PowerupConfig.size * 4, PowerupConfig.size * 4), pygame.SRCALPHA
-        ).get_rect(center=astuple(self.position))
+        # Bomb with a flickering spark at the end of the fuse
+        self.flicker = bomb_animation()
+        self.explosion = None
+        self.change_color()
 
     def move(self, screen_state):
-        """Handles movement and collision with walls, paddle, and bricks."""
+        """Flicker the fuse, then handle movement and the explosion timer."""
         now = pygame.time.get_ticks()
-        if self.exploded:
-            if (self.explode_time + (PowerupConfig.blink_interval * 4)) < now:
-                self.collect()
-                self.kill()
-        else:
-            if now - self.last_toggle > PowerupConfig.blink_interval:
-                self.last_toggle = now
-                self.change_color()
-
-        # Update position
-        self.update_position()
-
-        # Only collide with the last paddle in the group
-        paddle = list(screen_state.paddle_group.sprites())[-1]
-        self.handle_paddle_collision(paddle)
-
-        if self.position.y >= paddle.position.y:
-            self.kill()
-
-    def update_position(self):
-        """Update the powerup's position based on its speed."""
-        self.position += self.speed
-        self.rect.y = self.position.y
-
-    def handle_paddle_collision(self, paddle: Paddle):
-        """Check for collision with the paddle. If collided, trigger explosion."""
-        if self.speed.y > 0 and self.rect.colliderect(paddle.rect):
-            self.explode()
+        if not self.exploded and now - self.last_toggle > PowerupConfig.blink_interval:
+            self.last_toggle = now
+            self.change_color()
+
+        super().move(screen_state)
+        if self.explosion is not None and self.explode_time is not None:
+            self.image = self.explosion.frame(screen_state.clock - self.explode_time)
 
     def change_color(self):
-        """Redraw flickering spark at the end of the fuse."""
-        fuse_color = random.choice(
-            [pygame.Color("red"), pygame.Color("orange"), pygame.Color("yellow")]
-        )  # Simulates flickering
-        pygame.draw.circle(
-            self.image, fuse_color, self.fuse_end, PowerupConfig.size // 2.5
-        )
+        """Show the bomb with its spark in another color."""
+        # Simulates flickering
+        self.image = self.rng.cosmetics.choice(self.flicker.frames)
 
     def explode(self):
         """Update the powerdown because the player hit it"""
-        self.exploded = True
-        self.explode_time = pygame.time.get_ticks()
-        self.speed = Speed(0, 0)
+        super().explode()
         self.generate_explosion()
 
     def generate_explosion(self):
         """Trigger the explosion: stop movement, display an explosion effect,
         and update state so that after a delay the negative effect is applied."""
-        size = PowerupConfig.size * 4
-        outer_explosion = self.generate_explosion_points(size)
-        middle_explosion = self.generate_explosion_points(size * 0.7)
-        inner_explosion = self.generate_explosion_points(size * 0.4)
-
-        pygame.draw.polygon(self.image, pygame.Color("red"), outer_explosion)
-        pygame.draw.polygon(self.image, pygame.Color("orange"), middle_explosion)
-        pygame.draw.polygon(self.image, pygame.Color("yellow"), inner_explosion)
-
-    def generate_explosion_points(self, size: int) -> list[int]:
-        """Generate a list of (x, y) coordinate tuples
-        representing the explosion polygon vertices."""
-        points = []
-        num_spikes = 12
-        angle_step = 360 / num_spikes
-
-        for i in range(num_spikes):
-            angle = i * angle_step
-            radius = size // 2 if i % 2 == 0 else size // 4  # Alternating spike sizes
-            x = PowerupConfig.size * 3 - int(
-                radius * random.uniform(0.8, 1.2) * math.cos(math.radians(angle))
+        # explosions grow over the explode delay, each bomb picks one of a few shapes
+        self.explosion = explosion_animation(
+            self.rng.cosmetics.randrange(EXPLOSION_SHAPES)
+        )
+        self.image = self.explosion[0]
+
+
+def powerup_animation(shape: str) -> Animation:
+    """A powerup's flicker cycle, its shape in each of the color_choices"""
+    if shape == "circle":
+        size = (PowerupConfig.size * 2, PowerupConfig.size * 2)
+    else:
+        size = (PowerupConfig.size * 4, PowerupConfig.size * 2)
+    return assets.animation(
+        "powerup",
+        size,
+        lambda: [
+            assets.sprite(
+                "powerup",
+                size,
+                color,
+                lambda: draw_powerup(shape, size, color),
+                variant=shape,
             )
-            y = PowerupConfig.size * 3 - int(
-                radius * random.uniform(0.8, 1.2) * math.sin(math.radians(angle))
+            for color in color_choices
+        ],
+        PowerupConfig.blink_interval,
+        variant=shape,
+    )
+
+
+def bomb_animation() -> Animation:
+    """The bomb's flicker cycle, its spark in each of FUSE_COLORS"""
+    size = (PowerupConfig.size * 6, PowerupConfig.size * 6)
+    return assets.animation(
+        "powerdown",
+        size,
+        lambda: [
+            assets.sprite(
+                "powerdown", size, fuse_color, lambda: draw_bomb(size, fuse_color)
             )
-            points.append((x, y))
+            for fuse_color in map(pygame.Color, FUSE_COLORS)
+        ],
+        PowerupConfig.blink_interval,
+    )
+
+
+def explosion_animation(shape: int) -> Animation:
+    """A bomb's explosion growing over the delay before its power fires"""
+    size = (PowerupConfig.size * 6, PowerupConfig.size * 6)
+    return assets.animation(
+        "explosion",
+        size,
+        lambda: draw_explosion(size, random.Random(shape)),
+        PowerupConfig.blink_interval,
+        variant=shape,
+        loop=False,
+    )
+
+
+def warm_animations():
+    """Draw every frame of the powerups' flickering and the bombs' explosions"""
+    for shape in ("circle", "rectangle"):
+        powerup_animation(shape)
+    bomb_animation()
+    for shape in range(EXPLOSION_SHAPES):
+        explosion_animation(shape)
+
+
+def draw_powerup(shape: str, size: tuple, color: pygame.Color) -> pygame.Surface:
+    """Draw a powerup's circle or rectangle in a color, with a "+" on it"""
+    if shape == "circle":
+        # Create the surface for the ball and draw a circle
+        image = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.circle(
+            image,
+            color,
+            (PowerupConfig.size, PowerupConfig.size),
+            PowerupConfig.size,
+        )
+    else:
+        image = pygame.Surface(size)
+        image.fill(color)
+    text_surface = render_text(PowerUp._font, "+", pygame.Color("black"))
+    text_rect = text_surface.get_rect(
+        center=(PowerupConfig.size, PowerupConfig.size)
+    )  # Center text
+    image.blit(text_surface, text_rect)  # Draw text onto the image
+    return image
+
+
+def draw_bomb(size: tuple, fuse_color: pygame.Color) -> pygame.Surface:
+    """Draw the bomb, its fuse and the spark at the end of the fuse"""
+    # Draw bomb body (shaded)
+    image = pygame.Surface(size, pygame.SRCALPHA)
+
+    pygame.draw.circle(
+        image,
+        pygame.Color("dark gray"),
+        (PowerupConfig.size * 3, PowerupConfig.size * 3),
+        PowerupConfig.size,
+    )  # Outline
+    pygame.draw.circle(
+        image,
+        pygame.Color("black"),
+        (PowerupConfig.size * 3, PowerupConfig.size * 3),
+        PowerupConfig.size // 1.25,
+    )  # Main body
+    pygame.draw.circle(
+        image,
+        pygame.Color("white"),
+        (PowerupConfig.size * 3 - 2.25, PowerupConfig.size * 3 - 2.25),
+        PowerupConfig.size // 2.25,
+    )  # Highlight
+
+    # Draw fuse
+    fuse_start = (PowerupConfig.size * 3, PowerupConfig.size * 2)
+    fuse_end = (PowerupConfig.size * 3.5, PowerupConfig.size)
+    pygame.draw.line(image, pygame.Color("dark gray"), fuse_start, fuse_end, 3)
+
+    # Spark at the end of the fuse
+    pygame.draw.circle(image, fuse_color, fuse_end, PowerupConfig.size // 2.5)
+    return image
+
+
+def draw_explosion(size: tuple, rng: random.Random) -> list[pygame.Surface]:
+    """Draw the stages of an explosion over the bomb, one jagged shape growing"""
+    bomb = draw_bomb(size, pygame.Color("red"))
+    stages = []
+    jitter = [rng.uniform(0.8, 1.2) for _ in range(12 * 3 * 2)]
+    for growth in EXPLOSION_STAGES:
+        image = bomb.copy()
+        spikes = iter(jitter)
+        for scale, color in ((1, "red"), (0.7, "orange"), (0.4, "yellow")):
+            points = explosion_points(PowerupConfig.size * 4 * scale * growth, spikes)
+            pygame.draw.polygon(image, pygame.Color(color), points)
+        stages.append(image)
+    return stages
+
+
+def explosion_points(size: float, jitter) -> list[tuple[int, int]]:
+    """Generate a list of (x, y) coordinate tuples
+    representing the explosion polygon vertices."""
+    points = []
+    num_spikes = 12
+    angle_step = 360 / num_spikes
+
+    for i in range(num_spikes):
+        angle = i * angle_step
+        radius = size // 2 if i % 2 == 0 else size // 4  # Alternating spike sizes
+        x = PowerupConfig.size * 3 - int(
+            radius * next(jitter) * math.cos(math.radians(angle))
+        )
+        y = PowerupConfig.size * 3 - int(
+            radius * next(jitter) * math.sin(math.radians(angle))
+        )
+        points.append((x, y))
 
-        return points
+    return points
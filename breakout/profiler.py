@@ -0,0 +1,219 @@
+"""
+Profiler
+========
+Where each frame's time goes. The game loop times its phases - handling
+events, updating, drawing, showing the frame and waiting for the next - and
+a FrameTimer keeps the last frames of each so their percentiles can be read
+by benchmarks and tests, or shown in game with the performance overlay (F3).
+Timing is off until it is asked for, then each phase costs two clock reads.
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass
+from time import perf_counter
+
+import pygame
+
+from breakout.screens import ScreenManager
+from breakout.text import get_font
+from breakout.timestep import FRAME_TIME
+
+NOT_TIMED = nullcontext()  # what phase() gives while timing is off
+
+
+@dataclass(frozen=True)
+class PhaseStats:
+    """Milliseconds a phase took per frame, over the frames kept"""
+
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    frames: int
+
+
+class Phase:
+    """Times one phase of the frame each time its block runs"""
+
+    def __init__(self, timer: "FrameTimer", name: str):
+        self.timer = timer
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timer.add(self.name, (perf_counter() - self.start) * 1000)
+
+
+class FrameTimer:
+    """
+    Milliseconds spent in each phase of the last frames.
+    Wrap each phase in `with timer.phase(name):` and call end_frame() once a
+    frame. A phase that runs several times in a frame, e.g. once per
+    simulation step, adds up, and one that did not run counts as 0 ms.
+    """
+
+    def __init__(self, frames: int = 600):
+        """
+        Create a timer, off until enabled
+
+        Args:
+            frames: How many of the last frames the percentiles are taken over.
+        """
+        self.enabled = False
+        self.frames = frames
+        self.phases = {}  # name -> Phase
+        self.current = {}  # name -> milliseconds so far this frame
+        self.history = {"frame": deque(maxlen=frames)}  # name -> ms per frame
+        self.frame_start = None
+
+    def phase(self, name: str):
+        """A context manager timing a phase, doing nothing while timing is off"""
+        if not self.enabled:
+            return NOT_TIMED
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = Phase(self, name)
+        return phase
+
+    def add(self, name: str, milliseconds: float):
+        """Count time towards a phase of this frame"""
+        if name not in self.history:
+            self.history[name] = deque(maxlen=self.frames)
+        self.current[name] = self.current.get(name, 0.0) + milliseconds
+
+    def end_frame(self):
+        """Keep this frame's phase times and start timing the next frame"""
+        if not self.enabled:
+            return
+        now = perf_counter()
+        if self.frame_start is not None:
+            self.current["frame"] = (now - self.frame_start) * 1000
+            for name, samples in self.history.items():
+                samples.append(self.current.get(name, 0.0))
+        self.current.clear()
+        self.frame_start = now
+
+    def samples(self, name: str) -> list[float]:
+        """A phase's milliseconds for each frame kept, oldest first"""
+        return list(self.history.get(name, ()))
+
+    def stats(self, name: str) -> PhaseStats:
+        """Percentiles of a phase's time per frame, zeros if it was never timed"""
+        ordered = sorted(self.history.get(name, ()))
+        if not ordered:
+            return PhaseStats(0.0, 0.0, 0.0, 0.0, 0)
+
+        def percentile(share: float) -> float:
+            return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+        return PhaseStats(
+            percentile(0.50),
+            percentile(0.95),
+            percentile(0.99),
+            ordered[-1],
+            len(ordered),
+        )
+
+    def report(self) -> dict[str, PhaseStats]:
+        """Stats of every phase timed, and of the whole frame"""
+        return {name: self.stats(name) for name in self.history}
+
+    def reset(self):
+        """Forget every frame timed so far"""
+        for samples in self.history.values():
+            samples.clear()
+        self.current.clear()
+        self.frame_start = None
+
+
+frame_timer = FrameTimer()  # timed by the game loop
+
+
+class PerformanceOverlay:
+    """
+    A panel drawn over the game with a graph of the last frame times, the
+    frame budget as a line across it, and each phase's percentiles.
+    Showing the overlay turns the frame timer on, hiding it turns it off.
+    """
+
+    size = (230, 174)
+    graph_height = 40
+    refresh = 250  # milliseconds between updates of the numbers
+
+    def __init__(self, timer: FrameTimer = frame_timer, pos: tuple = (4, 4)):
+        self.timer = timer
+        self.rect = pygame.Rect(pos, self.size)
+        self.visible = False
+        self.lines = []  # rendered rows of numbers
+        self.last_refresh = None
+
+    def toggle(self):
+        """Show or hide the overlay"""
+        self.visible = not self.visible
+        self.timer.enabled = self.visible
+        if self.visible:
+            self.timer.reset()
+            self.last_refresh = None
+
+    def draw(self, screen: pygame.Surface) -> list[pygame.Rect]:
+        """Draw the overlay if it is showing, return the rects it covers"""
+        if not self.visible:
+            return []
+        screen.fill(pygame.Color(0, 0, 40), self.rect)
+        self.draw_graph(screen)
+
+        now = pygame.time.get_ticks()
+        if self.last_refresh is None or now - self.last_refresh >= self.refresh:
+            self.last_refresh = now
+            self.lines = self.render_lines()
+        y = self.rect.top + self.graph_height + 6
+        for line in self.lines:
+            screen.blit(line, (self.rect.left + 4, y))
+            y += line.get_height()
+        return [self.rect]
+
+    def draw_graph(self, screen: pygame.Surface):
+        """A bar per frame, scaled so twice the frame budget fills the graph"""
+        graph = pygame.Rect(self.rect.topleft, (self.rect.width, self.graph_height))
+        graph.inflate_ip(-8, -4)
+        scale = graph.height / (FRAME_TIME * 2)
+        frames = self.timer.samples("frame")[-graph.width :]
+        for x, milliseconds in enumerate(frames, start=graph.left):
+            height = min(graph.height, round(milliseconds * scale))
+            color = "green" if milliseconds <= FRAME_TIME else "red"
+            screen.fill(pygame.Color(color), (x, graph.bottom - height, 1, height))
+        budget = graph.bottom - round(FRAME_TIME * scale)
+        screen.fill(pygame.Color("yellow"), (graph.left, budget, graph.width, 1))
+
+    def render_lines(self) -> list[pygame.Surface]:
+        """Render a row of percentiles per phase, and the screen's element count"""
+        font = get_font(11)
+        rows = [f"{'ms':<8}{'p50':>6}{'p95':>6}{'p99':>6}{'max':>6}"]
+        for name, stats in self.timer.report().items():
+            rows.append(
+                f"{name[:8]:<8}{stats.p50:6.1f}{stats.p95:6.1f}"
+                f"{stats.p99:6.1f}{stats.max:6.1f}"
+            )
+        if ScreenManager.last_drawn is not None:
+            # live elements on the screen, growing without end is a leak
+            rows.append(f"{'elements':<8}{len(ScreenManager.last_drawn.elements):6d}")
+        # the numbers change every refresh, so they stay out of the text cache
+        return [font.render(row, True, pygame.Color("white")) for row in rows]
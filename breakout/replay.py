@@ -0,0 +1,272 @@
+"""
+Replay
+======
+Record a game's inputs to a small binary file and play it back.
+A replay holds the game seed, every step's inputs and periodic keyframes of
+the full game state. Inputs are stored as runs of identical steps, each run
+one varint, so a long game takes a few kilobytes plus its keyframes.
+Keyframes let a replay seek to any step without playing the whole game.
+
+Run `python -m breakout.replay FILE` to play a replay headless at full speed
+and print how the game ended, or add `--render` to watch it at normal speed.
+
+File layout, all numbers unsigned LEB128 varints:
+    b"BRKR", version byte, zigzag seed, tick rate, step count
+    run count, then (run length << 4 | input bits) per run
+    keyframe count, then step, byte length and zlib JSON snapshot per keyframe
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import argparse
+import json
+import zlib
+from bisect import bisect_right
+from itertools import accumulate, islice, repeat
+from pathlib import Path
+
+from breakout.core import Inputs, Simulation
+from breakout.timestep import TICK_RATE
+
+MAGIC = b"BRKR"
+VERSION = 2  # 2: bricks saved as a brick field
+
+# one bit per input
+LEFT, RIGHT, LAUNCH, PAUSE = 1, 2, 4, 8
+
+
+def input_bits(inputs: Inputs) -> int:
+    """Pack a step's inputs into 4 bits"""
+    return (
+        LEFT * inputs.left
+        | RIGHT * inputs.right
+        | LAUNCH * inputs.launch
+        | PAUSE * inputs.pause
+    )
+
+
+def bits_input(bits: int) -> Inputs:
+    """Unpack inputs packed by input_bits"""
+    return Inputs(
+        left=bool(bits & LEFT),
+        right=bool(bits & RIGHT),
+        launch=bool(bits & LAUNCH),
+        pause=bool(bits & PAUSE),
+    )
+
+
+def write_varint(out: bytearray, value: int):
+    """Append an unsigned integer as a LEB128 varint"""
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    """Read a varint, return its value and the offset after it"""
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def zigzag(value: int) -> int:
+    """Map signed integers to unsigned so small negatives stay short"""
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def unzigzag(value: int) -> int:
+    """Undo zigzag"""
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+
+class Replay:
+    """A recorded game: the seed, every step's inputs and state keyframes"""
+
+    def __init__(self, seed: int, tick_rate: int = TICK_RATE):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.runs = []  # [input bits, steps] per run of identical inputs
+        self.keyframes = []  # (step, compressed snapshot) in step order
+
+    @property
+    def steps(self) -> int:
+        """Number of recorded steps"""
+        return sum(length for _, length in self.runs)
+
+    @property
+    def dt(self) -> float:
+        """Milliseconds per step"""
+        return 1000 / self.tick_rate
+
+    def append(self, inputs: Inputs):
+        """Add one step's inputs"""
+        bits = input_bits(inputs)
+        if self.runs and self.runs[-1][0] == bits:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([bits, 1])
+
+    def add_keyframe(self, step: int, snapshot: dict):
+        """Save the game state before 'step'"""
+        data = zlib.compress(json.dumps(snapshot, separators=(",", ":")).encode())
+        self.keyframes.append((step, data))
+
+    def inputs(self, start: int = 0):
+        """Yield every step's inputs from step 'start' on"""
+        starts = list(accumulate((length for _, length in self.runs), initial=0))
+        run = max(bisect_right(starts, start) - 1, 0)
+        skip = start - starts[run]
+        for bits, length in self.runs[run:]:
+            yield from repeat(bits_input(bits), length - skip)
+            skip = 0
+
+    def restore(self, state: Simulation, step: int = 0) -> Simulation:
+        """
+        Put a game into its recorded state before 'step'.
+        Restores the nearest keyframe and plays the steps after it.
+        """
+        index = bisect_right([start for start, _ in self.keyframes], step) - 1
+        start, data = self.keyframes[max(index, 0)]
+        state.restore(json.loads(zlib.decompress(data)))
+        for inputs in islice(self.inputs(start), step - start):
+            state.step(inputs, self.dt)
+        return state
+
+    def play(self, step: int = None) -> Simulation:
+        """Play the replay headless up to 'step', the end if None"""
+        return self.restore(Simulation(self.seed), self.steps if step is None else step)
+
+    def to_bytes(self) -> bytes:
+        """Encode the replay"""
+        out = bytearray(MAGIC)
+        out.append(VERSION)
+        for value in (zigzag(self.seed), self.tick_rate, self.steps, len(self.runs)):
+            write_varint(out, value)
+        for bits, length in self.runs:
+            write_varint(out, length << 4 | bits)
+        write_varint(out, len(self.keyframes))
+        for step, data in self.keyframes:
+            write_varint(out, step)
+            write_varint(out, len(data))
+            out += data
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        """Decode a replay made by to_bytes"""
+        if data[:4] != MAGIC or data[4] != VERSION:
+            raise ValueError("Not a Breakout replay")
+        offset = 5
+        values = []
+        for _ in range(4):
+            value, offset = read_varint(data, offset)
+            values.append(value)
+        seed, tick_rate, _, run_count = values
+        replay = cls(unzigzag(seed), tick_rate)
+        for _ in range(run_count):
+            value, offset = read_varint(data, offset)
+            replay.runs.append([value & 0xF, value >> 4])
+        count, offset = read_varint(data, offset)
+        for _ in range(count):
+            step, offset = read_varint(data, offset)
+            size, offset = read_varint(data, offset)
+            replay.keyframes.append((step, data[offset : offset + size]))
+            offset += size
+        return replay
+
+    def save(self, path: Path):
+        """Write the replay to a file"""
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Path) -> "Replay":
+        """Read a replay file"""
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+class Recorder:
+    """
+    Record a game as it is played.
+    Launches and pauses made between steps, e.g. from key presses and buttons,
+    are recorded as inputs of the next step so the replay makes them too.
+    """
+
+    keyframe_interval = 3000  # steps, a minute at the default tick rate
+
+    def __init__(self, state: Simulation, tick_rate: int = TICK_RATE):
+        self.replay = Replay(state.rng.seed, tick_rate)
+        self.replay.add_keyframe(0, state.snapshot())
+        self.launched = state.launched
+        self.paused = state.paused
+        self.steps = 0
+
+    def step(self, state: Simulation, inputs: Inputs, dt: float):
+        """Record a step's inputs, then step the game"""
+        self.replay.append(
+            Inputs(
+                left=inputs.left,
+                right=inputs.right,
+                launch=inputs.launch or (state.launched and not self.launched),
+                pause=inputs.pause != (state.paused != self.paused),
+            )
+        )
+        state.step(inputs, dt)
+        self.launched = state.launched
+        self.paused = state.paused
+        self.steps += 1
+        if self.steps % self.keyframe_interval == 0:
+            self.replay.add_keyframe(self.steps, state.snapshot())
+
+
+def parse_args(argv: list[str] = None) -> argparse.Namespace:
+    """Read the command line options"""
+    parser = argparse.ArgumentParser(
+        prog="python -m breakout.replay", description="Play back a Breakout replay."
+    )
+    parser.add_argument("file", type=Path, help="replay file")
+    parser.add_argument(
+        "--render", action="store_true", help="watch the replay at normal speed"
+    )
+    parser.add_argument(
+        "--seek", type=int, default=0, help="step to start watching from"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] = None):
+    """Play a replay headless and print the result, or watch it"""
+    args = parse_args(argv)
+    replay = Replay.load(args.file)
+    if args.render:
+        from breakout.__main__ import Game  # pylint: disable=import-outside-toplevel
+
+        Game(seed=replay.seed).play_replay(replay, args.seek)
+        return
+
+    state = replay.play()
+    print(
+        f"seed {replay.seed}: {replay.steps} steps, score {state.score}, "
+        f"level {state.level}, lives {state.lives}"
+        + (", game over" if state.game_is_over else "")
+    )
+
+
+if __name__ == "__main__":
+    main()
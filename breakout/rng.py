@@ -0,0 +1,51 @@
+"""
+RNG
+===
+Seeded random number streams for a game.
+Each subsystem draws from its own stream, so a seed reproduces a whole game,
+and drawing extra sparks or colors in the window never changes where the
+bricks go, which powerup falls next or how the ball bounces.
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import random
+import secrets
+
+
+class RandomStreams:
+    """
+    Independent random.Random streams derived from one game seed
+        layout: brick designs and which bricks are unbreakable
+        powerups: which powerup falls, when and where, and powerup paddle timeouts
+        physics: ball bounce directions
+        cosmetics: colors and effects that do not change the game
+    """
+
+    names = ("layout", "powerups", "physics", "cosmetics")
+
+    def __init__(self, seed: int = None):
+        """
+        Create the streams for a game.
+
+        Args:
+            seed: The game seed, a random one is picked if None.
+        """
+        self.seed = secrets.randbits(32) if seed is None else seed
+        for name in self.names:
+            # string seeds are hashed, so each stream is independent of the others
+            setattr(self, name, random.Random(f"{self.seed}:{name}"))
+
+    def __repr__(self):
+        return f"RandomStreams(seed={self.seed})"
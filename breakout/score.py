@@ -1,7 +1,7 @@
 """
 Score
 ========
-Tracks and displays the player's score, manages the leaderboard, and 
+Tracks and displays the player's score, manages the leaderboard, and
 handles name input for high scores. Updates the screen with real-time scoring information.
 
 Class
@@ -20,42 +20,68 @@ Thomas Nugent
 """
 
 import pygame
-from pygame.font import SysFont
 
 from breakout import screen_size
+from breakout.text import SharedFont, get_font, glyph_atlas, render_text
 
 # pylint: disable=no-member
+HUD_LABELS = ("Current Score: ", "Lives: ")  # drawn whole from the HUD's glyph atlas
 
 
 class Scoreboard:
     """Handles the leaderboard display."""
 
-    _font = SysFont("courier", max(screen_size.width // 20, 12))
+    _font = SharedFont(max(screen_size.width // 20, 12))
 
     def __init__(self):
         self.text_color = pygame.Color("white")
         self.top_scores = {}
 
+    def lines(self) -> list[str]:
+        """The leaderboard's lines of text, the title first"""
+        lines = ["Leaderboard"]
+        for score, name in self.top_scores.items():
+            formatted_score = f"{score:,}"  # Format score with commas
+            lines.append(
+                f"{formatted_score}{'.' * (20 - len(name) - len(formatted_score))}{name}"
+            )
+        return lines
+
+    def bounds(self) -> list[pygame.Rect]:
+        """Screen area the leaderboard covers"""
+        title, *entries = self.lines()
+        rects = [
+            pygame.Rect((screen_size.width // 3, 80), Scoreboard._font.size(title))
+        ]
+        for i, entry in enumerate(entries):
+            position = (screen_size.width // 5, 110 + i * 30)
+            rects.append(pygame.Rect(position, Scoreboard._font.size(entry)))
+        return rects
+
+    def appearance(self) -> tuple:
+        """Changes when the scores change"""
+        return tuple(self.top_scores.items())
+
     def draw(self, screen: pygame.Surface):
         """Draws the scoreboard on the screen."""
         # Display top scores
-        title_str = "Leaderboard"
-        title_text = Scoreboard._font.render(title_str, True, self.text_color)
+        title_str, *entries = self.lines()
+        title_text = render_text(Scoreboard._font, title_str, self.text_color)
         screen.blit(title_text, (screen_size.width // 3, 80))
 
-        for i, (score, name) in enumerate(self.top_scores.items()):
-            formatted_score = f"{score:,}"  # Format score with commas
-            entry_text = f"{formatted_score}{'.' * (20 - len(name) - len(formatted_score))}{name}"
-            score_text = Scoreboard._font.render(entry_text, True, self.text_color)
+        for i, entry_text in enumerate(entries):
+            score_text = render_text(Scoreboard._font, entry_text, self.text_color)
             screen.blit(score_text, (screen_size.width // 5, 110 + i * 30))
 
 
 class NameInput:
     """Handles user input for entering a name."""
 
+    event_types = (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN)
+
     def __init__(self):
         self.font_size = max(screen_size.width // 20, 12)
-        self.font = SysFont("courier", self.font_size)
+        self.font = get_font(self.font_size)
         self.active_color = pygame.Color("green")
         self.passive_color = pygame.Color("#0ffffd")
         self.active = True
@@ -86,29 +112,41 @@ class NameInput:
                 )  # Unicode standard is used for string formation
                 self.name = str.upper(self.name)
 
+    def label_rect(self) -> pygame.Rect:
+        """Where the "Name: " label goes"""
+        label_rect = pygame.Rect((0, 0), self.font.size("Name: "))
+        label_rect.center = (self.rect.x - 50, self.rect.y + (self.rect.height // 2))
+        return label_rect
+
+    def bounds(self) -> list[pygame.Rect]:
+        """Screen area the input field covers"""
+        name_rect = pygame.Rect((0, 0), self.font.size(self.name[:3]))
+        name_rect.center = self.rect.center
+        return [self.rect, name_rect, self.label_rect()]
+
+    def appearance(self) -> tuple:
+        """Changes when the name or focus changes"""
+        return self.active, self.name[:3]
+
     def draw(self, screen: pygame.Surface):
         """Draw the name input field."""
         self.name = self.name[:3]
         if self.active:
             pygame.draw.rect(screen, self.active_color, self.rect)
-            name_surface = self.font.render(self.name, True, pygame.Color("black"))
         else:
             pygame.draw.rect(screen, self.passive_color, self.rect)
-            name_surface = self.font.render(self.name, True, pygame.Color("black"))
+        name_surface = render_text(self.font, self.name, pygame.Color("black"))
         name_rect = name_surface.get_rect(center=self.rect.center)
         screen.blit(name_surface, name_rect)
 
-        name_label = self.font.render("Name: ", True, pygame.Color("white"))
-        label_rect = name_label.get_rect(
-            center=(self.rect.x - 50, self.rect.y + (self.rect.height // 2))
-        )
-        screen.blit(name_label, label_rect)
+        name_label = render_text(self.font, "Name: ", pygame.Color("white"))
+        screen.blit(name_label, self.label_rect())
 
 
 class ScoreDisplay:
     """Tracks and displays the current score in real-time."""
 
-    _font = SysFont("courier", 14, bold=True)
+    _font = SharedFont(14, bold=True)
 
     def __init__(self, score: int = 0):
         self.current_score = score
@@ -117,20 +155,33 @@ class ScoreDisplay:
         """Update the score display value"""
         self.current_score = score
 
+    def bounds(self) -> list[pygame.Rect]:
+        """Screen area the score covers"""
+        return [
+            pygame.Rect(
+                (0, screen_size.height - screen_size.height // 15),
+                ScoreDisplay._font.size(f"Current Score: {self.current_score}"),
+            )
+        ]
+
+    def appearance(self) -> int:
+        """Changes with the score"""
+        return self.current_score
+
     def draw(self, screen: pygame.Surface):
         """Draw the current score on the screen."""
-        current_score_text = ScoreDisplay._font.render(
-            f"Current Score: {self.current_score}", True, pygame.Color("black")
-        )
-        screen.blit(
-            current_score_text, (0, screen_size.height - screen_size.height // 15)
+        # the score changes often, so it is composed from pre-drawn glyphs
+        glyph_atlas(14, pygame.Color("black"), bold=True, words=HUD_LABELS).draw(
+            screen,
+            f"Current Score: {self.current_score}",
+            (0, screen_size.height - screen_size.height // 15),
         )
 
 
 class LivesDisplay:
     """Displays the player's remaining lives on the screen."""
 
-    _font = SysFont("courier", 14, bold=True)
+    _font = SharedFont(14, bold=True)
 
     def __init__(self, lives=2):
         self.lives = lives
@@ -139,10 +190,24 @@ class LivesDisplay:
         """Update the number of lives displayed."""
         self.lives = lives
 
+    def bounds(self) -> list[pygame.Rect]:
+        """Screen area the lives count covers"""
+        return [
+            pygame.Rect(
+                (0, screen_size.height - screen_size.height // 15 - 30),
+                LivesDisplay._font.size(f"Lives: {self.lives}"),
+            )
+        ]
+
+    def appearance(self) -> int:
+        """Changes with the lives"""
+        return self.lives
+
     def draw(self, screen: pygame.Surface):
         """Draw the lives display on the screen."""
         # Draw the lives text above the current score
-        lives_text = LivesDisplay._font.render(
-            f"Lives: {self.lives}", True, pygame.Color("black")
+        glyph_atlas(14, pygame.Color("black"), bold=True, words=HUD_LABELS).draw(
+            screen,
+            f"Lives: {self.lives}",
+            (0, screen_size.height - screen_size.height // 15 - 30),
         )
-        screen.blit(lives_text, (0, screen_size.height - screen_size.height // 15 - 30))
@@ -1,7 +1,7 @@
 """
 Screens
 =======
-Defines and manages the different game screens, including the 
+Defines and manages the different game screens, including the
 start, gameplay, and end screens. Handles button interactions and visual updates.
 
 Class
@@ -23,51 +23,303 @@ from typing import Literal
 
 import pygame
 from pygame import Color
-from pygame.font import SysFont
 
-from breakout import screen_size
+from breakout import display, screen_size
+from breakout.assets import assets
 from breakout.sound import SoundManager
+from breakout.text import SharedFont, get_font, render_text
 
 # pylint: disable=no-member
 
 
+class Layer:
+    """Where screen elements are drawn, elements in higher layers are drawn on top"""
+
+    WORLD = 0  # bricks, balls, paddles and powerups
+    UI = 1  # buttons, score and lives
+    MESSAGE = 2  # launch and pause messages
+
+
+class ElementRegistry:
+    """
+    A screen's elements in drawing order, by layer and then in the order they
+    were added. Adding, removing and checking for an element take the same
+    time however many elements there are, and elements can be given a name
+    to find them by. Adding an element that is already there does nothing.
+    """
+
+    def __init__(self):
+        self.layers = {}  # layer -> {element: None}, in the order added
+        self.layer_of = {}  # element -> its layer
+        self.names = {}  # name -> element
+        self.name_of = {}  # element -> its name
+        self.order = []  # every element in drawing order, rebuilt after changes
+        self.changed = False
+
+    def add(self, element, layer: int = Layer.UI, name: str = None) -> bool:
+        """Add an element to a layer, return False if it was already added"""
+        if name is not None:
+            self.rename(element, name)
+        if element in self.layer_of:
+            return False
+        self.layer_of[element] = layer
+        self.layers.setdefault(layer, {})[element] = None
+        self.changed = True
+        return True
+
+    def rename(self, element, name: str):
+        """Give an element a name, forgetting its old name and the name's old element"""
+        old_name = self.name_of.pop(element, None)
+        if old_name is not None and self.names.get(old_name) is element:
+            del self.names[old_name]
+        old_element = self.names.get(name)
+        if old_element is not None and old_element is not element:
+            del self.name_of[old_element]
+        self.names[name] = element
+        self.name_of[element] = name
+
+    def remove(self, element):
+        """Take an element out, KeyError if it is not here"""
+        layer = self.layer_of.pop(element)
+        del self.layers[layer][element]
+        name = self.name_of.pop(element, None)
+        if name is not None and self.names.get(name) is element:
+            del self.names[name]
+        self.changed = True
+
+    def clear(self):
+        """Take every element out"""
+        self.layers.clear()
+        self.layer_of.clear()
+        self.names.clear()
+        self.name_of.clear()
+        self.order = []
+        self.changed = False
+
+    def __contains__(self, element) -> bool:
+        return element in self.layer_of
+
+    def __len__(self) -> int:
+        return len(self.layer_of)
+
+    def __iter__(self):
+        if self.changed:
+            self.order = [
+                element
+                for layer in sorted(self.layers)
+                for element in self.layers[layer]
+            ]
+            self.changed = False
+        return iter(self.order)
+
+    def __getitem__(self, name: str):
+        """The element added with this name"""
+        return self.names[name]
+
+    def get(self, name: str, default=None):
+        """The element added with this name, or the default if there is none"""
+        return self.names.get(name, default)
+
+
 class ScreenManager:
     """
     Manages a game screen by storing its visual elements and optional background image.
     Provides methods to add elements, draw the screen, and propagate events to the elements.
     This class is intended to be instantiated only within this module.
+
+    Drawing only repaints what changed since the last frame. Elements report
+    the rects they cover with bounds() and a value that changes whenever they
+    look different with appearance(). Elements that change a small part at a
+    time can also report just those rects with damage(), or None to repaint
+    all of their bounds. Sprite groups are always repainted where their
+    sprites were and are. An element without bounds() repaints the whole
+    screen every frame.
+
+    Events only go to the elements that handle their type. Elements list the
+    types in event_types, and are registered for them when added with
+    add_element and forgotten when removed with remove_element or
+    clear_elements, so elements should not be added or removed on the
+    elements registry directly.
     """
 
-    def __init__(self, elements: list, background_image: pygame.Surface = None):
-        self.elements = elements
-        self.background_image = background_image
+    last_drawn: "ScreenManager" = None  # the screen currently on the surface
+    full_redraw_share = 0.5  # repaint everything once this much of the screen changed
 
-    def add_element(self, element):
-        """Give the Screen another element"""
-        self.elements.append(element)
+    def __init__(
+        self,
+        elements: list,
+        background_image: pygame.Surface = None,
+        background_path: str = None,
+    ):
+        self.elements = ElementRegistry()
+        self.handlers = {}  # event type -> elements that handle it
+        for element in elements:
+            self.add_element(element)
+        self.background_image = background_image
+        if background_path:
+            self.background_path = background_path
+        self.areas = {}  # id(element) -> (element, rects, appearance) last frame
+
+    @property
+    def background_image(self) -> pygame.Surface:
+        """The screen's background, scaled to fit when drawn"""
+        if self._background_image is None and self._background_path:
+            self._background_image = assets.image(self._background_path)
+        return self._background_image
+
+    @background_image.setter
+    def background_image(self, image: pygame.Surface):
+        self._background_image = image
+        self._background_path = None
+        self.backgrounds = {}  # surface size -> scaled background
+
+    @property
+    def background_path(self) -> str:
+        """The background's asset path, it is only loaded when the screen is drawn"""
+        return self._background_path
+
+    @background_path.setter
+    def background_path(self, path: str):
+        self.background_image = None
+        self._background_path = path
+
+    def background(self, size: tuple) -> pygame.Surface | None:
+        """The background scaled to a surface size, scaled once per size"""
+        if size not in self.backgrounds:
+            if self._background_path:
+                # only the scaled copy is loaded, the asset cache keeps it
+                self.backgrounds[size] = assets.image(self._background_path, size)
+            elif self._background_image:
+                scaled = pygame.transform.scale(self._background_image, size)
+                self.backgrounds[size] = scaled
+            else:
+                return None
+        return self.backgrounds[size]
+
+    def add_element(self, element, layer: int = Layer.UI, name: str = None):
+        """
+        Give the Screen another element, and send it the events it handles
 
-    def draw(self, pygame_window: pygame.Surface):
-        """Draw the Screen."""
-        if self.background_image:
-            bg = pygame.transform.scale(self.background_image, pygame_window.get_size())
-            pygame_window.blit(bg, (0, 0))
+        Args:
+            element: The element to draw, and send events to.
+            layer: Where it is drawn, see Layer.
+            name: Find the element by this name in the Screen's elements.
+        """
+        if not self.elements.add(element, layer, name):
+            return
+        event_types = getattr(element, "event_types", ())
+        for event_type in event_types:
+            # new lists, so an event being handled still goes to the old ones
+            self.handlers[event_type] = [*self.handlers.get(event_type, ()), element]
+        if event_types and pygame.display.get_init():
+            pygame.event.set_allowed(event_types)
+
+    def remove_element(self, element):
+        """Take an element off the Screen, it gets no more events"""
+        self.elements.remove(element)
+        for event_type in getattr(element, "event_types", ()):
+            handlers = self.handlers.get(event_type, [])
+            if element in handlers:
+                handlers = handlers.copy()
+                handlers.remove(element)
+                self.handlers[event_type] = handlers
+
+    def clear_elements(self):
+        """Take every element off the Screen"""
+        self.elements.clear()
+        self.handlers = {}
+
+    def draw(self, pygame_window: pygame.Surface) -> list[pygame.Rect]:
+        """Draw the Screen, return the rects that changed"""
+        screen_rect = pygame_window.get_rect()
+        full = ScreenManager.last_drawn is not self
+        ScreenManager.last_drawn = self
+
+        areas = {}
+        damage = []
+        for element in self.elements:
+            rects, appearance = element_area(element)
+            if rects is None:
+                full = True
+                continue
+            previous = self.areas.get(id(element))
+            if previous is None:
+                damage += rects
+                if hasattr(element, "damage"):
+                    element.damage()  # painted in full, nothing left to report
+            elif (
+                appearance is None or previous[1] != rects or previous[2] != appearance
+            ):
+                changed = None
+                if previous[1] == rects and hasattr(element, "damage"):
+                    changed = element.damage()
+                damage += previous[1] + rects if changed is None else changed
+            areas[id(element)] = (element, rects, appearance)
+        for key, (_, rects, _) in self.areas.items():
+            if key not in areas:
+                damage += rects  # removed since the last frame
+        self.areas = areas
+
+        damage = merge_rects(rect.clip(screen_rect) for rect in damage)
+        changed = sum(rect.width * rect.height for rect in damage)
+        screen_area = screen_rect.width * screen_rect.height
+        if full or changed > screen_area * self.full_redraw_share:
+            self.repaint(pygame_window, screen_rect)
+            return [screen_rect]
+        for rect in damage:
+            self.repaint(pygame_window, rect)
+        return damage
+
+    def repaint(self, pygame_window: pygame.Surface, rect: pygame.Rect):
+        """Restore the background under a rect and draw the elements touching it"""
+        pygame_window.set_clip(rect)
+        background = self.background(pygame_window.get_size())
+        if background:
+            pygame_window.blit(background, rect, rect)
         else:
             pygame_window.fill(
-                pygame.Color("black")
+                pygame.Color("black"), rect
             )  # clear screen if no background image
 
         for element in self.elements:
-            element.draw(pygame_window)
+            area = self.areas.get(id(element))
+            if area is None or rect.collidelist(area[1]) != -1:
+                element.draw(pygame_window)
+        pygame_window.set_clip(None)
 
     def handle_event(self, event: pygame.event.Event):
-        """Send the event to all elements that might need to respond."""
-        for element in self.elements:
-            try:
-                # Button elements on the screen run functions when clicked
-                element.handle_event(event)
-            except AttributeError:
-                # Groups of Sprites like bricks do not handle events
-                pass
+        """Send the event to the elements that handle its type"""
+        for element in self.handlers.get(event.type, ()):
+            element.handle_event(event)
+
+
+def element_area(element) -> tuple[list | None, object]:
+    """
+    The rects a screen element covers and its appearance, see ScreenManager.
+    Returns None for the rects if the element cannot tell.
+    """
+    if isinstance(element, pygame.sprite.AbstractGroup):
+        return [
+            pygame.Rect(sprite.rect.topleft, sprite.image.get_size())
+            for sprite in element.sprites()
+        ], None
+    if not hasattr(element, "bounds"):
+        return None, None
+    return [pygame.Rect(rect) for rect in element.bounds()], element.appearance()
+
+
+def merge_rects(rects) -> list[pygame.Rect]:
+    """Join overlapping rects until none overlap, dropping empty ones"""
+    merged = []
+    for rect in rects:
+        if rect.width <= 0 or rect.height <= 0:
+            continue
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect = rect.union(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
 
 
 class Button:
@@ -79,7 +331,8 @@ class Button:
     with fixed positioning - top middle and bottom. Most screens have 'middle' and 'bottom' buttons.
     """
 
-    _font = SysFont("courier", 15, bold=True)
+    _font = SharedFont(15, bold=True)
+    event_types = (pygame.MOUSEBUTTONDOWN,)
 
     def __init__(
         self,
@@ -123,6 +376,14 @@ class Button:
         # make the rectangle
         self.rect = pygame.Rect(x, y, width, height)
 
+    def bounds(self) -> list[pygame.Rect]:
+        """Screen area the button covers"""
+        return [self.rect]
+
+    def appearance(self) -> tuple:
+        """Changes when the button looks different"""
+        return self.text, self.rect.collidepoint(display.mouse_pos())
+
     def draw(self, screen: pygame.Surface):
         """
         Screen elements need to be able to draw themselves
@@ -130,21 +391,19 @@ class Button:
         Blit the rectangle on the screen
         """
         # Determine if mouse is hovering over this button
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = display.mouse_pos()
         if self.rect.collidepoint(mouse_pos):
             # mouse is hovering, draw button in hover color, text in color
             pygame.draw.rect(screen, self.hover_color, self.rect)
-            text_surface = Button._font.render(self.text, True, self.color)
         else:
-            # mouse is not hovering, draw button in color, render text in hover color
+            # mouse is not hovering, draw button in color
             pygame.draw.rect(screen, self.color, self.rect)
-            text_surface = Button._font.render(self.text, True, self.hover_color)
 
         # Draw white border
         pygame.draw.rect(screen, pygame.Color("white"), self.rect, 3)
 
         # get the center of the rectangle and blit the text onto the screen there
-        text_surface = Button._font.render(self.text, True, pygame.Color("black"))
+        text_surface = render_text(Button._font, self.text, pygame.Color("black"))
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -167,6 +426,8 @@ class Button:
 class ArrowButton:
     """A special button type in the shape of an arrow"""
 
+    event_types = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
     def __init__(self, direction: Literal["left", "right", "up"]):
         self.pressed = False
         self.color: Color = Color("grey")
@@ -220,6 +481,17 @@ class ArrowButton:
 
         self.direction = direction
 
+    def bounds(self) -> list[pygame.Rect]:
+        """Screen area the arrow covers"""
+        xs = [point[0] for point in self.arrow_points]
+        ys = [point[1] for point in self.arrow_points]
+        left, top = min(xs), min(ys)
+        return [pygame.Rect(left, top, max(xs) - left + 1, max(ys) - top + 1)]
+
+    def appearance(self) -> bool:
+        """Changes when the arrow looks different"""
+        return self.rect.collidepoint(display.mouse_pos())
+
     def draw(self, screen: pygame.surface.Surface):  # pylint: disable=I1101
         """
         Screen elements need to be able to draw themselves
@@ -227,7 +499,7 @@ class ArrowButton:
         Blit the rectangle on the screen
         """
         # Determine if mouse is hovering over this button
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = display.mouse_pos()
         if self.rect.collidepoint(mouse_pos):
             # mouse is hovering, draw button in hover color, text in color
             pygame.draw.polygon(screen, self.hover_color, self.arrow_points)
@@ -250,7 +522,7 @@ class ArrowButton:
 class BlinkingMessage:
     """Displays a launch message with blinking effect."""
 
-    _font = SysFont("courier", max(screen_size.width // 20, 14))
+    _font = SharedFont(max(screen_size.width // 20, 14))
 
     def __init__(
         self,
@@ -278,9 +550,8 @@ class BlinkingMessage:
         self.last_toggle = pygame.time.get_ticks()
         self.visible = True
 
-    def draw(self, screen: pygame.Surface):
-        """Draw the launch message on the screen."""
-        # Toggle visibility based on time elapsed for blinking effect.
+    def blink(self):
+        """Toggle visibility based on time elapsed for blinking effect."""
         now = pygame.time.get_ticks()
         if now - self.last_toggle > self.blink_interval:
             self.visible = not self.visible
@@ -288,10 +559,25 @@ class BlinkingMessage:
             if not self.visible and self.text_list:
                 self.text = self.text_list.pop(0)
 
+    def bounds(self) -> list[pygame.Rect]:
+        """Screen area the message covers"""
+        text_rect = pygame.Rect((0, 0), BlinkingMessage._font.size(self.text))
+        text_rect.center = self.pos
+        return [text_rect.inflate(self.padding * 2, self.padding * 2)]
+
+    def appearance(self) -> tuple:
+        """Changes when the message blinks or its text changes"""
+        self.blink()
+        return self.visible, self.text
+
+    def draw(self, screen: pygame.Surface):
+        """Draw the launch message on the screen."""
+        self.blink()
+
         if self.visible:
             # Render the text.
-            rendered_text = BlinkingMessage._font.render(
-                self.text, True, self.text_color
+            rendered_text = render_text(
+                BlinkingMessage._font, self.text, self.text_color
             )
             text_rect = rendered_text.get_rect(center=self.pos)
 
@@ -307,13 +593,15 @@ class BlinkingMessage:
 class MusicToggle:
     """GUI to allow user to turn off the background music"""
 
+    event_types = (pygame.MOUSEBUTTONDOWN,)
+
     def __init__(self, x=10, y=10, font=None, sound_on=True):
         self.x = x
         self.y = y
         self.label = "MUSIC: "
         self.text_on = "ON"
         self.text_off = "OFF"
-        self.font = font if font else SysFont("courier", 16, bold=True)
+        self.font = font if font else get_font(16, bold=True)
         SoundManager.sound_on = sound_on
 
         # Colors for label and options.
@@ -321,21 +609,21 @@ class MusicToggle:
         self.highlight_color = pygame.Color("#0ffffd")
         self.normal_color = pygame.Color("gray")
 
-        self.label_surface = self.font.render(self.label, True, self.label_color)
+        self.label_surface = render_text(self.font, self.label, self.label_color)
         self.label_rect = self.label_surface.get_rect(topleft=(x, y))
 
         # Position ON and OFF texts to the right of the label.
         self.on_offset = 5  # space between label and ON
         self.between_offset = 10  # space between ON and OFF
 
-        self.on_surface = self.font.render(
+        self.on_surface = render_text(
+            self.font,
             self.text_on,
-            True,
             self.highlight_color if SoundManager.sound_on else self.normal_color,
         )
-        self.off_surface = self.font.render(
+        self.off_surface = render_text(
+            self.font,
             self.text_off,
-            True,
             self.normal_color if SoundManager.sound_on else self.highlight_color,
         )
         self.on_rect = self.on_surface.get_rect(
@@ -351,18 +639,24 @@ class MusicToggle:
         else:
             SoundManager.stop_background_music()
 
+    def bounds(self) -> list[pygame.Rect]:
+        """Screen area the toggle covers"""
+        return [self.label_rect, self.on_rect, self.off_rect]
+
+    def appearance(self) -> bool:
+        """Changes when the music is switched on or off"""
+        return SoundManager.sound_on
+
     def draw(self, surface: pygame.Surface):
         """Draw the music toggle control on the screen."""
         surface.blit(self.label_surface, self.label_rect)
-        # Re-render ON and OFF texts according to state.
+        # Pick the ON and OFF texts for the state, both colorings stay cached
         if SoundManager.sound_on:
-            self.on_surface = self.font.render(self.text_on, True, self.highlight_color)
-            self.off_surface = self.font.render(self.text_off, True, self.normal_color)
+            on_color, off_color = self.highlight_color, self.normal_color
         else:
-            self.on_surface = self.font.render(self.text_on, True, self.normal_color)
-            self.off_surface = self.font.render(
-                self.text_off, True, self.highlight_color
-            )
+            on_color, off_color = self.normal_color, self.highlight_color
+        self.on_surface = render_text(self.font, self.text_on, on_color)
+        self.off_surface = render_text(self.font, self.text_off, off_color)
         surface.blit(self.on_surface, self.on_rect)
         surface.blit(self.off_surface, self.off_rect)
 
@@ -391,3 +685,12 @@ class Screens:
     GAME = ScreenManager([])
     END = ScreenManager([])
     HELP = ScreenManager([])
+
+    @classmethod
+    def element_counts(cls) -> dict[str, int]:
+        """Live elements on each screen, a count that keeps growing is a leak"""
+        return {
+            name: len(screen.elements)
+            for name, screen in vars(cls).items()
+            if isinstance(screen, ScreenManager)
+        }
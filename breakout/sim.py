@@ -0,0 +1,195 @@
+"""
+Sim
+===
+Batch runner for headless games, used for balancing and regression runs.
+Plays N games from a fresh Simulation through game over across a process pool,
+each with a scripted paddle policy and its own seed, and streams one result
+row per game to a JSONL or CSV file as the games finish.
+
+Run `python -m breakout.sim --help` for the options.
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from breakout.core import Inputs, Simulation, tracking_policy
+
+
+def launch_only_policy(state: Simulation) -> Inputs:
+    """Scripted player that launches the ball and never moves the paddle"""
+    return Inputs(launch=not state.launched)
+
+
+policies = {
+    "tracking": tracking_policy,
+    "launch_only": launch_only_policy,
+}
+
+result_fields = [
+    "game",
+    "seed",
+    "policy",
+    "score",
+    "level",
+    "lives",
+    "frames",
+    "game_over",
+    "wall_clock",
+]
+
+
+def run_game(game: int, seed: int, policy: str, max_frames: int) -> dict:
+    """
+    Play one headless game and summarise it
+
+    Args:
+        game: Index of the game in the batch.
+        seed: Seed for the game's random streams.
+        policy: Name of the scripted paddle policy in 'policies'.
+        max_frames: Stop a game that has not ended after this many frames.
+    """
+    choose_inputs = policies[policy]
+    start = time.perf_counter()
+    state = Simulation(seed)
+    while not state.game_is_over and state.frames < max_frames:
+        state.step(choose_inputs(state))
+    return {
+        "game": game,
+        "seed": seed,
+        "policy": policy,
+        "score": state.score,
+        "level": state.level,
+        "lives": state.lives,
+        "frames": state.frames,
+        "game_over": state.game_is_over,
+        "wall_clock": round(time.perf_counter() - start, 4),
+    }
+
+
+def run_batch(
+    games: int,
+    seed: int = 0,
+    policy: str = "tracking",
+    max_frames: int = 500_000,
+    workers: int = None,
+):
+    """
+    Play games across a process pool and yield each result as its game finishes.
+    Game i is seeded with seed + i.
+    """
+    # each Simulation has its own config, so warm workers play game after game
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run_game, game, seed + game, policy, max_frames)
+            for game in range(games)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+class ResultWriter:
+    """Write result rows to a JSONL or CSV file, flushing after every row"""
+
+    def __init__(self, path: Path, file_format: str = None):
+        self.format = file_format or ("csv" if path.suffix == ".csv" else "jsonl")
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.csv = None
+        if self.format == "csv":
+            self.csv = csv.DictWriter(self.file, fieldnames=result_fields)
+            self.csv.writeheader()
+
+    def write(self, result: dict):
+        """Write one game's result"""
+        if self.csv:
+            self.csv.writerow(result)
+        else:
+            self.file.write(json.dumps(result) + "\n")
+        self.file.flush()
+
+    def close(self):
+        """Close the output file"""
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def parse_args(argv: list[str] = None) -> argparse.Namespace:
+    """Read the command line options"""
+    parser = argparse.ArgumentParser(
+        prog="python -m breakout.sim",
+        description="Play headless Breakout games in parallel and record the results.",
+    )
+    parser.add_argument("-n", "--games", type=int, default=100, help="games to play")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("sim_results.jsonl"),
+        help="result file, .csv for CSV output, anything else is JSONL",
+    )
+    parser.add_argument(
+        "--format", choices=["jsonl", "csv"], help="override the file type"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--policy", choices=sorted(policies), default="tracking")
+    parser.add_argument(
+        "--max-frames",
+        type=int,
+        default=500_000,
+        help="stop games that have not ended after this many frames",
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=os.cpu_count(), help="worker processes"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] = None):
+    """Run the batch and report progress on stderr"""
+    args = parse_args(argv)
+    start = time.perf_counter()
+    with ResultWriter(args.output, args.format) as writer:
+        for finished, result in enumerate(
+            run_batch(
+                args.games, args.seed, args.policy, args.max_frames, args.workers
+            ),
+            start=1,
+        ):
+            writer.write(result)
+            print(
+                f"[{finished}/{args.games}] game {result['game']}: "
+                f"score {result['score']}, level {result['level']}, "
+                f"{result['frames']} frames in {result['wall_clock']}s",
+                file=sys.stderr,
+            )
+    print(
+        f"{args.games} games in {time.perf_counter() - start:.1f}s -> {args.output}",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
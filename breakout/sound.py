@@ -2,8 +2,12 @@
 Sound
 =======
 Handles sound files and sound effects for the game.
-This module initializes the pygame mixer and provides a SoundManager class
-that loads and plays sound effects and background music from the game's sounds folder.
+This module provides a SoundManager class that starts the pygame mixer when a
+sound is first needed, then loads and plays sound effects and background music
+from the game's sounds folder.
+Background music is streamed from disk a little at a time, with the next track
+queued so it starts without a gap. Sound effects are short, so they are decoded
+whole, on a background thread so the game does not wait for them.
 
 Class
 -----
@@ -19,124 +23,174 @@ Terrence Jackson
 Thomas Nugent
 """
 
+import threading
 import time
 
 import pygame
 
 from breakout import base_path
 
-# Initialize the mixer (if not already initialized elsewhere)
-pygame.mixer.init()
 # pylint: disable=no-member
 
+MUSIC_END = pygame.USEREVENT + 1  # posted when a music track ends
+
 
 class SoundManager:
     """
     Manages sound effects and background music for the game.
 
     Sound files are loaded from the "sounds" directory located at base_path.
-    If a sound file fails to load, its attribute is set to None.
+    Effects that fail to load stay silent, and missing music tracks are skipped.
     """
 
     sound_on = True
     sound_path = base_path.joinpath("sounds")
-
-    try:
-        powerup_sound = pygame.mixer.Sound(
-            str(sound_path.joinpath("powerup_catch.wav"))
-        )
-        brick_sound = pygame.mixer.Sound(str(sound_path.joinpath("brick_hit.wav")))
-        paddle_sound = pygame.mixer.Sound(str(sound_path.joinpath("wall_sound.wav")))
-        wall_sound = pygame.mixer.Sound(str(sound_path.joinpath("wall_sound.wav")))
-        life_lost_sound = pygame.mixer.Sound(str(sound_path.joinpath("life_lost.wav")))
-        game_over_sound = pygame.mixer.Sound(str(sound_path.joinpath("game_over.wav")))
-        background_music = [
-            pygame.mixer.Sound(str(sound_path.joinpath("background_music1.mp3"))),
-            pygame.mixer.Sound(str(sound_path.joinpath("background_music2.mp3"))),
-            pygame.mixer.Sound(str(sound_path.joinpath("background_music3.mp3"))),
-        ]
-    except (FileNotFoundError, pygame.error) as e:
-        print("Error loading sound effects:", e)
-        powerup_sound = None
-        brick_sound = None
-        paddle_sound = None
-        wall_sound = None
-        life_lost_sound = None
-        game_over_sound = None
-        background_music = None
-
-    sound_effects = [
-        powerup_sound,
-        brick_sound,
-        paddle_sound,
-        wall_sound,
-        life_lost_sound,
-        game_over_sound,
+    effect_files = {
+        "powerup": "powerup_catch.wav",
+        "brick": "brick_hit.wav",
+        "paddle": "wall_sound.wav",
+        "wall": "wall_sound.wav",
+        "life_lost": "life_lost.wav",
+        "game_over": "game_over.wav",
+    }
+    music_files = [
+        "background_music1.mp3",
+        "background_music2.mp3",
+        "background_music3.mp3",
     ]
-    if background_music:
-        music_channel = pygame.mixer.Channel(1)
-        current_music = 0
-        music_channel.set_endevent(pygame.USEREVENT + 1)
-        music_channel.play(background_music[current_music])
+
+    effects = {}  # name -> decoded Sound, filled in by the loading thread
+    effects_loader: threading.Thread = None
+    background_music = None  # paths of the tracks found, looked up on first play
+    current_music = 0
+    music_started = False
+    mixer_failed = False  # no audio device, the game stays silent
 
     @staticmethod
-    def play_powerup():
-        """Plays powerup sound"""
-        if SoundManager.powerup_sound and SoundManager.sound_on:
-            SoundManager.powerup_sound.play()
+    def init_mixer() -> bool:
+        """Start the mixer the first time a sound is needed, False if it can't"""
+        if not pygame.mixer.get_init() and not SoundManager.mixer_failed:
+            try:
+                pygame.mixer.init()
+            except pygame.error as e:
+                print("Error starting the sound mixer:", e)
+                SoundManager.mixer_failed = True
+        return not SoundManager.mixer_failed
 
     @staticmethod
-    def play_brick():
-        """Plays brick hit sound"""
-        if SoundManager.brick_sound and SoundManager.sound_on:
-            SoundManager.brick_sound.play()
+    def load_effects() -> threading.Thread:
+        """Start decoding the sound effects in the background, once"""
+        if SoundManager.effects_loader is None and SoundManager.init_mixer():
+            SoundManager.effects_loader = threading.Thread(
+                target=SoundManager.decode_effects, daemon=True
+            )
+            SoundManager.effects_loader.start()
+        return SoundManager.effects_loader
 
     @staticmethod
-    def play_paddle():
-        """Plays paddle hit sound"""
-        if SoundManager.paddle_sound and SoundManager.sound_on:
-            SoundManager.paddle_sound.play()
+    def decode_effects():
+        """Decode every sound effect, files that share a sound decode once"""
+        decoded = {}
+        for name, filename in SoundManager.effect_files.items():
+            if filename not in decoded:
+                try:
+                    decoded[filename] = pygame.mixer.Sound(
+                        str(SoundManager.sound_path.joinpath(filename))
+                    )
+                except (FileNotFoundError, pygame.error) as e:
+                    print("Error loading sound effects:", e)
+                    decoded[filename] = None
+            if decoded[filename]:
+                SoundManager.effects[name] = decoded[filename]
 
     @staticmethod
-    def play_wall():
-        """Plays wall hit sound"""
-        if SoundManager.wall_sound and SoundManager.sound_on:
-            SoundManager.wall_sound.play()
+    def play(name: str):
+        """Play a sound effect by name, e.g. 'wall'"""
+        if name == "game_over":
+            SoundManager.play_game_over()
+        else:
+            SoundManager.play_effect(name)
 
     @staticmethod
-    def play_life_lost():
-        """Plays life lost sound"""
-        if SoundManager.life_lost_sound and SoundManager.sound_on:
-            SoundManager.life_lost_sound.play()
+    def play_effect(name: str):
+        """Play a sound effect if it has been decoded, they load in the background"""
+        SoundManager.load_effects()
+        effect = SoundManager.effects.get(name)
+        if effect and SoundManager.sound_on:
+            effect.play()
 
     @staticmethod
     def play_game_over():
         """Plays game over sound"""
         SoundManager.stop_background_music()
-        if SoundManager.game_over_sound and SoundManager.sound_on:
-            SoundManager.game_over_sound.play()
+        SoundManager.load_effects()
+        game_over_sound = SoundManager.effects.get("game_over")
+        if game_over_sound and SoundManager.sound_on:
+            game_over_sound.play()
             time.sleep(1)
             SoundManager.play_background_music()
 
+    @staticmethod
+    def music_tracks() -> list:
+        """Paths of the background music tracks that exist"""
+        if SoundManager.background_music is None:
+            tracks = [
+                SoundManager.sound_path.joinpath(filename)
+                for filename in SoundManager.music_files
+            ]
+            SoundManager.background_music = [
+                str(track) for track in tracks if track.exists()
+            ]
+            if len(SoundManager.background_music) < len(tracks):
+                missing = [str(track) for track in tracks if not track.exists()]
+                print("Error loading background music:", ", ".join(missing))
+        return SoundManager.background_music
+
+    @staticmethod
+    def next_track() -> str:
+        """The track after the current one, going back to the first after the last"""
+        tracks = SoundManager.music_tracks()
+        return tracks[(SoundManager.current_music + 1) % len(tracks)]
+
     @staticmethod
     def play_background_music():
         """Play the background music on loop."""
-        if SoundManager.background_music and SoundManager.sound_on:
-            SoundManager.music_channel.unpause()
-            if not SoundManager.music_channel.get_busy():
-                SoundManager.music_channel.play(
-                    SoundManager.background_music[SoundManager.current_music]
-                )
+        tracks = SoundManager.music_tracks()
+        if not tracks or not SoundManager.sound_on or not SoundManager.init_mixer():
+            return
+        if SoundManager.music_started:
+            pygame.mixer.music.unpause()
+            return
+        try:
+            pygame.mixer.music.load(tracks[SoundManager.current_music])
+            pygame.mixer.music.set_endevent(MUSIC_END)
+            pygame.mixer.music.play()
+            pygame.mixer.music.queue(SoundManager.next_track())
+        except pygame.error as e:
+            print("Error playing background music:", e)
+            SoundManager.background_music = []
+            return
+        SoundManager.music_started = True
 
     @staticmethod
     def stop_background_music():
         """Stops the background screen music."""
-        if SoundManager.background_music:
-            SoundManager.music_channel.pause()
+        if SoundManager.music_started:
+            pygame.mixer.music.pause()
+
+    @staticmethod
+    def handle_event(event: pygame.event.Event):
+        """When a track ends the queued one has started, so queue the one after it"""
+        if event.type == MUSIC_END and SoundManager.music_started:
+            tracks = SoundManager.music_tracks()
+            SoundManager.current_music = (SoundManager.current_music + 1) % len(tracks)
+            try:
+                pygame.mixer.music.queue(SoundManager.next_track())
+            except pygame.error as e:
+                print("Error playing background music:", e)
 
     @staticmethod
     def stop_other_sounds():
         """Stops all sounds except background music."""
-        for sound in SoundManager.sound_effects:
-            if sound:
-                sound = None
+        for effect in SoundManager.effects.values():
+            effect.stop()
@@ -0,0 +1,226 @@
+"""
+Text
+====
+Fonts and rendered text. The game ships its own monospace font, opened once
+per size on first use instead of searching the system fonts at import.
+Buttons, the HUD and the leaderboard draw the same strings frame after frame,
+so each (font, text, color, antialias) is rendered once and the surface is
+reused until it falls out of the cache. The cache is least recently used
+first out, capped by the bytes its surfaces take. Glyph atlases go one step
+further for text that changes often, like the score, composing it from
+characters drawn once.
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import string
+from collections import OrderedDict
+
+import pygame
+
+from breakout import base_path
+
+# pylint: disable=no-member
+FONT_FILES = {False: "SourceCodePro-Regular.ttf", True: "SourceCodePro-Bold.ttf"}
+ATLAS_CHARS = string.digits + string.punctuation + " "
+
+fonts = {}  # (size, bold) -> the shared pygame Font
+atlases = {}  # (size, bold, color, words) -> the shared GlyphAtlas
+
+
+def get_font(size: int, bold: bool = False) -> pygame.font.Font:
+    """The bundled font at a size, opened on first use and shared after"""
+    key = (size, bold)
+    if key not in fonts:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        path = base_path.joinpath("fonts", FONT_FILES[bold])
+        fonts[key] = pygame.font.Font(str(path), size)
+    return fonts[key]
+
+
+class SharedFont:
+    """
+    Class attribute for an element's font, e.g. _font = SharedFont(14)
+    The font is opened the first time the attribute is read, not at import.
+    """
+
+    def __init__(self, size: int, bold: bool = False):
+        self.size = size
+        self.bold = bold
+
+    def __get__(self, instance, owner) -> pygame.font.Font:
+        return get_font(self.size, self.bold)
+
+
+class TextCache:
+    """Rendered text surfaces, least recently used first out"""
+
+    def __init__(self, max_bytes: int = 4 * 1024 * 1024):
+        """
+        Create an empty cache.
+
+        Args:
+            max_bytes: Most bytes of surface pixels to keep.
+        """
+        self.max_bytes = max_bytes
+        self.surfaces = OrderedDict()  # key -> rendered surface, oldest first
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color,
+        antialias: bool = True,
+    ) -> pygame.Surface:
+        """Font.render, from the cache when the same text was rendered before"""
+        key = (font, text, tuple(pygame.Color(color)), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        self.nbytes += surface_bytes(surface)
+        while self.nbytes > self.max_bytes and len(self.surfaces) > 1:
+            _, oldest = self.surfaces.popitem(last=False)
+            self.nbytes -= surface_bytes(oldest)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Drop every surface and reset the counters"""
+        self.surfaces.clear()
+        self.nbytes = self.hits = self.misses = self.evictions = 0
+
+
+class GlyphAtlas:
+    """
+    Characters and fixed labels of a monospace font drawn once, stacked on one
+    surface. Strings made of them are composed by blitting, no font rendering.
+    Characters whose glyph spills out of its cell are left out, since they
+    would not line up with rendered text, and strings using them are rendered.
+    """
+
+    def __init__(
+        self,
+        atlas_font: pygame.font.Font,
+        color,
+        chars: str = ATLAS_CHARS,
+        words: tuple[str, ...] = (),
+        antialias: bool = True,
+    ):
+        """
+        Draw the glyphs
+
+        Args:
+            atlas_font: A monospace font, every glyph one advance wide.
+            color: The color to draw the glyphs in.
+            chars: The single characters to draw.
+            words: Fixed labels to draw whole, e.g. "Lives: ".
+            antialias: Whether the glyphs have smooth edges.
+        """
+        self.font = atlas_font
+        self.color = pygame.Color(color)
+        self.antialias = antialias
+        self.advance = atlas_font.metrics("0")[0][4]
+        self.height = atlas_font.get_height()
+        chars = [
+            char
+            for char in chars
+            if atlas_font.size(char) == (self.advance, self.height)
+        ]
+        # longest first, so a label wins over a shorter one it starts with
+        self.words = sorted(words, key=len, reverse=True)
+        pieces = ["".join(chars), *self.words]
+        width = max(self.advance * len(piece) for piece in pieces)
+        self.surface = pygame.Surface(
+            (max(width, 1), self.height * len(pieces)), pygame.SRCALPHA
+        )
+        self.areas = {}  # character or label -> its rect on the atlas surface
+        for i, char in enumerate(chars):
+            area = pygame.Rect(i * self.advance, 0, self.advance, self.height)
+            self.surface.blit(atlas_font.render(char, antialias, self.color), area)
+            self.areas[char] = area
+        for row, word in enumerate(self.words, start=1):
+            area = pygame.Rect((0, row * self.height), atlas_font.size(word))
+            self.surface.blit(atlas_font.render(word, antialias, self.color), area)
+            self.areas[word] = area
+
+    def size(self, text: str) -> tuple[int, int]:
+        """Width and height of the text, like Font.size"""
+        return self.advance * len(text), self.height
+
+    def pieces(self, text: str) -> list[str]:
+        """Split the text into atlas labels and characters, None if it can't be"""
+        pieces = []
+        start = 0
+        while start < len(text):
+            for word in self.words:
+                if text.startswith(word, start):
+                    break
+            else:
+                word = text[start]
+                if word not in self.areas:
+                    return None
+            pieces.append(word)
+            start += len(word)
+        return pieces
+
+    def draw(self, surface: pygame.Surface, text: str, pos: tuple) -> pygame.Rect:
+        """Blit the text with its top left at pos, return the area it covers"""
+        pieces = self.pieces(text)
+        if pieces is None:
+            rendered = cache.render(self.font, text, self.color, self.antialias)
+            return surface.blit(rendered, pos)
+        x, y = pos
+        blits = []
+        for piece in pieces:
+            blits.append((self.surface, (x, y), self.areas[piece]))
+            x += self.advance * len(piece)
+        surface.blits(blits, doreturn=False)
+        return pygame.Rect(pos, self.size(text))
+
+
+def glyph_atlas(
+    size: int, color, bold: bool = False, words: tuple[str, ...] = ()
+) -> GlyphAtlas:
+    """The shared atlas of the bundled font at a size and color"""
+    key = (size, bold, tuple(pygame.Color(color)), words)
+    if key not in atlases:
+        atlases[key] = GlyphAtlas(get_font(size, bold), color, words=words)
+    return atlases[key]
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Bytes of pixel data a surface holds"""
+    return surface.get_pitch() * surface.get_height()
+
+
+cache = TextCache()  # shared by every screen element
+
+
+def render_text(font: pygame.font.Font, text: str, color, antialias: bool = True):
+    """Render text through the shared cache"""
+    return cache.render(font, text, color, antialias)
@@ -0,0 +1,116 @@
+"""
+Timestep
+========
+Fixed-timestep game loop helpers.
+The simulation always advances in steps of the same length, however fast the
+screen is drawn. Renderers feed each frame's elapsed time to a FixedTimestep
+to learn how many steps to run, and draw the moving pieces part way between
+the last two steps with an Interpolator so motion stays smooth at any frame
+rate. Speeds are pixels per step at TICK_RATE, and steps of any other length
+move everything by its speed scaled to the step, so the tick rate changes how
+smooth the game is but not how fast it plays.
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+from contextlib import contextmanager
+
+TICK_RATE = 50  # default simulation steps per second, speeds are pixels per step
+FRAME_TIME = 1000 / TICK_RATE  # milliseconds per step at the default tick rate
+
+
+class FixedTimestep:
+    """
+    Accumulator that turns variable frame times into whole simulation steps.
+    Time is kept in integer units of 1/tick_rate milliseconds, so the same
+    total time always gives the same number of steps however it was split up.
+    """
+
+    max_frame_time = 250  # milliseconds, longer stalls are dropped, not replayed
+
+    def __init__(self, tick_rate: int = TICK_RATE):
+        self.tick_rate = tick_rate
+        self.dt = 1000 / tick_rate  # milliseconds per step
+        self.accumulator = 0
+
+    def advance(self, elapsed: int) -> int:
+        """
+        Add a frame's elapsed time and return how many steps are now due
+
+        Args:
+            elapsed: Milliseconds since the previous frame.
+        """
+        self.accumulator += min(elapsed, self.max_frame_time) * self.tick_rate
+        ticks = self.accumulator // 1000
+        self.accumulator -= ticks * 1000
+        return int(ticks)
+
+    @property
+    def alpha(self) -> float:
+        """How far the renderer is between the last step and the next, 0 to 1"""
+        return self.accumulator / 1000
+
+    def reset(self):
+        """Drop any time left over, e.g. when a new game starts"""
+        self.accumulator = 0
+
+
+class Interpolator:
+    """
+    Blend the moving pieces of a game between their last two steps for drawing.
+    Call record() before each step and draw inside blend().
+    """
+
+    max_jump = 50  # pixels, pieces that moved further were reset, drawn in place
+
+    def __init__(self):
+        self.previous = {}
+
+    @staticmethod
+    def moving_pieces(state) -> list:
+        """The balls, paddles and powerups of a game"""
+        return (
+            state.ball_group.sprites()
+            + state.paddle_group.sprites()
+            + state.powerup_group.sprites()
+        )
+
+    def record(self, state):
+        """Remember where every moving piece is before the next step"""
+        self.previous = {
+            piece: piece.rect.topleft for piece in self.moving_pieces(state)
+        }
+
+    @contextmanager
+    def blend(self, state, alpha: float):
+        """Move pieces to their blended positions and put them back afterwards"""
+        current = {}
+        for piece in self.moving_pieces(state):
+            previous = self.previous.get(piece)
+            if previous is None:
+                continue  # new this step
+            x, y = piece.rect.topleft
+            jump = max(abs(x - previous[0]), abs(y - previous[1]))
+            if jump > self.max_jump:
+                continue
+            current[piece] = (x, y)
+            piece.rect.topleft = (
+                previous[0] + (x - previous[0]) * alpha,
+                previous[1] + (y - previous[1]) * alpha,
+            )
+        try:
+            yield
+        finally:
+            for piece, position in current.items():
+                piece.rect.topleft = position
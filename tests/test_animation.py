@@ -0,0 +1,96 @@
+"""
+Test Animation
+==============
+Test animations show their frames on a timeline, and that flickering and
+exploding sprites only swap between frames drawn before the game starts
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import pygame
+
+from breakout.__main__ import Game
+from breakout.animation import Animation
+from breakout.assets import assets
+from breakout.core import PowerupConfig, tracking_policy
+from breakout.powerups import EXPLOSION_STAGES, PowerDown, PowerUp
+from breakout.screens import Screens
+
+
+def test_frames_on_a_timeline():
+    """Looping animations start again, the others stay on their last frame."""
+    frames = [pygame.Surface((1, 1)) for _ in range(3)]
+    flicker = Animation(frames, 100)
+    assert flicker.frame(0) is frames[0]
+    assert flicker.frame(199) is frames[1]
+    assert flicker.frame(300) is frames[0]
+
+    once = Animation(frames, 100, loop=False)
+    assert once.frame(250) is frames[2]
+    assert once.frame(10_000) is frames[2]
+    assert once.nbytes() == sum(frame.get_pitch() for frame in frames)
+    assert Animation(frames[:1] * 3, 100).nbytes() == frames[0].get_pitch()
+
+
+def test_explosion_grows_then_fires():
+    """An exploding bomb steps through its stages until its power fires."""
+    game = Game(seed=2)
+    game.start_new_game()
+    state = game.state
+    bomb = PowerDown(state.powerup_group, rng=state.rng)
+    bomb.explode()
+    shown = [bomb.image]
+    for _ in range(200):
+        bomb.move(state)
+        state.clock += 20
+        if not bomb.alive():
+            break
+        if bomb.image is not shown[-1]:
+            shown.append(bomb.image)
+    assert not bomb.alive()
+    assert shown == list(bomb.explosion.frames)
+    assert len(shown) == len(EXPLOSION_STAGES)
+
+
+def test_animating_draws_nothing(monkeypatch):
+    """Once a game starts, flickering and explosions never draw a frame."""
+    game = Game(seed=3)
+    game.switch_screen(Screens.GAME)
+    game.launch()
+    state = game.state
+    builds = assets.builds
+
+    def draw(*args):
+        raise AssertionError(f"sprite drawn during play: {args}")
+
+    for name in ("circle", "rect", "polygon", "line"):
+        monkeypatch.setattr(pygame.draw, name, draw)
+
+    powerups = [
+        PowerUp(state.powerup_group, shape=shape, rng=state.rng)
+        for shape in ("circle", "rectangle")
+    ]
+    bombs = [PowerDown(state.powerup_group, rng=state.rng) for _ in range(10)]
+    for bomb in bombs:
+        bomb.explode()
+    state.add_paddle()
+    big_paddle = state.paddle_group.sprites()[-1]
+    for _ in range(60):
+        for powerup in powerups:
+            powerup.last_toggle -= PowerupConfig.blink_interval + 1
+            powerup.move(state)
+        big_paddle.last_toggle -= big_paddle.blink_interval + 1
+        big_paddle.change_color()
+        state.step(tracking_policy(state))
+    assert assets.builds == builds
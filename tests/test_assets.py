@@ -0,0 +1,126 @@
+"""
+Test Assets
+===========
+Test the asset cache loads, converts and scales each image once,
+and that sprites share the images they draw
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import pygame
+
+from breakout.__main__ import Game
+from breakout.assets import AssetCache, assets
+from breakout.ball import Ball
+from breakout.bricks import Brick
+from breakout.core import PaddleConfig, tracking_policy
+from breakout.paddle import Paddle
+from breakout.powerups import HEART_PATH, ExtraLifePowerup, PowerDown, PowerUp
+from breakout.screens import Screens
+
+
+def test_images_load_once():
+    """Each file is read once, scaled copies come from the loaded image."""
+    Game()  # opens the window, so images are converted
+    cache = AssetCache()
+    heart = cache.image(HEART_PATH, alpha=True)
+    assert cache.image(HEART_PATH, alpha=True) is heart
+    assert heart.get_flags() & pygame.SRCALPHA
+
+    small = cache.image(HEART_PATH, (20, 20), alpha=True)
+    assert small.get_size() == (20, 20)
+    assert cache.image(HEART_PATH, [20, 20], alpha=True) is small
+    opaque = cache.image(HEART_PATH)
+    assert not opaque.get_flags() & pygame.SRCALPHA
+    assert cache.loads == 2  # once per format
+
+    nbytes = cache.nbytes()
+    assert nbytes[(HEART_PATH, (20, 20), True)] == small.get_pitch() * 20
+    assert len(nbytes) == 3
+
+
+def test_missing_images_are_not_retried():
+    """A file that fails to load is reported once and then remembered."""
+    cache = AssetCache()
+    assert cache.image("textures/missing.png") is None
+    assert cache.image("textures/missing.png", (10, 10)) is None
+    assert cache.loads == 1
+    assert not cache.nbytes()
+
+
+def test_playing_never_reads_the_disk(monkeypatch):
+    """After a game starts, spawning sprites and drawing load nothing."""
+    game = Game(seed=4)
+    game.switch_screen(Screens.GAME)
+    game.launch()
+
+    def load(*args):
+        raise AssertionError(f"image loaded during play: {args}")
+
+    monkeypatch.setattr(pygame.image, "load", load)
+    state = game.state
+    for _ in range(5):
+        ExtraLifePowerup(state.powerup_group, rng=state.rng)
+        Brick(color=pygame.Color("red"), texture=True)
+    for _ in range(300):
+        state.step(tracking_policy(state))
+        Screens.GAME.draw(game.display.surface)
+
+
+def test_sprites_share_images():
+    """Sprites that look alike share one image, drawn once."""
+    Game()
+    builds = assets.builds
+    bricks = [Brick(color=pygame.Color("green")) for _ in range(48)]
+    balls = [Ball() for _ in range(50)]
+    assert len({id(brick.image) for brick in bricks}) == 1
+    assert len({id(ball.image) for ball in balls}) == 1
+    assert assets.builds - builds <= 2
+
+    # a cracked unbreakable brick switches image, the others keep the texture
+    group = pygame.sprite.Group()
+    textured = [Brick(group, color=pygame.Color("red"), texture=True) for _ in range(2)]
+    assert textured[0].image is textured[1].image
+    textured[0].hit()
+    assert textured[0].image is Brick(color=pygame.Color("red")).image
+    assert textured[1].image is not textured[0].image
+    textured[0].hit()
+    assert not textured[0].alive()
+    assert not pygame.mask.from_surface(textured[0].image).count()  # cleared
+
+
+def test_flicker_swaps_shared_images():
+    """Flickering sprites change which image they show, not the shared pixels."""
+    game = Game()
+    paddle = Paddle(color=pygame.Color("white"))
+    white = paddle.image
+    pixels = pygame.image.tobytes(white, "RGB")
+    paddle.last_toggle = -PaddleConfig.blink_interval - 1
+    paddle.change_color()
+    assert paddle.image is not white
+    assert pygame.image.tobytes(white, "RGB") == pixels
+    assert Paddle(color=pygame.Color("white")).image is white
+
+    powerup = PowerUp(color=0, rng=game.state.rng)
+    first = powerup.image
+    powerup.change_color()
+    assert powerup.image is not first
+    assert PowerUp(color=1, rng=game.state.rng).image is powerup.image
+
+    bomb = PowerDown(rng=game.state.rng)
+    shared = bomb.image
+    pixels = pygame.image.tobytes(shared, "RGBA")
+    bomb.explode()
+    assert bomb.image is not shared  # explosions get their own copy
+    assert pygame.image.tobytes(shared, "RGBA") == pixels
@@ -18,14 +18,15 @@ Terrence Jackson
 Thomas Nugent
 """
 
-from dataclasses import astuple
+from dataclasses import FrozenInstanceError, astuple
 
-from pygame import Color, sprite
+import pytest
+from pygame import Color, Surface, sprite
 
-from breakout import screen_size
+from breakout import Position, Speed, screen_size
 from breakout.__main__ import GameState
 from breakout.ball import Ball, BallConfig
-from breakout.bricks import Brick
+from breakout.bricks import Brick, BrickLayer
 from breakout.paddle import Paddle, PaddleConfig
 
 
@@ -120,6 +121,27 @@ def test_ball_brick_collision():
     ), f"Expected brick to be removed, but {len(brick_group)} bricks remain"
 
 
+def test_ball_brick_field_collision():
+    """Balls score and bounce off a drawable brick field the same way."""
+    field = BrickLayer(1, 2, left=100, top=100, size=(51, 25), gap=10)
+    field.place(0, 0, "red", 3)
+    field.place(0, 1, "yellow", 2, unbreakable=True)
+    ball = Ball()
+
+    ball.rect.bottom = 105
+    ball.rect.right = 101
+    assert ball.handle_brick_collisions(field) == 3
+    ball.rect.bottom = 105
+    ball.rect.left = 165
+    assert ball.handle_brick_collisions(field) == 0  # cracked, still there
+    assert len(field) == 1
+
+    surface = Surface(astuple(screen_size))
+    field.draw(surface)
+    assert surface.get_at((161 + 25, 112))[:3] == (255, 255, 0)
+    assert surface.get_at((100 + 25, 112))[:3] == (0, 0, 0)
+
+
 def test_ball_life_lost():
     """Test that the player loses a life when the ball falls below the screen."""
     state = GameState()
@@ -215,3 +237,56 @@ def test_paddle_move_right_boundary():
     max_x = screen_size.width - paddle.rect.width
     assert paddle.position.x == max_x
     assert paddle.rect.x == max_x
+
+
+def test_moving_changes_positions_in_place():
+    """Balls and paddles move their own Position, never a config default."""
+    state = GameState()
+    ball, paddle = state.ball, state.paddle
+    loose = Ball(speed=Speed(1, -2))  # a ball outside a ball store
+    positions = [ball.position, paddle.position, loose.position]
+    ball.update_position()
+    paddle.move_right()
+    loose.update_position()
+    moved = [ball.position, paddle.position, loose.position]
+    assert all(new is old for new, old in zip(moved, positions))
+    assert loose.position == Position(
+        BallConfig.initial_position.x + 1, BallConfig.initial_position.y - 2
+    )
+    assert paddle.speed is not PaddleConfig.speed
+
+    with pytest.raises(FrozenInstanceError):
+        BallConfig.initial_position.x = 0
+    with pytest.raises(FrozenInstanceError):
+        PaddleConfig.speed.x += 1
+
+
+def test_bricks_own_their_positions():
+    """Bricks built with the default or a shared position never share it."""
+    first, second = Brick(color=Color("red")), Brick(color=Color("red"))
+    first.position.x = 50
+    assert second.position == Position(0, 0)
+
+    corner = Position(100, 100)
+    brick = Brick(color=Color("red"), position=corner)
+    brick.position.y = 0
+    assert corner == Position(100, 100)
+
+
+def test_paddles_flicker_on_their_own():
+    """Each paddle speeds up its own flicker, starting from the config value."""
+    state = GameState()
+    state.add_paddle()
+    first = state.paddle_group.sprites()[-1]
+    for _ in range(3):
+        first.last_toggle -= first.blink_interval + 1
+        first.change_color()
+    assert first.blink_interval == PaddleConfig.blink_interval / 1.25**3
+
+    state.add_paddle()
+    second = state.paddle_group.sprites()[-1]
+    second.last_toggle -= PaddleConfig.blink_interval + 1
+    second.change_color()
+    assert second.blink_interval == PaddleConfig.blink_interval / 1.25
+    assert first.blink_interval == PaddleConfig.blink_interval / 1.25**3
+    assert "paddle_blink_interval" not in state.snapshot()["config"]
@@ -0,0 +1,190 @@
+"""
+Test Core
+=========
+Test the headless simulation used by the game and batch tooling
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pygame
+
+import breakout
+from breakout.core import (
+    BallBody,
+    BallConfig,
+    Box,
+    BrickBody,
+    GameConfig,
+    Group,
+    Inputs,
+    PaddleBody,
+    PaddleConfig,
+    Simulation,
+    tracking_policy,
+)
+
+
+def test_core_does_not_import_pygame():
+    """Importing the core must not pull in pygame or initialise anything."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, breakout.core; print('pygame' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_package_lists_every_submodule():
+    """Every module of the package can be imported lazily and is in __all__."""
+    modules = {
+        path.stem
+        for path in Path(breakout.__file__).parent.glob("*.py")
+        if not path.stem.startswith("__")
+    }
+    assert modules == set(breakout.submodules)
+    assert modules <= set(breakout.__all__)
+
+
+def test_box_matches_pygame_rect():
+    """Box setters and collisions agree with pygame.Rect."""
+    box = Box(10, 10, 20, 20)
+    rect = pygame.Rect(10, 10, 20, 20)
+    for attr, value in [("bottom", 105.5), ("right", 51.2), ("center", (30.5, 40))]:
+        setattr(box, attr, value)
+        setattr(rect, attr, value)
+        assert tuple(box) == tuple(rect), attr
+
+    other = Box(box.right, box.y, 5, 5)  # touching edges do not collide
+    assert box.colliderect(other) == rect.colliderect(pygame.Rect(tuple(other)))
+    assert bool(box.clipline(box.topleft, box.topright))
+    assert not box.clipline((0, 0), (0, 5))
+
+
+def test_entity_group_membership():
+    """Bodies join and leave groups like pygame sprites."""
+    group = Group()
+    brick = BrickBody(group, color="red", position=(0, 0))
+    assert brick.alive() and len(group) == 1
+
+    assert brick.hit() == 3
+    assert not brick.alive() and len(group) == 0
+
+
+def test_step_launch_and_pause():
+    """Inputs launch the ball and toggle pause."""
+    state = Simulation()
+    ball_y = state.ball.position.y
+
+    state.step(Inputs())
+    assert not state.launched and state.ball.position.y == ball_y
+
+    state.step(Inputs(launch=True))
+    assert state.launched and state.ball.position.y < ball_y
+    assert state.time > 0
+
+    state.step(Inputs(pause=True))
+    assert state.paused
+    paused_time = state.time
+    state.step(Inputs())
+    assert state.time == paused_time
+
+    state.step(Inputs(pause=True))
+    assert not state.paused
+
+
+def test_step_moves_paddle():
+    """Left and right inputs move every paddle."""
+    state = Simulation()
+    state.launch_ball()
+    x_position = state.paddle.position.x
+    state.step(Inputs(left=True))
+    assert state.paddle.position.x < x_position
+
+
+def test_new_level_waits_then_launches():
+    """Clearing the bricks builds a new level and relaunches after the wait."""
+    state = Simulation()
+    state.launch_ball()
+    state.bricks.empty()
+
+    state.step()
+    assert state.level == 2
+    assert state.new_level_wait and not state.launched
+    assert len(state.bricks) > 0
+
+    for _ in range(state.level_wait_time // 20 + 1):
+        state.step()
+    assert state.launched and not state.new_level_wait
+
+
+def test_games_keep_their_own_config():
+    """Speeding up one game leaves the defaults and every other game alone."""
+    first, second = Simulation(seed=1), Simulation(seed=1)
+    first.lives = 100
+    for _ in range(3):
+        first.bricks.empty()
+        for _ in range(first.level_wait_time // 20 + 2):
+            first.step()
+    first.paddle.increase_speed()
+    assert first.config.ball_speed != BallConfig.default_speed
+    assert first.config.paddle_speed != PaddleConfig.speed.x
+    assert second.config == GameConfig()
+    assert Simulation(seed=1).snapshot() == second.snapshot()
+
+    for _ in range(500):  # games stepped in turn play as if alone
+        first.step(tracking_policy(first))
+        second.step(tracking_policy(second))
+    alone = Simulation(seed=1)
+    for _ in range(500):
+        alone.step(tracking_policy(alone))
+    assert alone.snapshot() == second.snapshot()
+
+
+def test_headless_game_finishes():
+    """The scripted player can run a whole game to game over."""
+    state = Simulation()
+    while not state.game_is_over and state.frames < 200_000:
+        state.step(tracking_policy(state))
+    assert state.game_is_over
+    assert state.lives == 0
+
+
+def test_step_budget():
+    """The core runs at least 100x faster than the 50 FPS game loop."""
+    state = Simulation()
+    start = time.perf_counter()
+    for _ in range(2000):
+        state.step(tracking_policy(state))
+    elapsed = time.perf_counter() - start
+    assert 2000 / elapsed >= 50 * 100
+
+
+def test_bodies_are_shared_with_sprites():
+    """Headless bodies and sprites follow the same rules."""
+    paddle = PaddleBody()
+    ball = BallBody()
+    ball.rect.center = paddle.rect.topleft
+    ball.speed.y = 2.5
+    ball.handle_paddle_collision(paddle)
+    assert ball.speed.y < 0
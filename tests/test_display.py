@@ -0,0 +1,114 @@
+"""
+Test Display
+============
+Test the logical-resolution surface, window scaling and cached backgrounds
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+from dataclasses import astuple
+
+import pygame
+
+from breakout import screen_size
+from breakout.__main__ import Game
+from breakout.core import tracking_policy
+from breakout.display import Display
+from breakout.screens import ScreenManager, Screens
+
+
+def test_integer_scale_fills_the_window():
+    """A window twice the logical size shows every pixel doubled."""
+    display = Display()
+    display.resize((screen_size.width * 2, screen_size.height * 2))
+    assert display.integer_scale
+    assert display.viewport == (0, 0, screen_size.width * 2, screen_size.height * 2)
+
+    display.surface.fill(pygame.Color("black"))
+    display.surface.fill(pygame.Color("red"), (0, 0, 10, 10))
+    display.present()
+    assert display.window.get_at((19, 19))[:3] == (255, 0, 0)
+    assert display.window.get_at((21, 21))[:3] == (0, 0, 0)
+
+    # only the changed rect is scaled and shown
+    display.surface.fill(pygame.Color("blue"))
+    display.present([pygame.Rect(10, 10, 5, 5)])
+    assert display.window.get_at((21, 21))[:3] == (0, 0, 255)
+    assert display.window.get_at((19, 19))[:3] == (255, 0, 0)
+    display.resize(astuple(screen_size))
+
+
+def test_letterbox_keeps_the_shape():
+    """Windows of another shape get bars, and mouse positions map back."""
+    display = Display()
+    display.resize((1000, 1000))
+    assert not display.integer_scale
+    assert display.viewport.height == 1000
+    assert display.viewport.centerx == 500
+    width = round(screen_size.width / screen_size.height * 1000)
+    assert display.viewport.width == width
+
+    display.surface.fill(pygame.Color("white"))
+    display.present()
+    assert display.window.get_at((5, 500))[:3] == (0, 0, 0)  # bar
+    assert display.window.get_at((500, 500))[:3] == (255, 255, 255)
+
+    center = display.to_logical(display.viewport.center)
+    assert abs(center[0] - screen_size.width // 2) <= 1
+    assert abs(center[1] - screen_size.height // 2) <= 1
+    click = pygame.event.Event(
+        pygame.MOUSEBUTTONDOWN, {"pos": display.viewport.topleft, "button": 1}
+    )
+    assert display.map_event(click).pos == (0, 0)
+    display.resize(astuple(screen_size))
+    assert display.map_event(click) is click
+
+
+def test_backgrounds_scale_once_per_size():
+    """The background is scaled on the first draw at a size, then reused."""
+    manager = ScreenManager([], pygame.Surface((50, 60)))
+    surface = pygame.Surface(astuple(screen_size))
+    manager.draw(surface)
+    scaled = manager.backgrounds[astuple(screen_size)]
+    manager.draw(surface)
+    assert manager.backgrounds == {astuple(screen_size): scaled}
+
+    manager.background_image = pygame.Surface((10, 10))
+    assert not manager.backgrounds
+
+
+def test_unchanged_screen_repaints_nothing():
+    """A screen drawn twice with nothing changed reports no changed rects."""
+    Game()
+    surface = pygame.Surface(astuple(screen_size))
+    assert Screens.START.draw(surface) == [surface.get_rect()]
+    assert Screens.START.draw(surface) == []
+
+
+def test_dirty_frames_match_full_redraws():
+    """Repainting only the changed rects leaves the same picture as a full redraw."""
+    game = Game(seed=3)
+    game.switch_screen(Screens.GAME)
+    game.launch()
+    dirty = pygame.Surface(astuple(screen_size))
+    full = pygame.Surface(astuple(screen_size))
+    repainted = []
+    for _ in range(150):
+        game.state.step(tracking_policy(game.state))
+        changed = Screens.GAME.draw(dirty)
+        repainted.append(sum(rect.width * rect.height for rect in changed))
+        ScreenManager.last_drawn = None
+        Screens.GAME.draw(full)
+        assert pygame.image.tobytes(dirty, "RGB") == pygame.image.tobytes(full, "RGB")
+    assert max(repainted[1:]) < screen_size.width * screen_size.height / 4
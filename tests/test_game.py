@@ -17,11 +17,22 @@ Terrence Jackson
 Thomas Nugent
 """
 
+import subprocess
+import sys
+import tracemalloc
+
 import pygame
 
 from breakout import screen_size
 from breakout.__main__ import Game, GameState
-from breakout.screens import ArrowButton, BlinkingMessage, ScreenManager, Screens
+from breakout.screens import (
+    ArrowButton,
+    BlinkingMessage,
+    ElementRegistry,
+    Layer,
+    ScreenManager,
+    Screens,
+)
 
 
 def test_game_initialization():
@@ -33,6 +44,29 @@ def test_game_initialization():
     assert game.state.current_screen == Screens.START
 
 
+def test_game_starts_only_what_it_uses():
+    """The game brings up video and the timer, not every pygame module."""
+    Game()
+    assert pygame.display.get_init()
+    assert not pygame.joystick.get_init()
+    start = pygame.time.get_ticks()
+    pygame.time.wait(5)
+    assert pygame.time.get_ticks() > start
+
+
+def test_package_import_is_light():
+    """Importing the package or the headless core does not import pygame."""
+    code = (
+        "import sys, breakout, breakout.core\n"
+        "breakout.Position(1, 2)\n"
+        "print('pygame' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
 def test_switch_screen():
     """Ensure the game switches screens correctly."""
     game = Game()
@@ -132,6 +166,16 @@ def test_handle_key_events():
     assert game.state.paused
 
 
+def test_exposed_window_is_drawn_again():
+    """Uncovering the window shows the whole frame again on the next present."""
+    game = Game()
+    game.display.present()
+    assert not game.display.stale
+    pygame.event.post(pygame.event.Event(pygame.WINDOWEXPOSED))
+    game.handle_events()
+    assert game.display.stale
+
+
 def test_powerup_spawn_timing():
     """Test that power-ups spawn at random intervals."""
     game_state = GameState(Screens.GAME)
@@ -210,3 +254,109 @@ def test_launch_message_blink_toggle():
     assert (
         lm.visible != original_visibility
     ), "LaunchMessage did not toggle its visibility as expected."
+
+
+def test_events_go_to_the_elements_that_handle_them():
+    """Only elements registered for an event's type are sent it."""
+    manager = ScreenManager([DummyElement(), pygame.sprite.Group()])
+    arrow = ArrowButton("left")
+    manager.add_element(arrow)
+    manager.add_element(BlinkingMessage("Hi"))
+    assert set(manager.handlers) == {pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP}
+
+    click = {"pos": arrow.rect.center, "button": 1}
+    manager.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, click))
+    assert arrow.pressed
+    manager.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0)))
+    manager.remove_element(arrow)
+    manager.handle_event(pygame.event.Event(pygame.MOUSEBUTTONUP, click))
+    assert arrow.pressed, "removed elements get no more events"
+    assert not manager.handlers[pygame.MOUSEBUTTONUP]
+
+    manager.clear_elements()
+    assert not manager.elements and not manager.handlers
+
+
+def test_unhandled_events_never_reach_the_queue():
+    """Mouse motion is blocked, the events the game and its screens handle are not."""
+    game = Game()
+    game.switch_screen(Screens.GAME)
+    assert pygame.event.get_blocked(pygame.MOUSEMOTION)
+    for event_type in (*game.event_types, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        assert not pygame.event.get_blocked(event_type)
+
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1), rel=(1, 1)))
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(1, 1), button=1))
+    assert [event.type for event in pygame.event.get()] == [pygame.MOUSEBUTTONUP]
+
+
+def test_element_registry_layers_and_names():
+    """Elements are drawn by layer then in the order added, and found by name."""
+    registry = ElementRegistry()
+    message, button, bricks, balls = (DummyElement() for _ in range(4))
+    registry.add(message, Layer.MESSAGE)
+    registry.add(button, name="pause")
+    registry.add(bricks, Layer.WORLD)
+    registry.add(balls, Layer.WORLD)
+    assert list(registry) == [bricks, balls, button, message]
+    assert registry["pause"] is button
+
+    assert not registry.add(bricks, Layer.MESSAGE)  # already there, stays put
+    assert len(registry) == 4
+    registry.add(button, name="resume")  # renaming forgets the old name
+    assert registry.names == {"resume": button}
+    registry.add(message, name="resume")  # and the name's old element
+    assert registry.names == {"resume": message}
+    assert button not in registry.name_of
+    registry.add(button, name="pause")
+    registry.remove(bricks)
+    registry.remove(button)
+    assert bricks not in registry and balls in registry
+    assert list(registry) == [balls, message]
+    assert "pause" not in registry.names
+
+
+def test_pause_button_found_by_name():
+    """Pausing and resuming relabel the named pause button in place."""
+    game = Game()
+    game.switch_screen(Screens.GAME)
+    game.launch()
+    pause = Screens.GAME.elements["pause"]
+    game.pause_game()
+    assert pause.text == "RESUME GAME"
+    assert game.state.pause_message in Screens.GAME.elements
+    assert list(Screens.GAME.elements)[-1] is game.state.pause_message  # on top
+    game.resume_game()
+    assert pause.text == "PAUSE GAME"
+    assert game.state.pause_message not in Screens.GAME.elements
+
+
+def test_levels_do_not_leak_elements():
+    """A hundred levels and a new game leave the game screen as it started."""
+    game = Game(seed=4)
+    game.switch_screen(Screens.GAME)
+    unlaunched = Screens.element_counts()["GAME"]
+    game.launch()
+    state = game.state
+    state.level_wait_time = 0  # relaunch as soon as a level is cleared
+    elements = Screens.element_counts()["GAME"]
+
+    tracemalloc.start()
+    try:
+        for level in range(100):
+            state.bricks.empty()
+            state.update()
+            assert Screens.GAME.elements["bricks"] is state.bricks
+            assert Screens.element_counts()["GAME"] == elements
+            if level == 10:
+                baseline = tracemalloc.get_traced_memory()[0]
+        grown = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    assert state.level > 100
+    assert grown < 256 * 1024
+
+    game.start_new_game()
+    assert Screens.element_counts()["GAME"] == unlaunched
+    assert game.state.bricks in Screens.GAME.elements
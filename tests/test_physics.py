@@ -0,0 +1,231 @@
+"""
+Test Physics
+============
+Test the batched ball store against the per-ball rules
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import math
+import random
+
+from breakout import Position, Speed, screen_size
+from breakout.core import (
+    BallBody,
+    BallConfig,
+    PaddleBody,
+    Simulation,
+    tracking_policy,
+)
+from breakout.physics import BallStore, Box, BrickField, sweep_circle_box
+
+
+def test_store_views_write_through():
+    """Attached balls read and write their state in the store arrays."""
+    store = BallStore()
+    ball = BallBody(position=Position(100, 200), speed=Speed(1, -2))
+    slot = store.add(ball)
+
+    ball.position.x = 50
+    ball.speed = Speed(3, 4)
+    assert store.x[slot] == 50
+    assert (store.speed_x[slot], store.speed_y[slot]) == (3, 4)
+    assert ball.position == Position(50, 200)
+
+    store.remove(ball)
+    assert ball.store is None and ball.position == Position(50, 200)
+    assert len(store) == 0
+
+
+def test_store_grows_without_breaking_views():
+    """Growing the store keeps earlier balls pointing at live data."""
+    store = BallStore(capacity=2)
+    balls = [BallBody(position=Position(i, i), speed=Speed(1, 1)) for i in range(5)]
+    for ball in balls:
+        store.add(ball)
+    store.integrate()
+    assert [ball.position.x for ball in balls] == [1, 2, 3, 4, 5]
+    assert balls[0].rect.x == 1
+
+
+def test_batched_walls_match_per_ball_rules():
+    """Wall bounces in the store agree with BallBody.handle_wall_collisions."""
+    state = Simulation()
+    loose = BallBody(position=Position(0, 0), speed=Speed(-2.5, -3))
+    stored = state.create_ball(position=Position(0, 0), speed=Speed(-2.5, -3))
+
+    loose.handle_wall_collisions()
+    state.ball_store.bounce_walls(screen_size.width)
+    assert stored.speed == loose.speed
+    assert stored.position == loose.position
+
+
+def test_batched_paddle_matches_per_ball_rules():
+    """Paddle reflection in the store agrees with BallBody.handle_paddle_collision."""
+    state = Simulation()
+    paddle = PaddleBody()
+    loose = BallBody(speed=Speed(0, 3))
+    loose.rect.center = (paddle.rect.left + 20, paddle.rect.top)
+    stored = state.create_ball(speed=Speed(0, 3))
+    stored.rect.center = loose.rect.center
+
+    loose.handle_paddle_collision(paddle)
+    state.ball_store.reflect_paddle(
+        paddle, state.config.ball_speed, BallConfig.max_speed
+    )
+    assert stored.speed.y < 0
+    assert stored.speed == loose.speed
+    assert stored.position.y == loose.position.y
+
+
+def test_lost_extra_ball_keeps_life():
+    """Losing one of several balls only removes that ball."""
+    state = Simulation()
+    state.launch_ball()
+    extra = state.create_ball(position=Position(250, screen_size.height + 10))
+
+    state.move_balls()
+    assert not extra.alive() and extra.store is None
+    assert state.lives == 3
+    assert len(state.ball_store) == 1
+
+
+def test_lone_ball_moves_the_same_without_the_batch(monkeypatch):
+    """A single ball moved on its own plays out as it would in the batch."""
+    results = []
+    for limit in (0, Simulation.per_ball_limit):
+        monkeypatch.setattr(Simulation, "per_ball_limit", limit)
+        state = Simulation(seed=5)
+        for _ in range(3000):
+            state.step(tracking_policy(state))
+        results.append(state.snapshot())
+    assert results[0] == results[1]
+
+
+def test_brick_field_query_matches_linear_scan():
+    """Field queries find the same bricks, in order, as checking every brick."""
+    state = Simulation(seed=2)
+    bricks = state.bricks.sprites()
+    region = state.brick_region
+    for x in range(region.left - 20, region.right + 20, 7):
+        for y in range(region.top - 20, region.bottom + 20, 5):
+            rect = Box(x, y, 20, 20)
+            expected = [brick for brick in bricks if rect.colliderect(brick.rect)]
+            assert state.bricks.query(rect) == expected
+
+
+def test_brick_field_hits_and_neighbours():
+    """Hits crack or remove bricks and keep the count and neighbours current."""
+    field = BrickField(3, 3, left=0, top=0, size=(50, 20), gap=10)
+    for row in range(3):
+        for col in range(3):
+            field.place(row, col, "red", 3, unbreakable=(row, col) == (0, 0))
+    assert len(field) == 9
+    assert len(field.neighbours(1, 1)) == 4
+    assert len(field.neighbours(1, 1, diagonal=True)) == 8
+
+    assert field.hit(0, 0) == 0 and len(field) == 9  # cracked
+    assert field.hit(0, 0) == 3 and len(field) == 8
+    assert field.hit(0, 0) == 0  # already gone
+    brick = field.query(Box(60, 0, 5, 5))[0]
+    assert brick.hit() == 3 and brick not in field
+    assert field.neighbours(0, 2) == [field.query(Box(120, 30, 5, 5))[0]]
+    assert field.live_region() == Box(0, 0, 170, 80)
+
+
+def test_brick_field_memory():
+    """A large custom layout takes a few bytes per brick."""
+    field = BrickField(100, 100, left=0, top=0, size=(51, 25), gap=10)
+    for row in range(100):
+        for col in range(100):
+            field.place(row, col, "green", 1)
+    assert len(field) == 10_000
+    assert field.nbytes <= 4 * 10_000
+
+
+def test_sweep_circle_box():
+    """Swept circles find the face or rounded corner they touch first."""
+    box = Box(100, 100, 50, 20)
+    assert sweep_circle_box(125, 50, 0, 100, 10, box) == (0.4, 0.0, -1.0)
+    assert sweep_circle_box(125, 50, 0, -100, 10, box) is None  # moving away
+    assert sweep_circle_box(125, 50, 0, 30, 10, box) is None  # stops short
+    # passes the corner's rounded edge without touching it
+    assert sweep_circle_box(82, 102, 20, -20, 10, box) is None
+    t, nx, ny = sweep_circle_box(92, 50, 0, 100, 10, box)
+    assert abs(t - 0.44) < 1e-9 and abs(nx + 0.8) < 1e-9 and abs(ny + 0.6) < 1e-9
+    # starts in the grown box's square corner, outside the rounded one
+    t, nx, ny = sweep_circle_box(158, 127, -8, -8, 10, box)
+    assert 0 < t < 1 and nx > 0 and ny > 0
+    assert sweep_circle_box(152, 122, -8, -8, 10, box) is None  # already overlaps
+
+
+def overlap(ball, bricks) -> float:
+    """How far a ball reaches into the nearest brick, 0 if it touches none."""
+    radius = BallConfig.radius
+    x = ball.position.x + radius
+    y = ball.position.y + radius
+    deepest = 0.0
+    for brick in bricks:
+        rect = brick.rect
+        nearest_x = min(max(x, rect.left), rect.right)
+        nearest_y = min(max(y, rect.top), rect.bottom)
+        if (nearest_x, nearest_y) == (x, y):
+            return radius  # the center is inside the brick
+        deepest = max(deepest, radius - math.hypot(x - nearest_x, y - nearest_y))
+    return deepest
+
+
+def test_fast_balls_do_not_tunnel(monkeypatch):
+    """Balls moving 50+ pixels a step never pass through bricks, the paddle or walls."""
+    rng = random.Random(0)
+    state = Simulation(seed=4)
+    ball = state.ball
+    paddle = state.paddle
+    radius = BallConfig.radius
+    # a full field of bricks that never break, the gaps are narrower than the ball
+    state.bricks = BrickField(6, 8, left=11, top=50, size=(51, 25), gap=10)
+    for row in range(6):
+        for col in range(8):
+            state.bricks.place(row, col, "green", 1)
+    monkeypatch.setattr(state.bricks, "hit", lambda row, col: 0)
+    state.brick_region = state.bricks.live_region()
+    bricks = state.bricks.sprites()
+    for _ in range(200):
+        ball.position = Position(rng.uniform(0, screen_size.width - 2 * radius), 420)
+        angle = rng.uniform(0.1, 0.9) * math.pi
+        speed = rng.uniform(50, 120)
+        ball.speed = Speed(speed * math.cos(angle), -speed * math.sin(angle))
+        bounced = False
+        for _ in range(20):  # bouncing on between the bricks and the walls
+            state.move_balls()
+            assert overlap(ball, bricks) < 1e-6
+            assert 0 <= ball.position.x <= screen_size.width - 2 * radius
+            assert ball.position.y >= 0
+            bounced = bounced or ball.speed.y > 0
+            if ball.speed.y > 0 and ball.position.y > 300:
+                break
+        assert bounced
+
+    state.bricks = BrickField(1, 1, left=0, top=0, size=(51, 25), gap=10)
+    state.brick_region = state.bricks.live_region()
+    for _ in range(200):
+        landing = rng.uniform(paddle.rect.left, paddle.rect.right)
+        ball.position = Position(landing - radius, rng.uniform(100, 300))
+        ball.speed = Speed(0, rng.uniform(50, 90))
+        for _ in range(10):
+            state.move_balls()
+            if ball.speed.y < 0:
+                break
+        assert ball.speed.y < 0 and state.lives == 3
+        assert ball.position.y + 2 * radius <= paddle.rect.top + 1e-6
@@ -0,0 +1,87 @@
+"""
+Test Pool
+=========
+Test killed balls and powerups go back to their pools and come out again
+as good as new, and that levels refill one brick field
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+from breakout import Position, Speed
+from breakout.core import (
+    BallBody,
+    BallConfig,
+    Group,
+    PowerDownBody,
+    Simulation,
+    tracking_policy,
+)
+from breakout.pool import Pool, PoolStats
+
+
+def test_acquire_reuses_released():
+    """A killed entity is handed out again, reset, and counted once."""
+    pool = Pool(BallBody, capacity=1)
+    group = Group()
+    first = pool.acquire(group, position=Position(10, 10), speed=Speed(1, 2))
+    first.position += Speed(5, 5)
+    first.kill()
+    first.kill()  # a second kill does not release it twice
+    assert pool.stats() == PoolStats(in_use=0, free=1, created=1, reused=0)
+
+    second = pool.acquire(group, position=Position(30, 40))
+    assert second is first and second.alive() and not second.released
+    assert second.position == Position(30, 40)
+    assert second.speed == Speed(0, -BallConfig.default_speed)
+    assert pool.stats() == PoolStats(in_use=1, free=0, created=1, reused=1)
+
+    extra = pool.acquire(group)
+    second.kill()
+    extra.kill()  # past capacity, left to the garbage collector
+    assert pool.stats() == PoolStats(in_use=0, free=1, created=2, reused=1)
+    assert pool.stats().reuse_rate == 1 / 3
+
+
+def test_bombs_come_back_unexploded():
+    """A reused powerdown keeps nothing from the one that exploded."""
+    pool = Pool(PowerDownBody)
+    bomb = pool.acquire(Group())
+    bomb.explode()
+    bomb.kill()
+    assert pool.acquire(Group()) is bomb
+    assert not bomb.exploded and bomb.speed.y > 0
+
+
+def test_pooling_does_not_change_the_game(monkeypatch):
+    """A seeded game plays out the same with and without pooling."""
+    results = []
+    for capacity in (0, 16):
+        monkeypatch.setattr(Simulation, "pool_capacity", capacity)
+        state = Simulation(seed=12)
+        state.lives = 100  # outlast the bombs
+        field, cells = state.bricks, state.bricks.alive
+        for frame in range(6000):
+            if frame % 2000 == 1000:
+                state.bricks.empty()  # on to the next level
+            state.step(tracking_policy(state))
+            if not state.powerup_group:
+                state.next_powerup_time = state.time  # as many powerups as can fall
+        results.append(state.snapshot())
+        assert state.level >= 4 and not state.game_is_over
+        assert state.bricks is field and state.bricks.alive is cells
+    assert results[0] == results[1]
+
+    stats = state.pool_stats()
+    assert sum(kind.reused for kind in stats.values()) > 0
+    assert all(kind.in_use >= 0 and kind.free <= 16 for kind in stats.values())
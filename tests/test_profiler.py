@@ -0,0 +1,98 @@
+"""
+Test Profiler
+=============
+Test the frame timer's percentiles, that timing is off until asked for,
+and that the game loop stays inside its frame budget
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import pygame
+
+from breakout.__main__ import Game
+from breakout.core import FRAME_TIME, tracking_policy
+from breakout.profiler import NOT_TIMED, FrameTimer, PhaseStats, frame_timer
+from breakout.screens import Screens
+
+
+def test_percentiles():
+    """Each frame's phase time is kept, percentiles are taken over the frames."""
+    timer = FrameTimer(frames=100)
+    timer.enabled = True
+    timer.end_frame()  # the first frame starts here
+    for milliseconds in range(1, 151):
+        timer.add("draw", milliseconds / 2)
+        timer.add("draw", milliseconds / 2)  # phases add up within a frame
+        timer.end_frame()
+    # only the last 100 frames are kept
+    assert timer.stats("draw") == PhaseStats(101, 146, 150, 150, 100)
+    assert timer.stats("never") == PhaseStats(0.0, 0.0, 0.0, 0.0, 0)
+    assert set(timer.report()) == {"frame", "draw"}
+
+
+def test_timing_is_off_until_enabled():
+    """While off, phases are not timed and frames are not kept."""
+    timer = FrameTimer()
+    assert timer.phase("draw") is NOT_TIMED
+    timer.end_frame()
+    timer.end_frame()
+    assert not timer.samples("frame")
+
+    timer.enabled = True
+    with timer.phase("draw"):
+        pass
+    timer.end_frame()
+    with timer.phase("draw"):
+        pass
+    timer.end_frame()
+    assert len(timer.samples("draw")) == 1
+    assert timer.stats("frame").max >= timer.stats("draw").max
+
+
+def test_frame_budget():
+    """A game with the paddle in play draws its frames well within 20 ms."""
+    game = Game(seed=5)
+    game.max_fps = 0
+    game.read_inputs = lambda: tracking_policy(game.state)
+    game.switch_screen(Screens.GAME)
+    game.launch()
+    frame_timer.enabled = True
+    frame_timer.reset()
+    try:
+        for _ in range(200):
+            game.run_frame(FRAME_TIME)
+    finally:
+        frame_timer.enabled = False
+    report = frame_timer.report()
+    assert {"events", "update", "state", "draw", "present", "tick"} <= set(report)
+    assert report["frame"].frames == 199
+    assert report["frame"].p95 < FRAME_TIME
+
+
+def test_overlay_toggles_with_f3():
+    """F3 shows the overlay and starts timing, pressing it again stops both."""
+    game = Game()
+    game.max_fps = 0
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3))
+    game.run_frame(FRAME_TIME)
+    assert game.overlay.visible and frame_timer.enabled
+    for _ in range(5):
+        game.run_frame(FRAME_TIME)
+    assert frame_timer.stats("frame").frames == 5
+    assert game.overlay.draw(game.display.surface) == [game.overlay.rect]
+
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3))
+    game.run_frame(FRAME_TIME)
+    assert not game.overlay.visible and not frame_timer.enabled
+    assert game.overlay.draw(game.display.surface) == []
@@ -0,0 +1,129 @@
+"""
+Test Replay
+===========
+Test recording games to replay files and playing them back
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import random
+
+import pygame
+
+from breakout.__main__ import Game
+from breakout.core import Inputs, Simulation, tracking_policy
+from breakout.replay import Recorder, Replay, read_varint, write_varint
+from breakout.screens import Screens
+from breakout.timestep import FRAME_TIME, FixedTimestep
+
+# pylint: disable=no-member
+
+
+def test_varints_round_trip():
+    """Varints encode small numbers in one byte and read back exactly."""
+    out = bytearray()
+    for value in (0, 127, 128, 300, 2**40):
+        write_varint(out, value)
+    assert out[0] == 0 and out[1] == 127 and len(out) == 1 + 1 + 2 + 2 + 6
+    offset, values = 0, []
+    while offset < len(out):
+        value, offset = read_varint(out, offset)
+        values.append(value)
+    assert values == [0, 127, 128, 300, 2**40]
+
+
+def test_inputs_are_run_length_encoded():
+    """Runs of identical steps share one entry and survive a save and load."""
+    replay = Replay(seed=-5)
+    for inputs in [Inputs(left=True)] * 300 + [Inputs(launch=True)] + [Inputs()] * 50:
+        replay.append(inputs)
+    assert len(replay.runs) == 3
+    loaded = Replay.from_bytes(replay.to_bytes())
+    assert loaded.seed == -5 and loaded.steps == 351
+    assert list(loaded.inputs(299))[:3] == [
+        Inputs(left=True),
+        Inputs(launch=True),
+        Inputs(),
+    ]
+
+
+def test_seek_matches_playing_from_start():
+    """Seeking through a keyframe gives the same game as playing every step."""
+    state = Simulation(seed=3)
+    recorder = Recorder(state)
+    recorder.keyframe_interval = 400
+    for _ in range(1500):
+        recorder.step(state, tracking_policy(state), FRAME_TIME)
+    replay = Replay.from_bytes(recorder.replay.to_bytes())
+    assert [step for step, _ in replay.keyframes] == [0, 400, 800, 1200]
+
+    seeked = replay.play(1300)
+    replay.keyframes = replay.keyframes[:1]
+    played = replay.play(1300)
+    assert seeked.snapshot() == played.snapshot()
+    assert replay.play().snapshot() == state.snapshot()
+
+
+def test_replay_keeps_its_tick_rate():
+    """A game recorded at another tick rate replays exactly at that rate."""
+    state = Simulation(seed=8)
+    timestep = FixedTimestep(tick_rate=120)
+    recorder = Recorder(state, timestep.tick_rate)
+    for _ in range(2000):
+        recorder.step(state, tracking_policy(state), timestep.dt)
+    replay = Replay.from_bytes(recorder.replay.to_bytes())
+    assert replay.tick_rate == 120 and replay.dt == timestep.dt
+    assert replay.play().snapshot() == state.snapshot()
+
+
+def test_recorded_game_replays_headless():
+    """A game played in the window, with launches and pauses, replays exactly."""
+    picks = random.Random(1)
+    game = Game(seed=77)
+    game.switch_screen(Screens.GAME)
+
+    def steer():
+        inputs = tracking_policy(game.state)
+        return Inputs(left=inputs.left, right=inputs.right)
+
+    game.read_inputs = steer
+    for _ in range(3000):
+        if not game.state.launched and picks.random() < 0.05:
+            game.launch()
+        if game.state.launched and picks.random() < 0.005:
+            game.pause_game()
+        if game.state.paused and picks.random() < 0.05:
+            game.resume_game()
+        game.update_game(picks.choice([4, 7, 16, 33]))
+
+    replay = Replay.from_bytes(game.recorder.replay.to_bytes())
+    assert any(bits & 8 for bits, _ in replay.runs)  # pauses were recorded
+    replayed, played = replay.play().snapshot(), game.state.snapshot()
+    for snapshot in (replayed, played):
+        del snapshot["rng"]["cosmetics"]  # the window draws extra effects
+    assert replayed == played
+
+
+def test_play_replay_in_window():
+    """Watching a replay starts from the requested step."""
+    state = Simulation(seed=9)
+    recorder = Recorder(state)
+    for _ in range(300):
+        recorder.step(state, tracking_policy(state), FRAME_TIME)
+
+    game = Game()
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+    game.play_replay(recorder.replay, 200)
+    assert game.state.rng.seed == 9
+    assert game.state.frames == recorder.replay.play(200).frames
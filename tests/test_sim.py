@@ -0,0 +1,59 @@
+"""
+Test Sim
+========
+Test the parallel batch runner for headless games
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import csv
+import json
+
+from breakout import sim
+
+
+def test_run_game_summary():
+    """A single game reports its score, level, frames and wall-clock time."""
+    result = sim.run_game(3, seed=7, policy="launch_only", max_frames=200_000)
+    assert set(result) == set(sim.result_fields)
+    assert result["game"] == 3 and result["seed"] == 7
+    assert result["game_over"] and result["lives"] == 0
+    assert result["frames"] > 0 and result["wall_clock"] > 0
+
+
+def test_run_game_frame_cap():
+    """Games that have not ended stop at the frame cap."""
+    result = sim.run_game(0, seed=1, policy="tracking", max_frames=100)
+    assert result["frames"] == 100
+    assert not result["game_over"]
+
+
+def test_main_streams_jsonl(tmp_path):
+    """The command line runner writes one JSON line per game."""
+    output = tmp_path / "results.jsonl"
+    sim.main(["-n", "3", "-j", "2", "--max-frames", "300", "-o", str(output)])
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert sorted(row["game"] for row in rows) == [0, 1, 2]
+    assert all(row["frames"] == 300 for row in rows)
+
+
+def test_main_writes_csv(tmp_path):
+    """A .csv output path switches the runner to CSV rows."""
+    output = tmp_path / "results.csv"
+    sim.main(
+        ["-n", "2", "-j", "1", "--seed", "10", "--max-frames", "100", "-o", str(output)]
+    )
+    with open(output, newline="", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert sorted(int(row["seed"]) for row in rows) == [10, 11]
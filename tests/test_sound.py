@@ -0,0 +1,54 @@
+"""
+Test Sound
+==========
+Test streamed background music and background-loaded sound effects
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import pygame
+
+from breakout.sound import MUSIC_END, SoundManager
+
+
+def test_effects_decode_in_the_background():
+    """Effects decode on another thread, and shared files decode once."""
+    SoundManager.load_effects().join(timeout=10)
+    assert SoundManager.load_effects() is SoundManager.effects_loader
+    assert set(SoundManager.effects) == set(SoundManager.effect_files)
+    assert SoundManager.effects["wall"] is SoundManager.effects["paddle"]
+    SoundManager.play("brick")  # plays without waiting on the disk
+
+
+def test_music_streams_and_advances():
+    """Music plays from the tracks found, and each track end queues the next."""
+    sound_on = SoundManager.sound_on
+    SoundManager.sound_on = True
+    tracks = SoundManager.music_tracks()
+    assert tracks
+    assert all(track.endswith(".mp3") for track in tracks)
+
+    SoundManager.play_background_music()
+    assert SoundManager.music_started
+    assert pygame.mixer.music.get_endevent() == MUSIC_END
+
+    current = SoundManager.current_music
+    for step in range(1, len(tracks) * 2 + 1):
+        SoundManager.handle_event(pygame.event.Event(MUSIC_END))
+        assert SoundManager.current_music == (current + step) % len(tracks)
+    SoundManager.handle_event(pygame.event.Event(pygame.USEREVENT))
+    assert SoundManager.current_music == current
+
+    SoundManager.stop_background_music()
+    SoundManager.sound_on = sound_on
@@ -0,0 +1,117 @@
+"""
+Test Text
+=========
+Test the bundled fonts, rendered text cache and glyph atlases
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+from dataclasses import astuple
+
+import pygame
+
+from breakout import screen_size, text
+from breakout.__main__ import Game
+from breakout.score import HUD_LABELS
+from breakout.screens import ScreenManager, Screens
+from breakout.text import (
+    GlyphAtlas,
+    SharedFont,
+    TextCache,
+    get_font,
+    surface_bytes,
+)
+
+
+def test_cache_hits_and_misses():
+    """The same text is rendered once, any change to the key renders again."""
+    font = get_font(14)
+    cache = TextCache()
+    first = cache.render(font, "Lives: 2", pygame.Color("black"))
+    assert cache.render(font, "Lives: 2", (0, 0, 0)) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.render(font, "Lives: 1", pygame.Color("black"))
+    cache.render(font, "Lives: 2", pygame.Color("white"))
+    cache.render(font, "Lives: 2", pygame.Color("black"), antialias=False)
+    assert (cache.hits, cache.misses) == (1, 4)
+    assert len(cache) == 4
+
+
+def test_cache_evicts_least_recently_used():
+    """Going over the byte cap drops the surface used longest ago."""
+    font = get_font(14)
+    size = surface_bytes(font.render("1000", True, pygame.Color("black")))
+    cache = TextCache(max_bytes=size * 2)
+    cache.render(font, "1000", pygame.Color("black"))
+    cache.render(font, "2000", pygame.Color("black"))
+    cache.render(font, "1000", pygame.Color("black"))  # now the most recent
+    cache.render(font, "3000", pygame.Color("black"))
+    assert cache.evictions == 1
+    assert cache.nbytes <= cache.max_bytes
+    keys = [key[1] for key in cache.surfaces]
+    assert keys == ["1000", "3000"]
+
+
+def test_identical_frames_render_no_text():
+    """Redrawing screens that did not change renders no new text."""
+    game = Game(seed=2)
+    game.launch()
+    surface = pygame.Surface(astuple(screen_size))
+    for screen in (Screens.START, Screens.GAME, Screens.END, Screens.HELP):
+        game.switch_screen(screen)
+        ScreenManager.last_drawn = None
+        screen.draw(surface)
+        misses, hits = text.cache.misses, text.cache.hits
+        for _ in range(3):
+            ScreenManager.last_drawn = None  # force a full repaint
+            screen.draw(surface)
+        assert text.cache.misses == misses
+        assert text.cache.hits > hits
+
+
+def test_fonts_are_shared_by_size():
+    """Each size and weight of the bundled font is opened once."""
+
+    class Element:  # pylint: disable=too-few-public-methods
+        """Screen element with a shared font"""
+
+        _font = SharedFont(14, bold=True)
+
+    assert Element._font is get_font(14, bold=True)
+    assert Element()._font is Element._font
+    assert get_font(14) is not get_font(14, bold=True)
+    advances = {metrics[4] for metrics in get_font(14).metrics("0iW:")}
+    assert len(advances) == 1  # monospace
+
+
+def test_atlas_matches_rendered_text():
+    """Text composed from the atlas looks the same as rendering it."""
+    font = get_font(14, bold=True)
+    atlas = GlyphAtlas(font, pygame.Color("white"), words=HUD_LABELS)
+    misses = text.cache.misses
+    for line in ("Current Score: 1,250", "Lives: 3", "50?"):
+        expected = pygame.Surface(font.size(line))
+        expected.blit(font.render(line, True, pygame.Color("white")), (0, 0))
+        composed = pygame.Surface(font.size(line))
+        assert atlas.draw(composed, line, (0, 0)) == composed.get_rect()
+        assert pygame.image.tobytes(composed, "RGB") == pygame.image.tobytes(
+            expected, "RGB"
+        )
+
+    assert text.cache.misses == misses
+
+    # characters missing from the atlas are rendered through the text cache
+    atlas.draw(pygame.Surface((100, 20)), "Lives: W", (0, 0))
+    assert text.cache.misses == misses + 1
@@ -0,0 +1,104 @@
+"""
+Test Timestep
+=============
+Test the fixed-timestep accumulator and render interpolation
+
+Class
+-----
+Capstone in Computer Science
+UMGC CMSC 495
+Professor Munoz
+
+Team Charlie
+------------
+Daniel Coreas
+Aimi Hanson
+Terrence Jackson
+Thomas Nugent
+"""
+
+import copy
+from itertools import cycle
+
+from breakout import Speed
+from breakout.core import Inputs, PaddleConfig, Simulation, tracking_policy
+from breakout.timestep import FRAME_TIME, TICK_RATE, FixedTimestep, Interpolator
+
+
+def test_accumulator_counts_whole_steps():
+    """Frame times add up to whole steps with the remainder carried over."""
+    timestep = FixedTimestep()
+    assert timestep.advance(15) == 0
+    assert timestep.alpha == 0.75
+    assert timestep.advance(15) == 1
+    assert timestep.advance(100) == 5
+    assert timestep.advance(10_000) == 13  # long stalls are capped
+
+
+def test_tick_rate_is_configurable():
+    """Any tick rate gives exactly tick_rate steps per second."""
+    assert FixedTimestep().dt == FRAME_TIME
+    for tick_rate in (30, 60, 120):
+        timestep = FixedTimestep(tick_rate)
+        steps = sum(timestep.advance(elapsed) for elapsed in [16, 17] * 30 + [10])
+        assert steps == tick_rate
+
+
+def test_tick_rate_does_not_change_game_speed():
+    """Moments of play move the ball and paddle as far at any tick rate."""
+    games = []
+    for tick_rate in (25, TICK_RATE, 100):
+        state = Simulation()
+        state.ball.speed = Speed(2, -4)
+        state.launch_ball()
+        timestep = FixedTimestep(tick_rate)
+        for _ in range(sum(timestep.advance(200) for _ in range(2))):
+            state.step(Inputs(right=True), timestep.dt)
+        games.append(state)
+    for state in games:
+        assert state.clock == games[1].clock == 400
+        assert abs(state.ball.position.x - games[1].ball.position.x) < 1e-9
+        assert abs(state.ball.position.y - games[1].ball.position.y) < 1e-9
+        assert state.paddle.position == games[1].paddle.position
+    assert games[1].paddle.position.x == PaddleConfig.initial_position.x + 100
+
+
+def play(start: Simulation, frame_times: list[int], duration: int) -> Simulation:
+    """Play a copy of a game for 'duration' ms drawn at the given frame times."""
+    state = copy.deepcopy(start)
+    timestep = FixedTimestep()
+    elapsed = 0
+    for frame_time in cycle(frame_times):
+        if elapsed >= duration:
+            return state
+        elapsed += frame_time
+        for _ in range(timestep.advance(frame_time)):
+            state.step(tracking_policy(state), timestep.dt)
+    return state
+
+
+def test_same_game_at_any_frame_rate():
+    """A game drawn at 30 FPS plays exactly like one drawn at 240 FPS."""
+    start = Simulation(seed=12)
+    slow = play(start, [33, 33, 34], 8000)
+    fast = play(start, [4, 4, 4, 4, 4, 5], 8000)
+    assert slow.frames == fast.frames == 400
+    assert slow.score == fast.score
+    assert slow.ball.position == fast.ball.position
+    assert slow.paddle.rect == fast.paddle.rect
+
+
+def test_interpolator_blends_and_restores():
+    """Pieces are drawn between steps and put back after drawing."""
+    state = Simulation()
+    interpolator = Interpolator()
+    state.ball.speed = Speed(10, 0)
+    state.launch_ball()
+    state.step()
+    interpolator.record(state)
+    state.step()
+    x, y = state.ball.rect.topleft
+
+    with interpolator.blend(state, 0.5):
+        assert state.ball.rect.topleft == (x - 5, y)
+    assert state.ball.rect.topleft == (x, y)